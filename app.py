@@ -3,6 +3,8 @@ from loguru import logger
 
 from llmops_datacollection.application.crawlers.linkedin import LinkedInCrawler 
 from llmops_datacollection.domain.documents import UserDocument
+from llmops_datacollection.domain.exceptions import DatabaseError
+from llmops_datacollection.domain.writer import bulk_writer
 
 @click.group()
 def cli():
@@ -44,6 +46,8 @@ def crawl_linkedin(user_name: str, url: str):
         # Crawl profile URL
         logger.info(f"Crawling LinkedIn profile: {url}")
         crawler.extract(url, user=user)
+        if failures := bulk_writer.flush():
+            raise DatabaseError(f"Failed to write {len(failures)} post(s)")
         
         logger.info("LinkedIn crawling completed successfully")
         
@@ -1,23 +1,41 @@
-import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from functools import lru_cache
 from tempfile import mkdtemp
 
-import chromedriver_autoinstaller
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
 from llmops_datacollection.domain.base import NoSQLBaseDocument
+from llmops_datacollection.settings import BlockingProfile
 
-# Install chromedriver if needed
-chromedriver_autoinstaller.install()
+from .blocking import apply_blocking, apply_blocking_options, get_blocking_profile
+from .driver_pool import driver_pool
+from .waits import wait_for_page_settled
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve, downloading if needed, the chromedriver binary once per process.
+
+    Called when the first driver is launched, so importing crawlers never
+    touches the network.
+    """
+    return ChromeDriverManager().install()
 
 class BaseCrawler(ABC):
-    """Base crawler class."""
+    """Base crawler class.
+
+    Crawlers keep the futures the bulk writer returns in `pending_writes`,
+    so the dispatcher can tie failed writes back to the crawled link.
+    """
     
     model: type[NoSQLBaseDocument]
 
+    def __init__(self) -> None:
+        self.pending_writes: list[Future] = []
+
     @abstractmethod
     def extract(self, link: str, **kwargs) -> None:
         """Extract data from the given link."""
@@ -54,12 +72,39 @@ class BaseCrawler(ABC):
 
 
 class BaseSeleniumCrawler(BaseCrawler, ABC):
+    # Keep cookies when the driver goes back to the pool (e.g. a logged-in session)
+    keep_session: bool = False
+
     def __init__(self, scroll_limit: int = 5) -> None:
+        super().__init__()
         self.scroll_limit = scroll_limit
-        self.driver = self._setup_driver()
+        self._driver = None
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """WebDriver, checked out from the pool on first use."""
+        if self._driver is None:
+            self._driver = self._setup_driver()
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver: webdriver.Chrome | None) -> None:
+        self._driver = driver
+
+    def set_extra_driver_options(self, options: Options) -> None:
+        """Add crawler-specific Chrome options."""
+        pass
+
+    def blocking_profile(self) -> BlockingProfile:
+        """Resources this crawler's browser skips (see settings.BROWSER_CRAWLER_PROFILES)."""
+        return get_blocking_profile(type(self).__name__)
 
     def _setup_driver(self) -> webdriver.Chrome:
-        """Set up Chrome WebDriver with WebDriver Manager."""
+        """Check out a warm Chrome WebDriver from the shared pool."""
+        return driver_pool.checkout(type(self).__name__, self._create_driver)
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Launch a new Chrome WebDriver with WebDriver Manager."""
         options = webdriver.ChromeOptions()
         
         # Configure Chrome options
@@ -76,34 +121,46 @@ class BaseSeleniumCrawler(BaseCrawler, ABC):
         options.add_argument(f"--user-data-dir={mkdtemp()}")
         options.add_argument(f"--data-path={mkdtemp()}")
         options.add_argument(f"--disk-cache-dir={mkdtemp()}")
+
+        profile = self.blocking_profile()
+        apply_blocking_options(options, profile)
+        self.set_extra_driver_options(options)
         
         # Use WebDriver Manager
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         
-        return webdriver.Chrome(service=service, options=options)
+        driver = webdriver.Chrome(service=service, options=options)
+        apply_blocking(driver, profile)
+        return driver
+
+    def release_driver(self) -> None:
+        """Return the WebDriver to the shared pool."""
+        if self._driver is not None:
+            driver_pool.checkin(self._driver, reset_cookies=not self.keep_session)
+            self._driver = None
+
     def scroll_page(self) -> None:
-        """Scroll through the page."""
+        """Scroll through the page, waiting only as long as new content takes to load."""
         current_scroll = 0
-        last_height = self.driver.execute_script(
-            "return document.body.scrollHeight"
-        )
+        last_height = self._page_height()
         
         while True:
             # Scroll down
             self.driver.execute_script(
                 "window.scrollTo(0, document.body.scrollHeight);"
             )
-            time.sleep(2)
-            
-            # Calculate new scroll height
-            new_height = self.driver.execute_script(
-                "return document.body.scrollHeight"
-            )
-            
+
+            # Wait until newly loaded content has settled instead of a fixed delay
+            wait_for_page_settled(self.driver, name="scroll")
+            new_height = self._page_height()
+
             # Check if we've reached the bottom or scroll limit
-            if (new_height == last_height or 
+            if (new_height <= last_height or
                 (self.scroll_limit and current_scroll >= self.scroll_limit)):
                 break
                 
             last_height = new_height
-            current_scroll += 1
\ No newline at end of file
+            current_scroll += 1
+
+    def _page_height(self) -> int:
+        return self.driver.execute_script("return document.body.scrollHeight")
\ No newline at end of file
@@ -0,0 +1,75 @@
+from loguru import logger
+from pydantic import BaseModel
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from llmops_datacollection.domain.exceptions import ImproperlyConfigured
+from llmops_datacollection.settings import BlockingProfile, settings
+
+# Load time and bytes transferred for the current page. Cross-origin
+# resources without a Timing-Allow-Origin header report 0 bytes.
+PAGE_METRICS_SCRIPT = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+let transferBytes = navigation ? navigation.transferSize : 0;
+for (const resource of resources) { transferBytes += resource.transferSize; }
+return {
+    load_ms: navigation && navigation.loadEventEnd ? navigation.loadEventEnd - navigation.startTime : null,
+    transfer_bytes: transferBytes,
+    resources: resources.length,
+};
+"""
+
+
+class PageMetrics(BaseModel):
+    """Cost of loading the current page."""
+
+    load_ms: float | None
+    transfer_bytes: int
+    resources: int
+
+
+def get_blocking_profile(crawler_name: str) -> BlockingProfile:
+    """Get the resource blocking profile configured for a crawler class."""
+    name = settings.BROWSER_CRAWLER_PROFILES.get(crawler_name, "none")
+    try:
+        return settings.BROWSER_BLOCKING_PROFILES[name]
+    except KeyError:
+        raise ImproperlyConfigured(f"Unknown blocking profile '{name}' for {crawler_name}")
+
+
+def apply_blocking_options(options: Options, profile: BlockingProfile) -> None:
+    """Add the launch options a profile needs."""
+    if profile.block_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+
+def apply_blocking(driver: WebDriver, profile: BlockingProfile) -> None:
+    """Block a profile's URL patterns for every request the driver makes."""
+    if not profile.blocked_url_patterns:
+        return
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile.blocked_url_patterns})
+
+
+def page_metrics(driver: WebDriver) -> PageMetrics | None:
+    """Measure the current page, or None when the browser cannot report it."""
+    try:
+        return PageMetrics(**driver.execute_script(PAGE_METRICS_SCRIPT))
+    except (WebDriverException, TypeError, ValueError) as e:
+        logger.debug(f"Failed to read page metrics: {str(e)}")
+        return None
+
+
+def log_page_metrics(driver: WebDriver, link: str) -> PageMetrics | None:
+    """Log how long the current page took to load and how much it transferred."""
+    if (metrics := page_metrics(driver)) is not None:
+        load = f"{metrics.load_ms:.0f} ms" if metrics.load_ms is not None else "unknown time"
+        logger.info(
+            f"Loaded {link} in {load}: {metrics.transfer_bytes / 1024:.0f} KiB"
+            f" over {metrics.resources} resources"
+        )
+    return metrics
@@ -1,21 +1,50 @@
+import multiprocessing
 import re
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Callable, Literal
 from urllib.parse import urlparse
 
 from loguru import logger
+from pydantic import BaseModel
 import warnings
 
+from llmops_datacollection.domain.writer import bulk_writer
+from llmops_datacollection.settings import settings
+
 from .base import BaseCrawler
 from .linkedin import LinkedInCrawler
 from .medium import MediumCrawler
 from .github import GithubCrawler
+from .scheduler import DomainScheduler
+
+if TYPE_CHECKING:
+    from .frontier import CrawlFrontier
+
+
+class CrawlResult(BaseModel):
+    """Outcome of crawling a single link."""
+
+    link: str
+    platform: str = "unknown"
+    successful: bool = False
+    error: str | None = None
 
 
 class CrawlerDispatcher:
     """Dispatcher for selecting appropriate crawler based on URL."""
-    
+
     def __init__(self):
         self._crawlers = {}
-        
+        self._domains = {}
+
     @classmethod
     def build(cls) -> "CrawlerDispatcher":
         """Build dispatcher with default crawlers."""
@@ -24,7 +53,7 @@ class CrawlerDispatcher:
         dispatcher.register("medium.com", MediumCrawler)
         dispatcher.register("github.com", GithubCrawler)
         return dispatcher
-        
+
     def register(self, domain: str, crawler_class: type[BaseCrawler]) -> None:
         """Register a crawler for a domain."""
         # Create regex pattern for domain
@@ -32,21 +61,232 @@ class CrawlerDispatcher:
             re.escape(urlparse(domain).netloc or domain)
         )
         self._crawlers[pattern] = crawler_class
-        
-    def get_crawler(self, url: str) -> BaseCrawler:
-        """Get appropriate crawler for URL."""
+        self._domains[pattern] = urlparse(domain).netloc or domain
+
+    def get_crawler_class(self, url: str) -> type[BaseCrawler]:
+        """Get appropriate crawler class for URL without instantiating it."""
         for pattern, crawler_class in self._crawlers.items():
             if re.match(pattern, url):
-                return crawler_class()
-                
+                return crawler_class
+
         logger.warning(f"No crawler found for {url}")
         raise ValueError(f"Unsupported URL: {url}")
 
-    def crawl_urls(self, urls: list[str], **kwargs) -> None:
-        """Crawl multiple URLs."""
-        for url in urls:
-            try:
-                crawler = self.get_crawler(url)
-                crawler.extract(url, **kwargs)
-            except Exception as e:
-                logger.error(f"Failed to crawl {url}: {str(e)}")
\ No newline at end of file
+    def get_crawler(self, url: str) -> BaseCrawler:
+        """Get appropriate crawler for URL."""
+        return self.get_crawler_class(url)()
+
+    def crawl_url(self, url: str, **kwargs) -> CrawlResult:
+        """Crawl a single URL, capturing any failure in the result.
+
+        Returns once the crawler's documents are written (they wait at most
+        WRITE_FLUSH_INTERVAL in the bulk writer), so a failed write fails
+        the crawl of its link.
+        """
+        return self._check_writes(*self._crawl(url, **kwargs))
+
+    def crawl_url_and_flush(self, url: str, **kwargs) -> CrawlResult:
+        """Crawl a single URL, flushing its buffered documents right away.
+
+        Used by process workers, whose bulk writer only holds the documents
+        of the current crawl.
+        """
+        result, writes = self._crawl(url, **kwargs)
+        bulk_writer.flush()
+        return self._check_writes(result, writes)
+
+    def _crawl(self, url: str, **kwargs) -> tuple[CrawlResult, list[Future]]:
+        """Crawl a URL without waiting for the bulk writer to store its documents.
+
+        Returns:
+            tuple[CrawlResult, list[Future]]: The crawl result, and the
+            futures of the documents the crawler submitted
+        """
+        platform = "unknown"
+        try:
+            crawler_class = self.get_crawler_class(url)
+            platform = crawler_class.model._collection
+            crawler = crawler_class()
+            crawler.extract(url, **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to crawl {url}: {str(e)}")
+            return CrawlResult(link=url, platform=platform, error=str(e)), []
+
+        return CrawlResult(link=url, platform=platform, successful=True), crawler.pending_writes
+
+    def _crawl_and_flush(self, url: str, **kwargs) -> tuple[CrawlResult, list[Future]]:
+        # Process workers hand back results only; their writes are already done
+        return self.crawl_url_and_flush(url, **kwargs), []
+
+    @staticmethod
+    def _check_writes(result: CrawlResult, writes: list[Future]) -> CrawlResult:
+        """Fail a crawl whose documents the bulk writer could not store.
+
+        Blocks until every write of the crawl is done.
+        """
+        errors = [str(error) for future in writes if (error := future.exception()) is not None]
+        if not errors:
+            return result
+
+        logger.error(f"Failed to crawl {result.link}: {'; '.join(errors)}")
+        return result.model_copy(update={"successful": False, "error": "; ".join(errors)})
+
+    def crawl_urls(
+        self,
+        urls: list[str],
+        *,
+        max_workers: int | None = None,
+        executor: Literal["thread", "process"] | None = None,
+        callback: Callable[[CrawlResult], None] | None = None,
+        frontier: "CrawlFrontier | None" = None,
+        **kwargs,
+    ) -> list[CrawlResult]:
+        """Crawl multiple URLs, concurrently when more than one worker is configured.
+
+        URLs are interleaved across domains by a DomainScheduler, which holds
+        each domain to its configured rate and in-flight limits.
+
+        Args:
+            urls: URLs to crawl
+            max_workers: Number of parallel workers (defaults to settings.CRAWL_MAX_WORKERS)
+            executor: Pool backend, "thread" or "process" (defaults to settings.CRAWL_EXECUTOR)
+            callback: Called with each result once its crawl finished and
+                its documents were written
+            frontier: Crawl frontier tracking the URLs; each URL is leased
+                in it right before its crawl starts, and its result recorded
+                once its documents were written
+            **kwargs: Forwarded to each crawler's extract()
+
+        Returns:
+            list[CrawlResult]: One result per crawled URL, in input order;
+            URLs another run claimed first are left out
+        """
+        max_workers = max_workers or settings.CRAWL_MAX_WORKERS
+        executor = executor or settings.CRAWL_EXECUTOR
+
+        scheduler = self.build_scheduler()
+        for i, url in enumerate(urls):
+            scheduler.add(self.get_domain(url), i)
+
+        results: dict[int, CrawlResult] = {}
+        # Finished crawls whose documents may still be buffered in the bulk writer
+        unwritten: list[tuple[int, CrawlResult, list[Future]]] = []
+
+        def start(domain: str, i: int) -> bool:
+            if frontier is None or frontier.claim(urls[i]):
+                return True
+            logger.info(f"Skipping {urls[i]}, claimed by another run")
+            scheduler.release(domain)
+            return False
+
+        def finish(domain: str, i: int, result: CrawlResult, writes: list[Future]) -> None:
+            scheduler.release(domain)
+            unwritten.append((i, result, writes))
+            record_written()
+
+        def record_written(block: bool = False) -> None:
+            # Workers never wait on the bulk writer, so batches span many crawls;
+            # results are recorded once their writes are done
+            for entry in [entry for entry in unwritten if block or all(f.done() for f in entry[2])]:
+                unwritten.remove(entry)
+                i, result, writes = entry
+                result = self._check_writes(result, writes)
+                if frontier is not None:
+                    frontier.record(result)
+                if callback is not None:
+                    callback(result)
+                results[i] = result
+
+        try:
+            if max_workers <= 1 or len(urls) <= 1:
+                while len(scheduler):
+                    if (task := scheduler.next_ready()) is None:
+                        time.sleep(self._time_until_ready(scheduler))
+                        continue
+                    if start(*task):
+                        domain, i = task
+                        finish(domain, i, *self._crawl(urls[i], **kwargs))
+            else:
+                self._crawl_concurrently(urls, scheduler, start, finish, max_workers, executor, **kwargs)
+            record_written(block=True)
+        finally:
+            if frontier is not None:
+                # Leases of crawls that never finished (e.g. the run was interrupted)
+                frontier.release()
+
+        return [results[i] for i in range(len(urls)) if i in results]
+
+    def _crawl_concurrently(
+        self,
+        urls: list[str],
+        scheduler: DomainScheduler,
+        start: Callable[[str, int], bool],
+        finish: Callable[[str, int, CrawlResult, list[Future]], None],
+        max_workers: int,
+        executor: str,
+        **kwargs,
+    ) -> None:
+        crawl = self._crawl_and_flush if executor == "process" else self._crawl
+        with self._build_executor(executor, min(max_workers, len(urls))) as pool:
+            running: dict[Future, tuple[str, int]] = {}
+            while len(scheduler) or running:
+                while len(running) < max_workers and (task := scheduler.next_ready()) is not None:
+                    if start(*task):
+                        domain, i = task
+                        running[pool.submit(crawl, urls[i], **kwargs)] = task
+
+                if not running:
+                    if len(scheduler):
+                        time.sleep(self._time_until_ready(scheduler))
+                    continue
+
+                timeout = None
+                if len(running) < max_workers and len(scheduler):
+                    # A free slot: wake up when the next queued domain is ready
+                    timeout = scheduler.time_until_ready()
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    domain, i = running.pop(future)
+                    try:
+                        result, writes = future.result()
+                    except Exception as e:
+                        # Only reachable when the worker itself dies (e.g. a killed process)
+                        logger.error(f"Failed to crawl {urls[i]}: {str(e)}")
+                        result, writes = CrawlResult(link=urls[i], error=str(e)), []
+                    finish(domain, i, result, writes)
+
+    def get_domain(self, url: str) -> str:
+        """Get the registered domain a URL is scheduled under."""
+        for pattern, domain in self._domains.items():
+            if re.match(pattern, url):
+                return domain
+        return urlparse(url).netloc or url
+
+    def build_scheduler(self) -> DomainScheduler:
+        """Build a scheduler using the politeness limits from settings."""
+        return DomainScheduler(
+            limits=settings.CRAWL_DOMAIN_LIMITS,
+            default=settings.CRAWL_DEFAULT_LIMITS,
+        )
+
+    @staticmethod
+    def _time_until_ready(scheduler: DomainScheduler) -> float:
+        """Seconds to sleep before the next queued task can start, with none running."""
+        if (delay := scheduler.time_until_ready()) is None:
+            # Only a running task can free an in-flight slot, and none is running
+            raise RuntimeError("No queued crawl can start; check the max_in_flight crawl limits")
+        return delay
+
+    @staticmethod
+    def _build_executor(executor: str, max_workers: int) -> Executor:
+        """Create the worker pool for concurrent crawls."""
+        if executor == "thread":
+            return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawler")
+        if executor == "process":
+            # Spawn so each worker opens its own MongoDB client instead of
+            # inheriting the parent's sockets through fork
+            return ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        raise ValueError(f"Unsupported crawl executor: {executor}")
@@ -0,0 +1,189 @@
+import atexit
+import threading
+import time
+from typing import Callable
+
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from llmops_datacollection.domain.exceptions import CrawlerError
+from llmops_datacollection.settings import settings
+
+
+class WebDriverPool:
+    """Pool of warm WebDrivers shared by Selenium crawlers.
+
+    Drivers are grouped by key (one key per crawler profile, since crawlers
+    launch Chrome with different options). A checked-in driver is health
+    checked and reset before it is handed out again, and retired once it
+    has served `max_uses` checkouts.
+    """
+
+    def __init__(self, max_size: int, max_uses: int, checkout_timeout: float) -> None:
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+        self._idle: dict[str, list[WebDriver]] = {}
+        self._keys: dict[int, str] = {}
+        self._uses: dict[int, int] = {}
+        self._size = 0
+        self._condition = threading.Condition()
+
+    def checkout(self, key: str, factory: Callable[[], WebDriver]) -> WebDriver:
+        """Get a healthy driver for `key`, launching one with `factory` if needed."""
+        while True:
+            with self._condition:
+                driver, evicted = self._wait_for_driver(key)
+
+            if evicted is not None:
+                self._quit_quietly(evicted)
+            if driver is None:
+                return self._create(key, factory)
+            if self._is_healthy(driver):
+                return driver
+
+            logger.warning(f"Discarding unhealthy {key} WebDriver")
+            self._quit(driver)
+
+    def checkin(self, driver: WebDriver, reset_cookies: bool = True) -> None:
+        """Return a driver to the pool, retiring it if worn out or broken."""
+        driver_id = id(driver)
+        with self._condition:
+            key = self._keys.get(driver_id)
+            if key is None:
+                # Not created by this pool (e.g. a crawler given its own driver)
+                logger.debug("Quitting WebDriver not owned by the pool")
+            else:
+                self._uses[driver_id] += 1
+                uses = self._uses[driver_id]
+
+        if key is None:
+            self._quit_quietly(driver)
+            return
+
+        if uses >= self.max_uses:
+            logger.info(f"Recycling {key} WebDriver after {uses} uses")
+            self._quit(driver)
+            return
+
+        try:
+            self._reset(driver, reset_cookies)
+        except WebDriverException as e:
+            logger.warning(f"Failed to reset {key} WebDriver, discarding it: {str(e)}")
+            self._quit(driver)
+            return
+
+        with self._condition:
+            self._idle.setdefault(key, []).append(driver)
+            self._condition.notify_all()
+
+    def discard(self, driver: WebDriver) -> None:
+        """Quit a checked-out driver instead of returning it."""
+        self._quit(driver)
+
+    def close(self) -> None:
+        """Quit every idle driver."""
+        with self._condition:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+
+        for driver in drivers:
+            self._quit(driver)
+
+    def _wait_for_driver(self, key: str) -> tuple[WebDriver | None, WebDriver | None]:
+        """Pop an idle driver for `key`, or reserve a slot for a new one.
+
+        Must be called with the condition held. Returns the idle driver (None
+        when a slot was reserved) and, if room had to be made, an idle driver
+        of another profile that the caller must quit.
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            if idle := self._idle.get(key):
+                return idle.pop(), None
+
+            if self._size < self.max_size:
+                self._size += 1
+                return None, None
+
+            # Make room by retiring an idle driver that belongs to another profile
+            for other_idle in self._idle.values():
+                if other_idle:
+                    evicted = other_idle.pop()
+                    self._forget(evicted)
+                    return None, evicted
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CrawlerError(f"Timed out waiting for a {key} WebDriver")
+            self._condition.wait(timeout=remaining)
+
+    def _create(self, key: str, factory: Callable[[], WebDriver]) -> WebDriver:
+        try:
+            driver = factory()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify_all()
+            raise
+
+        with self._condition:
+            self._keys[id(driver)] = key
+            self._uses[id(driver)] = 0
+
+        logger.info(f"Launched new {key} WebDriver ({self._size}/{self.max_size} in pool)")
+        return driver
+
+    def _quit(self, driver: WebDriver) -> None:
+        with self._condition:
+            if self._forget(driver):
+                self._size -= 1
+            self._condition.notify_all()
+        self._quit_quietly(driver)
+
+    def _forget(self, driver: WebDriver) -> bool:
+        self._uses.pop(id(driver), None)
+        return self._keys.pop(id(driver), None) is not None
+
+    @staticmethod
+    def _quit_quietly(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit WebDriver: {str(e)}")
+
+    @staticmethod
+    def _is_healthy(driver: WebDriver) -> bool:
+        try:
+            return driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver: WebDriver, reset_cookies: bool) -> None:
+        """Clear per-crawl state so the next checkout starts clean."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        if reset_cookies:
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                # Storage is not accessible on every origin (e.g. about:blank)
+                pass
+
+        driver.get("about:blank")
+
+
+# Global pool instance
+driver_pool = WebDriverPool(
+    max_size=settings.DRIVER_POOL_SIZE,
+    max_uses=settings.DRIVER_MAX_USES,
+    checkout_timeout=settings.DRIVER_CHECKOUT_TIMEOUT,
+)
+atexit.register(driver_pool.close)
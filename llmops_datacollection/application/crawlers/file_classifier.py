@@ -0,0 +1,139 @@
+import os
+from fnmatch import fnmatch
+
+from loguru import logger
+
+# File types never worth reading (or downloading in sparse mode)
+BINARY_EXTENSIONS = (
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".svg", ".webp",
+    ".pdf", ".zip", ".gz", ".tgz", ".tar", ".bz2", ".xz", ".7z", ".rar",
+    ".jar", ".war", ".so", ".dll", ".dylib", ".exe", ".bin", ".o", ".a",
+    ".pkl", ".pickle", ".pt", ".pth", ".h5", ".onnx", ".npy", ".npz", ".parquet",
+    ".mp3", ".mp4", ".wav", ".avi", ".mov", ".woff", ".woff2", ".ttf", ".otf", ".eot",
+)
+
+# Leading bytes of common binary formats
+MAGIC_NUMBERS = (
+    b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"%PDF", b"PK\x03\x04", b"\x1f\x8b",
+    b"\x7fELF", b"MZ", b"\xca\xfe\xba\xbe", b"\xcf\xfa\xed\xfe", b"BZh", b"7z\xbc\xaf",
+    b"\x00asm", b"SQLite format 3",
+)
+
+SNIFF_BYTES = 8192
+MINIFIED_LINE_LENGTH = 1000  # Average line length above which text counts as minified
+
+LINGUIST_ATTRIBUTES = ("linguist-generated", "linguist-vendored")
+
+
+class FileClassifier:
+    """Decide which repository files are worth ingesting before reading them.
+
+    Files are skipped, cheapest check first, when they match an exclude glob
+    (or miss every include glob), have a binary extension, are marked
+    `linguist-generated` or `linguist-vendored` in the root .gitattributes,
+    are oversized notebooks, or look binary or minified from their first bytes.
+    """
+
+    def __init__(
+        self,
+        include: list[str] | tuple[str, ...] = (),
+        exclude: list[str] | tuple[str, ...] = (),
+        attributes: list[tuple[str, dict[str, bool]]] | None = None,
+        max_notebook_bytes: int | None = None,
+    ) -> None:
+        self._include = tuple(include)
+        self._exclude = tuple(exclude)
+        self._attributes = attributes or []
+        self._max_notebook_bytes = max_notebook_bytes
+
+    @classmethod
+    def for_repository(cls, repo_path: str, **kwargs) -> "FileClassifier":
+        """Build a classifier using the repository's root .gitattributes."""
+        path = os.path.join(repo_path, ".gitattributes")  # noqa: PTH118
+        attributes = []
+        if os.path.isfile(path):  # noqa: PTH113
+            with open(path, "r", errors="ignore") as f:  # noqa: PTH123
+                attributes = parse_gitattributes(f.read())
+        return cls(attributes=attributes, **kwargs)
+
+    def skip_reason(self, file_path: str, full_path: str, size: int) -> str | None:
+        """Get why a file should be skipped, or None to ingest it."""
+        if self._exclude and _matches_any(file_path, self._exclude):
+            return "excluded"
+        if self._include and not _matches_any(file_path, self._include):
+            return "not included"
+        if file_path.lower().endswith(BINARY_EXTENSIONS):
+            return "binary extension"
+
+        for attribute in LINGUIST_ATTRIBUTES:
+            if self._attribute(file_path, attribute):
+                return attribute
+
+        if (
+            self._max_notebook_bytes is not None
+            and file_path.endswith(".ipynb")
+            and size > self._max_notebook_bytes
+        ):
+            return "notebook with outputs"
+
+        return self._sniff(full_path)
+
+    def _attribute(self, file_path: str, attribute: str) -> bool:
+        # Later lines override earlier ones, as in git
+        value = False
+        for pattern, attributes in self._attributes:
+            if attribute in attributes and _matches_attribute_pattern(file_path, pattern):
+                value = attributes[attribute]
+        return value
+
+    @staticmethod
+    def _sniff(full_path: str) -> str | None:
+        try:
+            with open(full_path, "rb") as f:  # noqa: PTH123
+                head = f.read(SNIFF_BYTES)
+        except OSError as e:
+            logger.debug(f"Failed to sniff {full_path}: {str(e)}")
+            return "unreadable"
+
+        if head.startswith(MAGIC_NUMBERS) or b"\0" in head:
+            return "binary content"
+        if len(head) == SNIFF_BYTES and len(head) / (head.count(b"\n") + 1) > MINIFIED_LINE_LENGTH:
+            return "minified"
+        return None
+
+
+def parse_gitattributes(text: str) -> list[tuple[str, dict[str, bool]]]:
+    """Parse the linguist attributes out of a .gitattributes file.
+
+    Returns:
+        list[tuple[str, dict[str, bool]]]: (pattern, attribute -> set) per line
+    """
+    rules = []
+    for line in text.splitlines():
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+
+        attributes = {}
+        for field in fields[1:]:
+            name, _, value = field.lstrip("-!").partition("=")
+            if name in LINGUIST_ATTRIBUTES:
+                attributes[name] = not field.startswith(("-", "!")) and value not in ("false", "0")
+        if attributes:
+            rules.append((fields[0], attributes))
+    return rules
+
+
+def _matches_any(file_path: str, patterns: tuple[str, ...]) -> bool:
+    name = os.path.basename(file_path)  # noqa: PTH119
+    return any(fnmatch(file_path, pattern) or fnmatch(name, pattern) for pattern in patterns)
+
+
+def _matches_attribute_pattern(file_path: str, pattern: str) -> bool:
+    # Patterns without a slash match the file name at any depth
+    if "/" not in pattern.rstrip("/"):
+        return fnmatch(os.path.basename(file_path), pattern)  # noqa: PTH119
+    pattern = pattern.lstrip("/")
+    if pattern.endswith("/**"):
+        return file_path.startswith(pattern[:-2])
+    return fnmatch(file_path, pattern)
@@ -0,0 +1,191 @@
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from loguru import logger
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from llmops_datacollection.domain.documents import FrontierDocument
+from llmops_datacollection.infrastructure.db.mongo import connection
+from llmops_datacollection.settings import settings
+
+from .dispatcher import CrawlResult
+
+
+def utcnow() -> datetime:
+    """Current UTC time, naive like the datetimes pymongo reads back."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class CrawlFrontier:
+    """Persistent crawl state of every link, so interrupted runs resume where they stopped.
+
+    Links move from "pending" to "in_progress" when a run starts crawling
+    them, then to "done" or "failed". A claim holds a lease: links of a run
+    that died mid-crawl become claimable again once their lease expires.
+    Failed links are retried with exponential backoff until `max_attempts`
+    crawls failed, and done links are crawled again after `revisit_after`
+    seconds, if set.
+
+    A link is only marked done once the bulk writer stored its documents, so
+    a link whose documents were lost to a failed write is retried.
+    """
+
+    def __init__(
+        self,
+        lease_seconds: float,
+        max_attempts: int,
+        retry_base: float,
+        retry_max: float,
+        revisit_after: float | None = None,
+        clock: Callable[[], datetime] = utcnow,
+    ) -> None:
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.revisit_after = revisit_after
+        self.owner = str(uuid.uuid4())  # Identifies this run's leases
+        self._clock = clock
+        self._attempts: dict[str, int] = {}  # Links leased by this run, with their failed attempts
+
+    @classmethod
+    def from_settings(cls) -> "CrawlFrontier":
+        """Build a frontier using the lease and retry settings."""
+        return cls(
+            lease_seconds=settings.FRONTIER_LEASE_SECONDS,
+            max_attempts=settings.FRONTIER_MAX_ATTEMPTS,
+            retry_base=settings.FRONTIER_RETRY_BASE,
+            retry_max=settings.FRONTIER_RETRY_MAX,
+            revisit_after=settings.FRONTIER_REVISIT_AFTER,
+        )
+
+    def add(self, links: list[str]) -> None:
+        """Add links as pending, leaving links already in the frontier untouched."""
+        if not links:
+            return
+
+        now = self._clock()
+        operations = [
+            UpdateOne(*FrontierDocument._upsert_args(
+                FrontierDocument(link=link, updated_at=now)._to_prepared_mongo()
+            ), upsert=True)
+            for link in dict.fromkeys(links)
+        ]
+        self._collection().bulk_write(operations, ordered=False)
+
+    def ready(self, links: list[str]) -> list[str]:
+        """Get the links that are ready to crawl now, without leasing them.
+
+        Ready links are pending ones, failed ones whose backoff has passed,
+        in-progress ones whose lease expired and, with `revisit_after` set,
+        ones done long enough ago.
+
+        Returns:
+            list[str]: Ready links, in input order
+        """
+        if not links:
+            return []
+
+        docs = self._collection().find({"link": {"$in": links}, "$or": self._ready_filter()}, {"link": 1})
+        ready = {doc["link"] for doc in docs}
+        return [link for link in dict.fromkeys(links) if link in ready]
+
+    def claim(self, link: str) -> bool:
+        """Lease a link right before crawling it, if it is still ready.
+
+        The claim is a single atomic update, so concurrent runs never crawl
+        the same link twice. Leases only cover running crawls: links queued
+        behind rate limits are not held, and stay ready for a rerun if this
+        run dies before starting them.
+
+        Returns:
+            bool: Whether this run now holds the link's lease
+        """
+        now = self._clock()
+        doc = self._collection().find_one_and_update(
+            {"link": link, "$or": self._ready_filter()},
+            {"$set": {
+                "state": "in_progress",
+                "lease_owner": self.owner,
+                "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                "updated_at": now,
+            }},
+            projection={"attempts": 1},
+        )
+        if doc is None:
+            return False
+
+        self._attempts[link] = doc.get("attempts", 0)
+        return True
+
+    def release(self) -> None:
+        """Hand back the links this run leased but did not record a result for."""
+        if not self._attempts:
+            return
+
+        self._collection().update_many(
+            {"link": {"$in": list(self._attempts)}, "lease_owner": self.owner},
+            {"$set": {"state": "pending", "lease_owner": None, "lease_expires_at": None, "updated_at": self._clock()}},
+        )
+        logger.info(f"Released {len(self._attempts)} unfinished link(s) back to the frontier")
+        self._attempts.clear()
+
+    def record(self, result: CrawlResult) -> None:
+        """Mark a link leased by this run done, or failed with its retry scheduled.
+
+        Links whose lease expired and was taken over by another run are left
+        to that run.
+        """
+        now = self._clock()
+        update = {"lease_owner": None, "lease_expires_at": None, "updated_at": now}
+        if result.successful:
+            update.update(state="done", attempts=0, last_error=None, next_attempt_at=None)
+        else:
+            # The lease keeps other runs off the link, so the count read at claim time is current
+            attempts = self._attempts.get(result.link, 0) + 1
+            delay = self.retry_delay(attempts)
+            update.update(
+                state="failed",
+                attempts=attempts,
+                last_error=result.error,
+                next_attempt_at=now + timedelta(seconds=delay),
+            )
+
+        matched = self._collection().update_one(
+            {"link": result.link, "lease_owner": self.owner}, {"$set": update},
+        ).matched_count
+        self._attempts.pop(result.link, None)
+        if not matched:
+            logger.warning(f"Lease on {result.link} was lost to another run, not recording its result")
+        elif not result.successful:
+            if attempts >= self.max_attempts:
+                logger.warning(f"Giving up on {result.link} after {attempts} failed attempt(s)")
+            else:
+                logger.info(f"Retrying {result.link} in {delay:.0f}s (attempt {attempts} failed)")
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next crawl of a link that failed `attempts` times."""
+        return min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+
+    def summary(self, links: list[str]) -> dict[str, int]:
+        """Count the given links per state."""
+        docs = self._collection().find({"link": {"$in": links}}, {"state": 1})
+        return dict(Counter(doc["state"] for doc in docs))
+
+    def _ready_filter(self) -> list[dict]:
+        now = self._clock()
+        ready = [
+            {"state": "pending"},
+            {"state": "failed", "attempts": {"$lt": self.max_attempts}, "next_attempt_at": {"$lte": now}},
+            {"state": "in_progress", "lease_expires_at": {"$lte": now}},
+        ]
+        if self.revisit_after is not None:
+            ready.append({"state": "done", "updated_at": {"$lte": now - timedelta(seconds=self.revisit_after)}})
+        return ready
+
+    @staticmethod
+    def _collection() -> Collection:
+        return connection.get_collection(FrontierDocument.get_collection_name())
@@ -2,63 +2,92 @@ import os
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
 from loguru import logger
 
-from llmops_datacollection.domain.documents import RepositoryDocument
+from llmops_datacollection.domain.documents import BlobDocument, RepositoryDocument
+from llmops_datacollection.domain.writer import bulk_writer
+from llmops_datacollection.settings import settings
 
 from .base import BaseCrawler
+from .file_classifier import BINARY_EXTENSIONS, FileClassifier
+
+READ_CHUNK_CHARS = 1 << 20
 
 
 class GithubCrawler(BaseCrawler):
     model = RepositoryDocument
 
-    def __init__(self, ignore=(".git", ".toml", ".lock", ".png")) -> None:
+    def __init__(
+        self,
+        ignore=(".git", ".toml", ".lock", ".png"),
+        clone_mode: str | None = None,
+        max_file_bytes: int | None = None,
+        max_total_bytes: int | None = None,
+        read_workers: int | None = None,
+        flush_bytes: int | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ) -> None:
         super().__init__()
         self._ignore = ignore
+        self._clone_mode = clone_mode or settings.GITHUB_CLONE_MODE
+        self._max_file_bytes = max_file_bytes or settings.GITHUB_MAX_FILE_BYTES
+        self._max_total_bytes = max_total_bytes or settings.GITHUB_MAX_TOTAL_BYTES
+        self._read_workers = read_workers or settings.GITHUB_READ_WORKERS
+        self._flush_bytes = flush_bytes or settings.GITHUB_FLUSH_BYTES
+        self._include = settings.GITHUB_INCLUDE_GLOBS if include is None else include
+        self._exclude = settings.GITHUB_EXCLUDE_GLOBS if exclude is None else exclude
 
     def extract(self, link: str, **kwargs) -> None:
-        old_model = self.model.find(link=link)
+        old_model = self._find_stored(link)
         if old_model is not None:
-            logger.info(f"Repository already exists in the database: {link}")
+            if not settings.GITHUB_INCREMENTAL:
+                logger.info(f"Repository already exists in the database: {link}")
 
-            return
+                return
+
+            remote_sha = self._remote_head(link)
+            if remote_sha is None or remote_sha == old_model.commit_sha:
+                logger.info(f"Repository unchanged since last crawl: {link}")
+
+                return
 
         logger.info(f"Starting scrapping GitHub repository: {link}")
 
         repo_name = link.rstrip("/").split("/")[-1]
 
         local_temp = tempfile.mkdtemp()
+        repo_path = os.path.join(local_temp, repo_name)  # noqa: PTH118
 
         try:
-            os.chdir(local_temp)
-            subprocess.run(["git", "clone", link])
+            self._clone(link, repo_path)
 
-            repo_path = os.path.join(local_temp, os.listdir(local_temp)[0])  # noqa: PTH118
+            commit_sha = self._git("-C", repo_path, "rev-parse", "HEAD") or None
+            files = self._select_files(repo_path, repo_name)
+            blob_hashes = self._blob_hashes(repo_path)
+            file_hashes = {file: blob_hashes[file] for file in files if file in blob_hashes}
 
-            tree = {}
-            for root, _, files in os.walk(repo_path):
-                dir = root.replace(repo_path, "").lstrip("/")
-                if dir.startswith(self._ignore):
-                    continue
+            if old_model is None:
+                tree, content_hashes = self._ingest_files(repo_path, files)
 
-                for file in files:
-                    if file.endswith(self._ignore):
-                        continue
-                    file_path = os.path.join(dir, file)  # noqa: PTH118
-                    with open(os.path.join(root, file), "r", errors="ignore") as f:  # noqa: PTH123, PTH118
-                        tree[file_path] = f.read().replace(" ", "")
-
-            user = kwargs["user"]
-            instance = self.model(
-                content=tree,
-                name=repo_name,
-                link=link,
-                platform="github",
-                author_id=user.id,
-                author_full_name=user.full_name,
-            )
-            instance.save()
+                user = kwargs["user"]
+                instance = self.model(
+                    content=tree,
+                    name=repo_name,
+                    link=link,
+                    platform="github",
+                    author_id=user.id,
+                    author_full_name=user.full_name,
+                    commit_sha=commit_sha,
+                    file_hashes=file_hashes,
+                    content_hashes=content_hashes,
+                )
+                self.pending_writes.append(bulk_writer.submit(instance))
+            else:
+                self._update_changed_files(old_model, repo_path, files, file_hashes, commit_sha)
 
         except Exception:
             raise
@@ -66,3 +95,213 @@ class GithubCrawler(BaseCrawler):
             shutil.rmtree(local_temp)
 
         logger.info(f"Finished scrapping GitHub repository: {link}")
+
+    def _update_changed_files(
+        self,
+        old_model: RepositoryDocument,
+        repo_path: str,
+        files: list[str],
+        file_hashes: dict[str, str],
+        commit_sha: str | None,
+    ) -> None:
+        """Re-read only files whose blob changed since the stored commit.
+
+        Unchanged files keep their blob references, so only changed texts are
+        read and written. Otherwise (inline texts, or the blob store turned
+        off) the stored texts are loaded in full and written back as needed.
+        """
+        use_blobs = bool(old_model.content_hashes) and settings.GITHUB_BLOB_STORE
+        if not use_blobs:
+            old_model = self.model.find(link=old_model.link)
+
+        stored = old_model.content_hashes or old_model.content
+        changed = [
+            file for file in files
+            if file not in stored or old_model.file_hashes.get(file) != file_hashes.get(file)
+        ]
+        unchanged = [file for file in files if file not in changed]
+
+        removed = len(stored.keys() - set(files))
+        logger.info(
+            f"Repository {old_model.name} moved to {commit_sha}: "
+            f"{len(changed)} changed, {removed} removed, {len(unchanged)} unchanged"
+        )
+
+        if use_blobs:
+            content_hashes = {file: old_model.content_hashes[file] for file in unchanged}
+            content_hashes.update(self._ingest_files(repo_path, changed)[1])
+            old_model.update(content={}, content_hashes=content_hashes, commit_sha=commit_sha, file_hashes=file_hashes)
+            return
+
+        tree = self._read_files(repo_path, changed)
+        tree.update({file: old_model.content[file] for file in unchanged})
+        # With the blob store on, this moves inline texts over to blobs
+        content_hashes = self._store_blobs(tree)
+        old_model.update(
+            content={} if content_hashes else tree,
+            content_hashes=content_hashes,
+            commit_sha=commit_sha,
+            file_hashes=file_hashes,
+        )
+
+    def _find_stored(self, link: str) -> RepositoryDocument | None:
+        """Load the crawl state of a stored repository without its file texts."""
+        return next(
+            self.model.iter_find(
+                link=link,
+                projection=["name", "link", "commit_sha", "file_hashes", "content_hashes"],
+                limit=1,
+            ),
+            None,
+        )
+
+    @staticmethod
+    def _store_blobs(tree: dict[str, str]) -> dict[str, str]:
+        """Write file texts to the blob store, returning path -> hash references."""
+        if not settings.GITHUB_BLOB_STORE:
+            return {}
+        return BlobDocument.put_many(tree)
+
+    def _ingest_files(self, repo_path: str, files: list[str]) -> tuple[dict[str, str], dict[str, str]]:
+        """Read files for storage.
+
+        With the blob store, files are read and written in batches of about
+        `flush_bytes`, so only one batch of texts is held in memory at a time.
+
+        Returns:
+            tuple[dict[str, str], dict[str, str]]: Inline texts and blob
+            references by path; one of them is empty
+        """
+        if not settings.GITHUB_BLOB_STORE:
+            return self._read_files(repo_path, files), {}
+
+        content_hashes = {}
+        for batch in self._batches(repo_path, files):
+            content_hashes.update(BlobDocument.put_many(self._read_files(repo_path, batch)))
+        return {}, content_hashes
+
+    def _batches(self, repo_path: str, files: list[str]) -> Iterator[list[str]]:
+        """Split files into batches of at most `flush_bytes` (or a single larger file)."""
+        batch = []
+        batch_bytes = 0
+        for file in files:
+            size = os.path.getsize(os.path.join(repo_path, file))  # noqa: PTH118
+            if batch and batch_bytes + size > self._flush_bytes:
+                yield batch
+                batch = []
+                batch_bytes = 0
+            batch.append(file)
+            batch_bytes += size
+
+        if batch:
+            yield batch
+
+    def _read_files(self, repo_path: str, files: list[str]) -> dict[str, str]:
+        """Read the given files, spreading reads over a thread pool."""
+        if not files:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self._read_workers) as pool:
+            contents = pool.map(
+                self._read_file,
+                (os.path.join(repo_path, file_path) for file_path in files),  # noqa: PTH118
+            )
+            return dict(zip(files, contents))
+
+    def _select_files(self, repo_path: str, repo_name: str) -> list[str]:
+        """List files to ingest, honouring the classifier and the size limits."""
+        classifier = FileClassifier.for_repository(
+            repo_path,
+            include=self._include,
+            exclude=self._exclude,
+            max_notebook_bytes=settings.GITHUB_MAX_NOTEBOOK_BYTES,
+        )
+        selected = []
+        skipped = 0
+        total_bytes = 0
+        for root, dirs, files in os.walk(repo_path):
+            dir = root.replace(repo_path, "").lstrip("/")
+            if dir.startswith(self._ignore):
+                dirs.clear()
+                continue
+
+            for file in files:
+                if file.endswith(self._ignore):
+                    continue
+                file_path = os.path.join(dir, file)  # noqa: PTH118
+                full_path = os.path.join(root, file)  # noqa: PTH118
+                size = os.path.getsize(full_path)
+                if size > self._max_file_bytes:
+                    logger.debug(f"Skipping {file_path}: {size} bytes exceeds per-file limit")
+                    continue
+                if reason := classifier.skip_reason(file_path, full_path, size):
+                    logger.debug(f"Skipping {file_path}: {reason}")
+                    skipped += 1
+                    continue
+                if total_bytes + size > self._max_total_bytes:
+                    logger.warning(
+                        f"Repository {repo_name} exceeds {self._max_total_bytes} bytes, "
+                        f"keeping the first {len(selected)} files"
+                    )
+                    return selected
+
+                total_bytes += size
+                selected.append(file_path)
+
+        logger.info(f"Selected {len(selected)} files of {repo_name}, skipped {skipped} by classification")
+        return selected
+
+    @staticmethod
+    def _read_file(path: str) -> str:
+        """Read a file without spaces, chunk by chunk so no spaced copy of it is held."""
+        with open(path, "r", errors="ignore") as f:  # noqa: PTH123
+            return "".join(
+                chunk.replace(" ", "")
+                for chunk in iter(lambda: f.read(READ_CHUNK_CHARS), "")
+            )
+
+    def _remote_head(self, link: str) -> str | None:
+        """Get the remote HEAD commit without cloning, or None if unreachable."""
+        try:
+            output = self._git("ls-remote", link, "HEAD")
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Failed to check remote HEAD of {link}: {e.stderr}")
+            return None
+
+        return output.split()[0] if output else None
+
+    def _blob_hashes(self, repo_path: str) -> dict[str, str]:
+        """Map every tracked path at HEAD to its git blob SHA."""
+        hashes = {}
+        for entry in self._git("-C", repo_path, "ls-tree", "-r", "-z", "HEAD").split("\0"):
+            if not entry:
+                continue
+            meta, path = entry.split("\t", 1)
+            _, object_type, object_sha = meta.split()
+            if object_type == "blob":
+                hashes[path] = object_sha
+        return hashes
+
+    @staticmethod
+    def _git(*args: str) -> str:
+        """Run a git command and return its stripped stdout."""
+        result = subprocess.run(["git", *args], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+
+    def _clone(self, link: str, target: str) -> None:
+        """Clone the repository into `target` using the configured mode."""
+        if self._clone_mode == "full":
+            subprocess.run(["git", "clone", link, target], check=True)
+            return
+
+        # Only the current tree is read, so skip history, other branches and tags
+        command = ["git", "clone", "--depth", "1", "--single-branch", "--no-tags"]
+        if self._clone_mode == "shallow":
+            subprocess.run([*command, link, target], check=True)
+            return
+
+        # Sparse: fetch blobs lazily and check out only text files
+        subprocess.run([*command, "--filter=blob:none", "--no-checkout", link, target], check=True)
+        patterns = ["/*", *(f"!*{ext}" for ext in {*BINARY_EXTENSIONS, *self._ignore} if ext != ".git")]
+        subprocess.run(["git", "-C", target, "sparse-checkout", "set", "--no-cone", *patterns], check=True)
+        subprocess.run(["git", "-C", target, "checkout"], check=True)
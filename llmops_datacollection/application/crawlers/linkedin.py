@@ -249,8 +249,6 @@ import time
 import os
 from typing import Dict, List, Optional
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 from loguru import logger
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -262,15 +260,59 @@ from selenium.common.exceptions import (
     NoSuchElementException
 )
 
+from llmops_datacollection.application.utils.html import parse_html
 from llmops_datacollection.domain.documents import PostDocument, UserDocument
 from llmops_datacollection.domain.exceptions import ImproperlyConfigured, CrawlerError
+from llmops_datacollection.domain.writer import bulk_writer
 from llmops_datacollection.settings import settings
 from .base import BaseSeleniumCrawler
+from .blocking import log_page_metrics
+from .session_store import SessionStore
+from .waits import wait_for_page_settled, wait_for_stable_count, wait_until
+
+LINKEDIN_HOME = "https://www.linkedin.com/"
+SESSION_COOKIE = "li_at"
+
+# Pages LinkedIn redirects to once credentials are accepted
+LOGIN_REDIRECT_MARKERS = ("/feed",)
+
+# Security challenges (e.g., verification codes) LinkedIn puts in front of a
+# login; they need a human, so the login counts as blocked
+LOGIN_CHALLENGE_MARKERS = ("/checkpoint",)
+
+POST_SELECTOR = "div.update-components-text.relative.update-components-update-v2__commentary"
+
+# Returns posts rendered since the last call (with the URN of their update)
+# and drops the media of those updates to keep the DOM small
+COLLECT_NEW_POSTS_SCRIPT = """
+const posts = [];
+for (const element of document.querySelectorAll(arguments[0])) {
+    if (element.dataset.llmopsSeen) { continue; }
+    element.dataset.llmopsSeen = "1";
+    const update = element.closest("[data-urn]");
+    posts.push({urn: update ? update.getAttribute("data-urn") : null, text: element.innerText.trim()});
+    if (update) { update.querySelectorAll("img, video, iframe").forEach((node) => node.remove()); }
+}
+return posts;
+"""
+
+# Pages LinkedIn redirects to when the session is missing or expired
+LOGIN_URL_MARKERS = ("/login", "/authwall", "/uas/")
+
+# Global session store shared by LinkedIn crawlers
+session_store = SessionStore(settings.LINKEDIN_SESSION_PATH, settings.LINKEDIN_SESSION_KEY)
 
 class LinkedInCrawler(BaseSeleniumCrawler):
-    """LinkedIn content crawler implementation."""
+    """LinkedIn content crawler implementation.
+
+    Pooled drivers keep their cookies, so one login serves many profiles.
+    Session cookies are also persisted to the encrypted session store and
+    restored into fresh drivers; the crawler only logs in again when
+    LinkedIn redirects to a login page.
+    """
     
     model = PostDocument
+    keep_session = True
 
     def __init__(self, scroll_limit: int = 5, timeout: int = 60) -> None:
         """Initialize LinkedIn crawler."""
@@ -339,23 +381,23 @@ class LinkedInCrawler(BaseSeleniumCrawler):
                 )
                 login_button.click()
                 
-                # Wait for potential redirects or challenges
-                time.sleep(5)
-                
-                # Save post-login page state
-                self._save_debug_screenshot("login_after_submit")
-                
-                # Check for additional challenges (e.g., verification)
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.url_contains("feed") or 
-                        EC.url_contains("checkpoint")
-                    )
-                except TimeoutException:
+                # Wait for the redirect to the feed or to a challenge (e.g., verification)
+                redirected = wait_until(
+                    "login redirect",
+                    lambda: any(
+                        marker in self.driver.current_url
+                        for marker in LOGIN_REDIRECT_MARKERS + LOGIN_CHALLENGE_MARKERS
+                    ),
+                )
+                if any(marker in self.driver.current_url for marker in LOGIN_CHALLENGE_MARKERS):
+                    self._save_debug_screenshot("login_challenge")
+                    raise CrawlerError("LinkedIn blocked the login with a security challenge")
+                if not redirected.satisfied:
                     # Take screenshot of any potential verification page
                     self._save_debug_screenshot("login_challenge")
                     logger.warning("Possible login challenge detected")
                 
+                self._save_session()
                 logger.info("Login attempt completed")
                 
             except (NoSuchElementException, TimeoutException) as e:
@@ -372,36 +414,28 @@ class LinkedInCrawler(BaseSeleniumCrawler):
     def extract(self, link: str, **kwargs) -> None:
         """Extract posts from LinkedIn profile with enhanced error handling."""
         try:
-            # Check if already crawled
-            existing_posts = self.model.bulk_find(link=link)
-            if existing_posts:
-                logger.info(f"Posts already exist for: {link}")
-                return
-
-            logger.info(f"Extracting posts from: {link}")
+            # Posts stored by earlier crawls; scrolling stops once it reaches one
+            known = {post.post_id for post in self.model.iter_find(link=link, projection=["post_id"])}
+            logger.info(f"Extracting posts from: {link} ({len(known)} already stored)")
             
             # Get user information
             user = kwargs.get("user")
             if not user:
                 raise ValueError("User information required")
 
-            # Login and navigate
-            self.login()
-            
-            # Navigate to profile with retry
-            for _ in range(3):
-                try:
-                    self.driver.get(link)
-                    WebDriverWait(self.driver, self.timeout).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                    break
-                except TimeoutException:
-                    logger.warning("Page load timeout, retrying...")
-                    time.sleep(3)
+            # Reuse the session if possible and navigate
+            self.ensure_session()
+            self._open_profile(link)
+            if self._session_expired():
+                logger.info("LinkedIn session expired, logging in again")
+                session_store.clear()
+                self.login()
+                self._open_profile(link)
+                if self._session_expired():
+                    raise CrawlerError("Could not establish a LinkedIn session")
             
             # Scroll and extract posts
-            self._scroll_and_extract_posts(link, user)
+            self._scroll_and_extract_posts(link, user, known)
             
         except Exception as e:
             logger.error(f"Post extraction failed: {str(e)}")
@@ -412,14 +446,78 @@ class LinkedInCrawler(BaseSeleniumCrawler):
                 pass
             raise CrawlerError(f"Post extraction failed: {str(e)}")
         finally:
-            # Always attempt to close the driver
+            # Always hand the driver back to the pool
+            self.release_driver()
+
+    def ensure_session(self) -> None:
+        """Make sure the driver carries a session, restoring or logging in as needed."""
+        if self._has_session_cookie():
+            logger.debug("Reusing LinkedIn session of pooled driver")
+            return
+
+        if self._restore_session():
+            logger.info("Restored LinkedIn session from session store")
+            return
+
+        self.login()
+
+    def _has_session_cookie(self) -> bool:
+        # Ask Chrome directly: pooled drivers are parked on about:blank, where
+        # get_cookie() only sees that document's (empty) cookie jar
+        try:
+            response = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": [LINKEDIN_HOME]})
+        except WebDriverException:
+            return False
+        return any(cookie["name"] == SESSION_COOKIE for cookie in response.get("cookies", []))
+
+    def _restore_session(self) -> bool:
+        """Load stored cookies into the driver."""
+        cookies = session_store.load()
+        if not cookies:
+            return False
+
+        # Cookies can only be set for the domain currently open
+        self.driver.get(LINKEDIN_HOME)
+        for cookie in cookies:
             try:
-                self.driver.quit()
-            except:
-                pass
+                self.driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.debug(f"Skipping stored cookie {cookie.get('name')}: {str(e)}")
+        return self._has_session_cookie()
+
+    def _save_session(self) -> None:
+        if not self._has_session_cookie():
+            logger.warning("No LinkedIn session cookie after login, not saving session")
+            return
+        session_store.save(self.driver.get_cookies())
 
-    def _scroll_and_extract_posts(self, link: str, user: UserDocument):
-        """Scroll through page and extract posts."""
+    def _session_expired(self) -> bool:
+        """Check whether LinkedIn redirected to a login page."""
+        current_url = self.driver.current_url
+        return any(marker in current_url for marker in LOGIN_URL_MARKERS)
+
+    def _open_profile(self, link: str) -> None:
+        """Navigate to a profile, retrying page load timeouts."""
+        for _ in range(3):
+            try:
+                self.driver.get(link)
+                WebDriverWait(self.driver, self.timeout).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                log_page_metrics(self.driver, link)
+                break
+            except TimeoutException:
+                logger.warning("Page load timeout, retrying...")
+                time.sleep(3)
+
+    def _scroll_and_extract_posts(self, link: str, user: UserDocument, known: set[str] | None = None):
+        """Scroll through page and extract posts.
+
+        Args:
+            link: Profile URL
+            user: Author of the posts
+            known: Post IDs already stored; reaching one stops scrolling
+        """
         # Attempt to click on posts tab
         try:
             posts_button = WebDriverWait(self.driver, 10).until(
@@ -429,50 +527,91 @@ class LinkedInCrawler(BaseSeleniumCrawler):
                 ))
             )
             posts_button.click()
-            time.sleep(3)
+            wait_for_stable_count(self.driver, POST_SELECTOR, name="posts tab")
         except Exception as e:
             logger.warning(f"Could not click posts button: {str(e)}")
 
-        # Scroll multiple times
-        for _ in range(self.scroll_limit):
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-
-        # Parse page
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        
-        # Find post elements
-        post_elements = soup.find_all(
-            "div", 
-            class_="update-components-text relative update-components-update-v2__commentary"
-        )
-        
-        # Limit posts to prevent overwhelming storage
-        post_elements = post_elements[:20]  # Limit to 20 most recent posts
+        if settings.LINKEDIN_INCREMENTAL:
+            posts_data = self._collect_posts_incrementally(link, known or set())
+        else:
+            posts_data = self._collect_posts_from_page()
         
         posts = []
-        for i, post_element in enumerate(post_elements):
+        for i, post_data in enumerate(posts_data):
             try:
-                post_text = post_element.get_text(strip=True)
-                
+                post_id = self._post_id(link, post_data)
+                if known and post_id in known:
+                    continue
+
+                content = {"text": post_data["text"], "index": i}
+                if post_data.get("urn"):
+                    content["urn"] = post_data["urn"]
+
                 # Create post document
                 post = self.model(
-                    content={
-                        "text": post_text,
-                        "index": i
-                    },
+                    content=content,
                     platform="linkedin",
                     author_id=user.id,  # This is now a UUID4
                     author_full_name=user.full_name,
-                    link=link
+                    link=link,
+                    post_id=post_id,
                 )
                 posts.append(post)
             except Exception as e:
                 logger.warning(f"Failed to process post {i}: {str(e)}")
         
-        # Bulk insert posts
+        # Bulk upsert posts; ones stored concurrently are skipped by post_id
         if posts:
-            self.model.bulk_insert(posts)
-            logger.info(f"Saved {len(posts)} posts from LinkedIn profile")
+            self.pending_writes.extend(bulk_writer.submit_many(posts))
+            logger.info(f"Queued {len(posts)} new posts from LinkedIn profile")
         else:
-            logger.warning("No posts found to save")
\ No newline at end of file
+            logger.info("No new posts found to save")
+
+    def _collect_posts_incrementally(self, link: str, known: set[str]) -> list[dict]:
+        """Extract posts as they render, scrolling only until enough are collected.
+
+        After each scroll, an in-page script returns only the posts rendered
+        since the previous call and strips their media, so neither the page
+        source nor the DOM's images have to be held. Stops at LINKEDIN_MAX_POSTS
+        posts, at the first already-stored post, when a scroll renders nothing
+        new, or after `scroll_limit` scrolls.
+        """
+        collected: list[dict] = []
+        seen: set[str] = set()
+        for scroll in range(self.scroll_limit + 1):
+            new_posts = self.driver.execute_script(COLLECT_NEW_POSTS_SCRIPT, POST_SELECTOR) or []
+            for post_data in new_posts:
+                key = self._post_id(link, post_data)
+                if key in known:
+                    logger.info(f"Reached an already stored post after {len(collected)} new post(s)")
+                    return collected
+                if key in seen or not post_data.get("text"):
+                    continue
+
+                seen.add(key)
+                collected.append(post_data)
+                if len(collected) >= settings.LINKEDIN_MAX_POSTS:
+                    return collected
+
+            if scroll == self.scroll_limit or (scroll and not new_posts):
+                break
+
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            wait_for_page_settled(self.driver, name="feed scroll")
+
+        return collected
+
+    def _collect_posts_from_page(self) -> list[dict]:
+        """Scroll `scroll_limit` times, then extract posts from the final page."""
+        for _ in range(self.scroll_limit):
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            wait_for_page_settled(self.driver, name="feed scroll")
+
+        # Parse only the post subtrees of the page
+        document = parse_html(self.driver.page_source, only=POST_SELECTOR)
+        
+        # Limit posts to prevent overwhelming storage
+        return [{"text": text} for text in document.texts(POST_SELECTOR, limit=settings.LINKEDIN_MAX_POSTS)]
+
+    def _post_id(self, link: str, post_data: dict) -> str:
+        return self.model.make_post_id(link, post_data.get("text", ""), post_data.get("urn"))
@@ -297,12 +297,17 @@ from urllib.parse import urlparse
 from llmops_datacollection.domain.documents import ArticleDocument
 from .base import BaseSeleniumCrawler
 
-from bs4 import BeautifulSoup
 from loguru import logger
 
+from llmops_datacollection.application.utils.article import extract_sections, sections_to_text
+from llmops_datacollection.application.utils.html import HtmlDocument, parse_html
+from llmops_datacollection.application.utils.http import fetch_html
 from llmops_datacollection.domain.documents import ArticleDocument
+from llmops_datacollection.domain.writer import bulk_writer
+from llmops_datacollection.settings import settings
 
 from .base import BaseSeleniumCrawler
+from .blocking import log_page_metrics
 
 
 class MediumCrawler(BaseSeleniumCrawler):
@@ -320,29 +325,60 @@ class MediumCrawler(BaseSeleniumCrawler):
 
         logger.info(f"Starting scrapping Medium article: {link}")
 
-        self.driver.get(link)
-        self.scroll_page()
-
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        title = soup.find_all("h1", class_="pw-post-title")
-        subtitle = soup.find_all("h2", class_="pw-subtitle-paragraph")
-
-        data = {
-            "Title": title[0].string if title else None,
-            "Subtitle": subtitle[0].string if subtitle else None,
-            "Content": soup.get_text(),
-        }
-
-        self.driver.close()
+        data = self._scrape_article(link)
 
         user = kwargs["user"]
         instance = self.model(
             platform="medium",
             content=data,
             link=link,
+            title=data["Title"] or "Untitled",
             author_id=user.id,
             author_full_name=user.full_name,
         )
-        instance.save()
-
-        logger.info(f"Successfully scraped and saved article: {link}")
+        self.pending_writes.append(bulk_writer.submit(instance))
+
+        logger.info(f"Successfully scraped article: {link}")
+
+    def _scrape_article(self, link: str) -> dict:
+        """Scrape the article, over plain HTTP when the page allows it."""
+        if settings.MEDIUM_HTTP_FETCH:
+            if (html := fetch_html(link)) is not None:
+                document = parse_html(html)
+                if self._has_article_markup(document):
+                    logger.info(f"Fetched Medium article over HTTP: {link}")
+                    return self._parse_article(document)
+
+            logger.info(f"Article markup missing from HTTP response, using browser: {link}")
+
+        try:
+            self.driver.get(link)
+            log_page_metrics(self.driver, link)
+            self.scroll_page()
+            document = parse_html(self.driver.page_source)
+        finally:
+            self.release_driver()
+
+        return self._parse_article(document)
+
+    @staticmethod
+    def _has_article_markup(document: HtmlDocument) -> bool:
+        """Check that server-rendered HTML contains the elements we extract."""
+        return document.exists("h1.pw-post-title") and document.exists("article")
+
+    @staticmethod
+    def _parse_article(document: HtmlDocument) -> dict:
+        """Extract article fields from the parsed page.
+
+        Content holds the main article text only (no navigation, footers or
+        recommendations), and Sections its headings, paragraphs and code
+        blocks. Pages without article markup fall back to the whole page text.
+        """
+        sections = extract_sections(document) or []
+
+        return {
+            "Title": document.first_text("h1.pw-post-title"),
+            "Subtitle": document.first_text("h2.pw-subtitle-paragraph"),
+            "Content": sections_to_text(sections) if sections else document.text(),
+            "Sections": [section.model_dump(exclude_none=True) for section in sections],
+        }
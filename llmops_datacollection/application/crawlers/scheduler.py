@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from llmops_datacollection.settings import DomainLimits
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def time_until_available(self) -> float:
+        """Seconds until the next token becomes available."""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+
+class DomainScheduler:
+    """Hand out queued crawl tasks round-robin across domains.
+
+    Each domain gets its own token bucket and in-flight cap, so a slow or
+    strictly limited platform never blocks tasks for the others.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, DomainLimits],
+        default: DomainLimits,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = limits
+        self._default = default
+        self._clock = clock
+        self._queues: dict[str, deque] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._in_flight: dict[str, int] = {}
+        self._order: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def limits_for(self, domain: str) -> DomainLimits:
+        """Get the configured limits for a domain."""
+        return self._limits.get(domain, self._default)
+
+    def add(self, domain: str, task: Any) -> None:
+        """Queue a task under its domain."""
+        with self._lock:
+            if domain not in self._queues:
+                limits = self.limits_for(domain)
+                self._queues[domain] = deque()
+                self._buckets[domain] = TokenBucket(limits.rate, limits.burst, self._clock)
+                self._in_flight[domain] = 0
+                self._order.append(domain)
+            self._queues[domain].append(task)
+
+    def next_ready(self) -> tuple[str, Any] | None:
+        """Pop the next task whose domain has both a free slot and a token."""
+        with self._lock:
+            for _ in range(len(self._order)):
+                domain = self._order[0]
+                self._order.rotate(-1)
+                if self._is_eligible(domain) and self._buckets[domain].try_acquire():
+                    self._in_flight[domain] += 1
+                    return domain, self._queues[domain].popleft()
+            return None
+
+    def release(self, domain: str) -> None:
+        """Mark a task of the given domain as finished."""
+        with self._lock:
+            self._in_flight[domain] = max(0, self._in_flight[domain] - 1)
+
+    def time_until_ready(self) -> float | None:
+        """Seconds until some queued task can start.
+
+        Returns None when every domain with queued tasks is at its in-flight
+        cap, meaning the caller has to wait for a running task to finish.
+        """
+        with self._lock:
+            waits = [
+                self._buckets[domain].time_until_available()
+                for domain in self._order
+                if self._is_eligible(domain)
+            ]
+            return min(waits) if waits else None
+
+    def _is_eligible(self, domain: str) -> bool:
+        return bool(self._queues[domain]) and (
+            self._in_flight[domain] < self.limits_for(domain).max_in_flight
+        )
@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+import time
+
+from loguru import logger
+
+from llmops_datacollection.domain.exceptions import ImproperlyConfigured
+
+# Cookie fields Selenium accepts back in `add_cookie`
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "expiry")
+
+
+class SessionStore:
+    """Encrypted on-disk store for browser session cookies.
+
+    Cookies are serialised to JSON and encrypted with Fernet using `key`, so
+    the store file is useless without the key. Without a key, sessions are
+    only kept in memory for the lifetime of the process.
+    """
+
+    def __init__(self, path: str, key: str | None) -> None:
+        self.path = path
+        self._key = key
+        self._lock = threading.Lock()
+        self._cookies: list[dict] | None = None
+
+    def load(self) -> list[dict]:
+        """Get the stored cookies that have not expired yet."""
+        with self._lock:
+            if self._cookies is None:
+                self._cookies = self._read()
+            now = time.time()
+            return [cookie for cookie in self._cookies if cookie.get("expiry", now + 1) > now]
+
+    def save(self, cookies: list[dict]) -> None:
+        """Replace the stored cookies."""
+        cookies = [{k: v for k, v in cookie.items() if k in COOKIE_FIELDS} for cookie in cookies]
+        with self._lock:
+            self._cookies = cookies
+            if not self._key:
+                return
+
+            token = self._cipher().encrypt(json.dumps(cookies).encode())
+            temp_path = f"{self.path}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(temp_path, self.path)
+        logger.debug(f"Saved {len(cookies)} session cookie(s) to {self.path}")
+
+    def clear(self) -> None:
+        """Forget the stored cookies, e.g. once the session has expired."""
+        with self._lock:
+            self._cookies = []
+            if os.path.exists(self.path):  # noqa: PTH110
+                os.remove(self.path)  # noqa: PTH107
+
+    def _read(self) -> list[dict]:
+        if not self._key or not os.path.exists(self.path):  # noqa: PTH110
+            return []
+
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self.path, "rb") as f:  # noqa: PTH123
+                return json.loads(self._cipher().decrypt(f.read()))
+        except (InvalidToken, OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session store {self.path}: {type(e).__name__}")
+            return []
+
+    def _cipher(self):
+        # Imported lazily: only needed when sessions are persisted
+        from cryptography.fernet import Fernet
+
+        try:
+            return Fernet(self._key)
+        except ValueError as e:
+            raise ImproperlyConfigured(f"Invalid session store key: {str(e)}") from e
@@ -0,0 +1,181 @@
+import threading
+import time
+from typing import Any, Callable
+
+from loguru import logger
+from pydantic import BaseModel
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from llmops_datacollection.settings import settings
+
+# Counts DOM mutations on the current page; installed once per document
+MUTATION_COUNTER_SCRIPT = """
+if (window.__llmopsMutations === undefined) {
+    window.__llmopsMutations = 0;
+    new MutationObserver(function (mutations) {
+        window.__llmopsMutations += mutations.length;
+    }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return window.__llmopsMutations;
+"""
+
+NETWORK_STATE_SCRIPT = """
+if (document.readyState !== "complete") { return null; }
+return performance.getEntriesByType("resource").length;
+"""
+
+# Page height plus resource count: stable once scrolling stopped pulling in content
+PAGE_STATE_SCRIPT = """
+if (document.readyState !== "complete") { return null; }
+return [document.body.scrollHeight, performance.getEntriesByType("resource").length];
+"""
+
+
+class WaitResult(BaseModel):
+    """Outcome of a single adaptive wait."""
+
+    name: str
+    satisfied: bool
+    elapsed: float
+
+
+class WaitStats:
+    """Thread-safe totals of the time spent in adaptive waits, per wait name."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: dict[str, dict[str, float]] = {}
+
+    def record(self, result: WaitResult) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(result.name, {"count": 0, "seconds": 0.0, "timeouts": 0})
+            totals["count"] += 1
+            totals["seconds"] += result.elapsed
+            totals["timeouts"] += int(not result.satisfied)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Get the totals per wait name, with seconds rounded for reporting."""
+        with self._lock:
+            return {
+                name: dict(totals, seconds=round(totals["seconds"], 3))
+                for name, totals in self._totals.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+
+def wait_until(
+    name: str,
+    predicate: Callable[[], bool],
+    timeout: float | None = None,
+    poll: float | None = None,
+) -> WaitResult:
+    """Poll `predicate` until it holds or `timeout` seconds have passed.
+
+    Returns as soon as the condition is met; a WebDriverException raised by
+    the predicate counts as "not yet".
+    """
+    timeout = settings.WAIT_TIMEOUT if timeout is None else timeout
+    poll = poll or settings.WAIT_POLL_INTERVAL
+    start = time.monotonic()
+
+    satisfied = _check(predicate)
+    while not satisfied and time.monotonic() - start < timeout:
+        time.sleep(poll)
+        satisfied = _check(predicate)
+
+    return _finish(name, satisfied, start)
+
+
+def wait_until_stable(
+    name: str,
+    probe: Callable[[], Any],
+    quiet_period: float | None = None,
+    timeout: float | None = None,
+    poll: float | None = None,
+) -> WaitResult:
+    """Poll `probe` until its value stops changing for `quiet_period` seconds.
+
+    A None value (or a WebDriverException) means the page is not ready yet
+    and never counts as stable.
+    """
+    quiet_period = settings.WAIT_QUIET_PERIOD if quiet_period is None else quiet_period
+    timeout = settings.WAIT_TIMEOUT if timeout is None else timeout
+    poll = poll or settings.WAIT_POLL_INTERVAL
+    start = time.monotonic()
+
+    value = _probe(probe)
+    changed_at = start
+    while True:
+        now = time.monotonic()
+        if value is not None and now - changed_at >= quiet_period:
+            return _finish(name, True, start)
+        if now - start >= timeout:
+            return _finish(name, False, start)
+
+        time.sleep(poll)
+        if (new_value := _probe(probe)) != value:
+            value = new_value
+            changed_at = time.monotonic()
+
+
+def wait_for_dom_quiet(driver: WebDriver, name: str = "dom quiet", **kwargs) -> WaitResult:
+    """Wait until no DOM mutations happen for the quiet period."""
+    return wait_until_stable(name, lambda: driver.execute_script(MUTATION_COUNTER_SCRIPT), **kwargs)
+
+
+def wait_for_network_idle(driver: WebDriver, name: str = "network idle", **kwargs) -> WaitResult:
+    """Wait until the page has loaded and no new resources are fetched for the quiet period."""
+    return wait_until_stable(name, lambda: driver.execute_script(NETWORK_STATE_SCRIPT), **kwargs)
+
+
+def wait_for_page_settled(driver: WebDriver, name: str = "page settled", **kwargs) -> WaitResult:
+    """Wait until neither the page height nor its resource count change for the quiet period."""
+    return wait_until_stable(name, lambda: driver.execute_script(PAGE_STATE_SCRIPT), **kwargs)
+
+
+def wait_for_stable_count(
+    driver: WebDriver,
+    css_selector: str,
+    name: str = "element count",
+    min_count: int = 1,
+    **kwargs,
+) -> WaitResult:
+    """Wait until at least `min_count` elements match and their number stops changing."""
+
+    def count() -> int | None:
+        found = len(driver.find_elements(By.CSS_SELECTOR, css_selector))
+        return found if found >= min_count else None
+
+    return wait_until_stable(name, count, **kwargs)
+
+
+def _check(predicate: Callable[[], bool]) -> bool:
+    try:
+        return bool(predicate())
+    except WebDriverException:
+        return False
+
+
+def _probe(probe: Callable[[], Any]) -> Any:
+    try:
+        return probe()
+    except WebDriverException:
+        return None
+
+
+def _finish(name: str, satisfied: bool, start: float) -> WaitResult:
+    result = WaitResult(name=name, satisfied=satisfied, elapsed=time.monotonic() - start)
+    wait_stats.record(result)
+    logger.debug(
+        f"Wait for {name} {'done' if satisfied else 'timed out'} after {result.elapsed:.2f}s"
+    )
+    return result
+
+
+# Global wait statistics, reported per crawl step
+wait_stats = WaitStats()
@@ -1,3 +1,19 @@
+from .article import Section, extract_sections, sections_to_text
+from .html import HtmlDocument, HtmlElement, parse_html
+from .http import fetch_html, get_session
 from .text import clean_text, extract_urls, normalize_url, split_full_name
 
-__all__ = ["clean_text", "extract_urls", "normalize_url", "split_full_name"]
\ No newline at end of file
+__all__ = [
+    "HtmlDocument",
+    "HtmlElement",
+    "Section",
+    "clean_text",
+    "extract_sections",
+    "extract_urls",
+    "fetch_html",
+    "get_session",
+    "normalize_url",
+    "parse_html",
+    "sections_to_text",
+    "split_full_name",
+]
\ No newline at end of file
@@ -0,0 +1,127 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+from .html import HtmlDocument, HtmlElement
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+TEXT_TAGS = ("p", "li", "blockquote", "figcaption")
+BLOCK_TAGS = HEADING_TAGS + TEXT_TAGS + ("pre",)
+
+# Elements whose text never belongs to the article body
+NOISE_TAGS = ("script", "style", "noscript", "nav", "aside", "footer", "form", "button", "svg")
+
+# Blocks mostly made of link text (tag lists, "more from" rows) are navigation
+MAX_LINK_DENSITY = 0.5
+
+# Siblings of the best container scoring at least this share of it are kept too
+SIBLING_SCORE_RATIO = 0.2
+
+
+class Section(BaseModel):
+    """A heading, paragraph or code block of an article."""
+
+    type: Literal["heading", "paragraph", "code"]
+    text: str
+    level: int | None = None  # Heading level
+
+
+def extract_sections(document: HtmlDocument, root_selector: str = "article") -> list[Section] | None:
+    """Extract the main content under `root_selector` as structured sections.
+
+    The tree is walked with the document's own parser backend, and noise
+    elements (scripts, navigation, ...) under the root are removed from
+    `document`. Within the root, paragraphs score their parent (and half
+    their grandparent) readability-style, by length and commas, discounted
+    by link density. The best container, plus siblings scoring close to it,
+    is turned into sections in document order.
+
+    Returns:
+        list[Section] | None: Sections, or None when no root element exists
+    """
+    if (root := document.element(root_selector)) is None:
+        return None
+
+    for element in root.find_all(NOISE_TAGS):
+        element.decompose()
+
+    return [section for container in _main_containers(root) for section in _sections(container)]
+
+
+def sections_to_text(sections: list[Section]) -> str:
+    """Join sections into plain text, one block per paragraph."""
+    return "\n\n".join(section.text for section in sections)
+
+
+def _main_containers(root: HtmlElement) -> list[HtmlElement]:
+    outside = root.parent
+    scores: dict[HtmlElement, float] = {}
+    for paragraph in root.find_all(("p", "pre")):
+        text = _clean(paragraph.text())
+        if len(text) < 25:
+            continue
+
+        score = 1 + text.count(",") + min(len(text) / 100, 3)
+        parent = paragraph.parent
+        grandparent = parent.parent if parent is not None else None
+        for element, weight in ((parent, 1.0), (grandparent, 0.5)):
+            if element is not None and element != outside:
+                scores[element] = scores.get(element, 0.0) + score * weight
+
+    if not scores:
+        return [root]
+
+    ranked = {element: score * (1 - _link_density(element)) for element, score in scores.items()}
+    best, best_score = max(ranked.items(), key=lambda item: item[1])
+    if best == root:
+        return [best]
+
+    # Keep siblings that look like a continuation of the body (e.g. the next <section>)
+    return [
+        sibling for sibling in best.parent.children()
+        if sibling == best or ranked.get(sibling, 0.0) >= best_score * SIBLING_SCORE_RATIO
+    ]
+
+
+def _sections(container: HtmlElement) -> list[Section]:
+    sections = []
+    for block in container.find_all(BLOCK_TAGS):
+        if _is_nested(block, container):
+            continue
+
+        if block.tag == "pre":
+            if code := block.text().strip("\n"):
+                sections.append(Section(type="code", text=code))
+            continue
+
+        text = _clean(block.text())
+        if not text or _link_density(block) > MAX_LINK_DENSITY:
+            continue
+
+        if block.tag in HEADING_TAGS:
+            sections.append(Section(type="heading", text=text, level=int(block.tag[1])))
+        else:
+            sections.append(Section(type="paragraph", text=text))
+    return sections
+
+
+def _is_nested(block: HtmlElement, container: HtmlElement) -> bool:
+    """Check whether an outer block (a <li> around a <p>) already covers `block`."""
+    for parent in block.ancestors():
+        if parent == container:
+            return False
+        if parent.tag in BLOCK_TAGS:
+            return True
+    return False
+
+
+def _link_density(element: HtmlElement) -> float:
+    text_length = len(_clean(element.text()))
+    if not text_length:
+        return 0.0
+    link_length = sum(len(_clean(link.text())) for link in element.find_all(("a",)))
+    return link_length / text_length
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.split())
@@ -0,0 +1,316 @@
+import importlib.util
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Iterator
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from llmops_datacollection.domain.exceptions import ImproperlyConfigured
+from llmops_datacollection.settings import settings
+
+# Fastest first; BeautifulSoup with the stdlib parser is always available
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+# "tag", ".class" or "tag.class1.class2": selectors simple enough for a SoupStrainer
+SIMPLE_SELECTOR = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<classes>(?:\.[\w-]+)+)?$")
+
+
+class HtmlElement(ABC):
+    """Element of a parsed page, for walking its tree.
+
+    Wrappers of the same element compare equal, so elements can key dicts.
+    """
+
+    @property
+    @abstractmethod
+    def tag(self) -> str:
+        """Lowercase tag name."""
+
+    @property
+    @abstractmethod
+    def parent(self) -> "HtmlElement | None":
+        """Parent element, or None at the top of the tree."""
+
+    @abstractmethod
+    def text(self) -> str:
+        """Get the unstripped text of the element, as BeautifulSoup's `get_text()` returns it."""
+
+    @abstractmethod
+    def children(self) -> list["HtmlElement"]:
+        """Get the child elements, in document order."""
+
+    @abstractmethod
+    def find_all(self, tags: tuple[str, ...]) -> list["HtmlElement"]:
+        """Get the descendant elements with one of `tags`, in document order."""
+
+    @abstractmethod
+    def decompose(self) -> None:
+        """Remove the element and everything in it from the document."""
+
+    def ancestors(self) -> Iterator["HtmlElement"]:
+        """Walk up from the parent to the top of the tree."""
+        parent = self.parent
+        while parent is not None:
+            yield parent
+            parent = parent.parent
+
+    @abstractmethod
+    def _key(self) -> object:
+        """Identity of the wrapped element."""
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, HtmlElement) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+
+class HtmlDocument(ABC):
+    """Parsed HTML page, queried with CSS selectors.
+
+    Element text is the element's stripped text pieces joined together, as
+    BeautifulSoup's `get_text(strip=True)` returns it.
+    """
+
+    @abstractmethod
+    def texts(self, selector: str, limit: int | None = None) -> list[str]:
+        """Get the text of every element matching `selector`, in document order."""
+
+    def first_text(self, selector: str) -> str | None:
+        """Get the text of the first element matching `selector`, or None."""
+        texts = self.texts(selector, limit=1)
+        return texts[0] if texts else None
+
+    def exists(self, selector: str) -> bool:
+        """Check whether any element matches `selector`."""
+        return self.first_text(selector) is not None
+
+    @abstractmethod
+    def text(self) -> str:
+        """Get the text of the whole document."""
+
+    @abstractmethod
+    def outer_html(self, selector: str) -> str | None:
+        """Get the markup of the first element matching `selector`, or None."""
+
+    @abstractmethod
+    def element(self, selector: str) -> HtmlElement | None:
+        """Get the first element matching `selector`, or None."""
+
+
+class SelectolaxElement(HtmlElement):
+    def __init__(self, node) -> None:
+        self._node = node
+
+    @property
+    def tag(self) -> str:
+        return self._node.tag
+
+    @property
+    def parent(self) -> HtmlElement | None:
+        parent = self._node.parent
+        return SelectolaxElement(parent) if parent is not None else None
+
+    def text(self) -> str:
+        return self._node.text()
+
+    def children(self) -> list[HtmlElement]:
+        # Comments and other non-element nodes have tags like "-comment"
+        return [SelectolaxElement(node) for node in self._node.iter() if not node.tag.startswith("-")]
+
+    def find_all(self, tags: tuple[str, ...]) -> list[HtmlElement]:
+        return [SelectolaxElement(node) for node in self._node.css(", ".join(tags))]
+
+    def decompose(self) -> None:
+        self._node.decompose()
+
+    def _key(self) -> object:
+        return self._node.mem_id
+
+
+class LxmlElement(HtmlElement):
+    def __init__(self, element) -> None:
+        self._element = element
+
+    @property
+    def tag(self) -> str:
+        return self._element.tag
+
+    @property
+    def parent(self) -> HtmlElement | None:
+        parent = self._element.getparent()
+        return LxmlElement(parent) if parent is not None else None
+
+    def text(self) -> str:
+        return self._element.text_content()
+
+    def children(self) -> list[HtmlElement]:
+        # Comments and processing instructions have a function as tag
+        return [LxmlElement(child) for child in self._element if isinstance(child.tag, str)]
+
+    def find_all(self, tags: tuple[str, ...]) -> list[HtmlElement]:
+        return [LxmlElement(element) for element in self._element.iterdescendants(*tags)]
+
+    def decompose(self) -> None:
+        self._element.drop_tree()
+
+    def _key(self) -> object:
+        # lxml hands out the same proxy for an element while any reference to it lives
+        return id(self._element)
+
+
+class SoupElement(HtmlElement):
+    def __init__(self, tag) -> None:
+        self._tag = tag
+
+    @property
+    def tag(self) -> str:
+        return self._tag.name
+
+    @property
+    def parent(self) -> HtmlElement | None:
+        return SoupElement(self._tag.parent) if self._tag.parent is not None else None
+
+    def text(self) -> str:
+        return self._tag.get_text()
+
+    def children(self) -> list[HtmlElement]:
+        return [SoupElement(tag) for tag in self._tag.find_all(True, recursive=False)]
+
+    def find_all(self, tags: tuple[str, ...]) -> list[HtmlElement]:
+        return [SoupElement(tag) for tag in self._tag.find_all(tags)]
+
+    def decompose(self) -> None:
+        self._tag.decompose()
+
+    def _key(self) -> object:
+        # Tags compare equal by markup, so identity has to come from the object
+        return id(self._tag)
+
+
+class SelectolaxDocument(HtmlDocument):
+    def __init__(self, html: str) -> None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._tree = LexborHTMLParser(html)
+
+    def texts(self, selector: str, limit: int | None = None) -> list[str]:
+        nodes = self._tree.css(selector)
+        return [node.text(strip=True) for node in nodes[:limit]]
+
+    def text(self) -> str:
+        return self._tree.root.text() if self._tree.root is not None else ""
+
+    def outer_html(self, selector: str) -> str | None:
+        node = self._tree.css_first(selector)
+        return node.html if node is not None else None
+
+    def element(self, selector: str) -> HtmlElement | None:
+        node = self._tree.css_first(selector)
+        return SelectolaxElement(node) if node is not None else None
+
+
+class LxmlDocument(HtmlDocument):
+    def __init__(self, html: str) -> None:
+        import lxml.html
+
+        self._root = lxml.html.fromstring(html) if html.strip() else None
+
+    def texts(self, selector: str, limit: int | None = None) -> list[str]:
+        if self._root is None:
+            return []
+        elements = self._root.cssselect(selector)
+        return ["".join(piece.strip() for piece in element.itertext()) for element in elements[:limit]]
+
+    def text(self) -> str:
+        return self._root.text_content() if self._root is not None else ""
+
+    def outer_html(self, selector: str) -> str | None:
+        import lxml.html
+
+        elements = self._root.cssselect(selector) if self._root is not None else []
+        return lxml.html.tostring(elements[0], encoding="unicode", with_tail=False) if elements else None
+
+    def element(self, selector: str) -> HtmlElement | None:
+        elements = self._root.cssselect(selector) if self._root is not None else []
+        return LxmlElement(elements[0]) if elements else None
+
+
+class SoupDocument(HtmlDocument):
+    def __init__(self, html: str, only: str | None = None) -> None:
+        self._soup = BeautifulSoup(html, "html.parser", parse_only=_strainer(only) if only else None)
+
+    def texts(self, selector: str, limit: int | None = None) -> list[str]:
+        return [element.get_text(strip=True) for element in self._soup.select(selector, limit=limit)]
+
+    def text(self) -> str:
+        return self._soup.get_text()
+
+    def outer_html(self, selector: str) -> str | None:
+        element = self._soup.select_one(selector)
+        return str(element) if element is not None else None
+
+    def element(self, selector: str) -> HtmlElement | None:
+        element = self._soup.select_one(selector)
+        return SoupElement(element) if element is not None else None
+
+
+def parse_html(html: str, only: str | None = None, backend: str | None = None) -> HtmlDocument:
+    """Parse a page with the configured (or fastest available) backend.
+
+    Args:
+        html: Page source
+        only: Selector of the only subtrees the caller will query. The
+            BeautifulSoup fallback then builds just those subtrees; the
+            native backends parse everything faster than it could skip.
+        backend: "selectolax", "lxml" or "html.parser" (defaults to settings.HTML_PARSER)
+
+    Returns:
+        HtmlDocument: Parsed page
+    """
+    backend = resolve_backend(backend or settings.HTML_PARSER)
+    if backend == "selectolax":
+        return SelectolaxDocument(html)
+    if backend == "lxml":
+        return LxmlDocument(html)
+    return SoupDocument(html, only)
+
+
+def installed_backends() -> list[str]:
+    """Get the installed backends, fastest first."""
+    return [backend for backend in BACKENDS if _installed(backend)]
+
+
+@lru_cache
+def resolve_backend(name: str) -> str:
+    """Resolve "auto" to the fastest installed backend, and check the others are installed."""
+    if name == "auto":
+        return installed_backends()[0]
+    if name not in BACKENDS:
+        raise ImproperlyConfigured(f"Unknown HTML parser '{name}', expected one of {', '.join(BACKENDS)}")
+    if not _installed(name):
+        raise ImproperlyConfigured(f"HTML parser '{name}' is not installed")
+    return name
+
+
+def _installed(backend: str) -> bool:
+    if backend == "lxml":
+        # CSS selectors need cssselect on top of lxml
+        return all(importlib.util.find_spec(module) for module in ("lxml", "cssselect"))
+    if backend == "selectolax":
+        return importlib.util.find_spec("selectolax") is not None
+    return True
+
+
+def _strainer(selector: str) -> SoupStrainer | None:
+    """Build a SoupStrainer keeping the subtrees `selector` matches, when it is simple enough."""
+    if (match := SIMPLE_SELECTOR.match(selector)) is None or not selector:
+        return None
+
+    classes = set(match["classes"].lstrip(".").split(".")) if match["classes"] else set()
+    # Multi-valued class attributes are also matched as one space-joined string
+    return SoupStrainer(
+        match["tag"],
+        attrs={"class": lambda value: bool(value) and classes <= set(value.split())} if classes else {},
+    )
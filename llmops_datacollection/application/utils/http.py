@@ -0,0 +1,50 @@
+import threading
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from llmops_datacollection.settings import settings
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_local = threading.local()
+
+def get_session() -> requests.Session:
+    """Get this thread's keep-alive HTTP session."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_SIZE,
+            pool_maxsize=settings.HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        _local.session = session
+    return session
+
+def fetch_html(url: str) -> str | None:
+    """Fetch a page over plain HTTP, returning None on any failure."""
+    try:
+        response = get_session().get(url, timeout=settings.HTTP_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning(f"HTTP fetch failed for {url}: {str(e)}")
+        return None
+
+    if "html" not in response.headers.get("Content-Type", ""):
+        logger.warning(f"HTTP fetch for {url} returned non-HTML content")
+        return None
+
+    return response.text
@@ -1,22 +1,36 @@
+import asyncio
 import uuid
 from abc import ABC
-from typing import Any, ClassVar, Dict, Generic, Type, TypeVar
+from functools import cache
+from typing import Any, ClassVar, Dict, Generic, Iterator, Type, TypeVar, get_args
 
 from loguru import logger
 from pydantic import BaseModel, Field, ConfigDict
 from pydantic.types import UUID4
-from pymongo import errors
+from pymongo import ASCENDING, IndexModel, ReturnDocument, UpdateOne, errors
+from pymongo.asynchronous.collection import AsyncCollection
 
 from llmops_datacollection.domain.exceptions import DatabaseError
-from llmops_datacollection.infrastructure.db.mongo import connection
+from llmops_datacollection.infrastructure.db.mongo import ThreadedAsyncCollection, async_connection, connection
 
 T = TypeVar("T", bound="NoSQLBaseDocument")
 
+def _contains_uuid(annotation: Any) -> bool:
+    """Check whether a field annotation can hold a UUID at any depth."""
+    if isinstance(annotation, type):
+        if issubclass(annotation, uuid.UUID):
+            return True
+        if issubclass(annotation, BaseModel):
+            return any(_contains_uuid(field.annotation) for field in annotation.model_fields.values())
+    return any(_contains_uuid(arg) for arg in get_args(annotation))
+
 class NoSQLBaseDocument(BaseModel, ABC):
     """Base document model with MongoDB integration."""
     
     id: UUID4 = Field(default_factory=uuid.uuid4, alias="_id")
     _collection: ClassVar[str | None] = None
+    _indexes: ClassVar[list[IndexModel]] = []
+    _natural_key: ClassVar[tuple[str, ...]] = ()  # Fields identifying a unique document
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -41,52 +55,109 @@ class NoSQLBaseDocument(BaseModel, ABC):
     def collection_exists(cls) -> bool:
         """Check if collection exists in MongoDB."""
         try:
-            collection_names = connection.list_collection_names()
-            return cls._collection in collection_names
+            return connection.collection_exists(cls._collection)
         except errors.OperationFailure as e:
             logger.error(f"Failed to check collection existence: {str(e)}")
             raise DatabaseError(f"Failed to check collection: {str(e)}")
 
     @classmethod
     def get_collection_name(cls) -> str:
-        """Get or create MongoDB collection name."""
+        """Get or create MongoDB collection name.
+
+        The collection is created and indexed on first use only; after that
+        the connector's metadata cache answers without a server round-trip.
+        """
         if cls._collection is None:
             raise ValueError(f"Collection name not set for {cls.__name__}")
-            
-        try:
-            # Get existing collection
-            connection.get_collection(cls._collection)
-        except errors.OperationFailure:
+
+        if not connection.metadata.is_ready(cls._collection):
+            cls.ensure_indexes()
+
+        return cls._collection
+
+    @classmethod
+    def ensure_indexes(cls) -> None:
+        """Create the collection, if missing, and the indexes declared on the document class."""
+        if not connection.collection_exists(cls._collection):
             logger.info(f"Collection {cls._collection} does not exist, creating...")
             try:
                 # Create new collection 
                 connection.create_collection(cls._collection)
                 logger.info(f"Successfully created collection {cls._collection}")
-            except errors.CollectionInvalid:
+            except DatabaseError as e:
                 # Collection might have been created by another process
-                pass
-            except Exception as e:
-                logger.error(f"Failed to create collection {cls._collection}: {str(e)}")
-                raise DatabaseError(f"Failed to create collection: {str(e)}")
-                
-        return cls._collection
+                if not isinstance(e.__cause__, errors.CollectionInvalid):
+                    logger.error(f"Failed to create collection {cls._collection}: {str(e)}")
+                    raise
+
+        if cls._indexes:
+            collection = connection.get_collection(cls._collection)
+            try:
+                names = collection.create_indexes(cls._indexes)
+                logger.info(f"Ensured indexes on {cls._collection}: {', '.join(names)}")
+            except errors.OperationFailure as e:
+                # Usually duplicates stored before a unique index existed
+                logger.error(f"Failed to create indexes on {cls._collection}: {str(e)}")
+
+        connection.metadata.mark_ready(cls._collection)
+
+    @classmethod
+    def invalidate_metadata(cls) -> None:
+        """Forget the cached metadata of this collection, e.g. after it was dropped externally."""
+        connection.metadata.invalidate(cls._collection)
+
+    @classmethod
+    @cache
+    def _uuid_fields(cls) -> tuple[str, ...] | None:
+        """Top-level fields declared as UUIDs, or None if UUIDs may be nested deeper."""
+        fields = []
+        for name, field in cls.model_fields.items():
+            args = [arg for arg in get_args(field.annotation) if arg is not type(None)]
+            if _contains_uuid(field.annotation):
+                if field.annotation is not uuid.UUID and args != [uuid.UUID]:
+                    return None
+                fields.append(field.alias or name)
+        return tuple(fields)
+
+    def _to_prepared_mongo(self: T) -> dict:
+        """Convert to a MongoDB document with UUIDs encoded for insertion."""
+        # Undeclared extra fields could hold UUIDs anywhere, so walk the whole document
+        uuid_fields = None if self.model_extra else self._uuid_fields()
+        return connection.prepare_document_for_insertion(self.to_mongo(), uuid_fields)
+
+    @classmethod
+    def _upsert_args(cls, prepared_doc: dict) -> tuple[dict, dict]:
+        """Filter and update that insert a document unless its natural key is stored."""
+        key_filter = {key: prepared_doc[key] for key in cls._natural_key}
+        return key_filter, {"$setOnInsert": prepared_doc}
+
+    @classmethod
+    def _get_or_create_update(cls, filter_options: dict) -> dict:
+        """Update that fills in a new document's defaults when the filter matches nothing."""
+        new_doc = cls(**filter_options)._to_prepared_mongo()
+        return {"$setOnInsert": {key: value for key, value in new_doc.items() if key not in filter_options}}
 
     @classmethod
     def get_or_create(cls: Type[T], **filter_options) -> T:
-        """Get an existing document or create a new one."""
+        """Get an existing document or atomically create a new one."""
         collection = connection.get_collection(cls.get_collection_name())
         try:
-            # Try to find existing document
-            if existing := collection.find_one(filter_options):
-                return cls.from_mongo(existing)
-                
-            # Create new document if not found
-            new_instance = cls(**filter_options)
-            if saved := new_instance.save():
-                return saved
-                
-            raise DatabaseError("Failed to save new document")
-            
+            try:
+                doc = collection.find_one_and_update(
+                    filter_options,
+                    cls._get_or_create_update(filter_options),
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            except errors.DuplicateKeyError:
+                # A concurrent upsert on the same unique key won the race
+                doc = collection.find_one(filter_options)
+
+            if doc is None:
+                raise DatabaseError("Failed to save new document")
+
+            return cls.from_mongo(doc)
+
         except errors.OperationFailure as e:
             logger.error(f"Database operation failed: {str(e)}")
             raise DatabaseError(f"Database operation failed: {str(e)}")
@@ -112,38 +183,84 @@ class NoSQLBaseDocument(BaseModel, ABC):
         return doc
 
     def save(self: T) -> T | None:
-        """Save document to MongoDB."""
+        """Save document to MongoDB.
+
+        Documents with a natural key are upserted, so a document whose key
+        already exists is skipped (returning None) instead of duplicated.
+        """
         collection = connection.get_collection(self.get_collection_name())
         try:
             # Convert the document to a format MongoDB can handle
-            mongo_doc = self.to_mongo()
-            
-            # Log document being saved
-            logger.info(f"Saving document to {self.get_collection_name()}: {mongo_doc}")
-            
-            # Use the custom insert method
-            result = connection.insert_one(collection, mongo_doc)
-            
-            logger.info(f"Document saved with ID: {result.inserted_id}")
+            prepared_doc = self._to_prepared_mongo()
+
+            logger.debug(f"Saving document {self.id} to {self.get_collection_name()}")
+
+            if self._natural_key:
+                result = collection.update_one(*self._upsert_args(prepared_doc), upsert=True)
+                if result.upserted_id is None:
+                    logger.info(f"Document already exists in {self.get_collection_name()}, skipped")
+                    return None
+            else:
+                collection.insert_one(prepared_doc)
+
+            logger.info(f"Document saved with ID: {self.id}")
             return self
+        except errors.DuplicateKeyError:
+            logger.info(f"Document already exists in {self.get_collection_name()}, skipped")
+            return None
         except errors.WriteError as e:
             logger.error(f"Failed to insert document: {str(e)}")
             return None
 
+    def update(self: T, **fields: Any) -> T | None:
+        """Update the given fields of this document in MongoDB."""
+        collection = connection.get_collection(self.get_collection_name())
+        try:
+            updated = self.model_copy(update=fields)
+            mongo_doc = updated.to_mongo()
+            changes = {key: mongo_doc[key] for key in fields}
+
+            uuid_fields = None if updated.model_extra else self._uuid_fields()
+            result = collection.update_one(
+                {"_id": connection.convert_uuid_to_binary(self.id)},
+                {"$set": connection.prepare_document_for_insertion(changes, uuid_fields)},
+            )
+            if result.matched_count == 0:
+                logger.error(f"Document {self.id} not found in {self.get_collection_name()}")
+                return None
+
+            logger.info(f"Document updated with ID: {self.id}")
+            return updated
+        except errors.WriteError as e:
+            logger.error(f"Failed to update document: {str(e)}")
+            return None
+
     @classmethod
     def bulk_insert(cls: Type[T], documents: list[T]) -> bool:
-        """Insert multiple documents to MongoDB."""
+        """Insert multiple documents to MongoDB.
+
+        Documents with a natural key are upserted, skipping those already stored.
+        """
         if not documents:
             return True
 
         collection = connection.get_collection(cls.get_collection_name())
         try:
             # Convert documents to MongoDB-compatible format
-            mongo_docs = [doc.to_mongo() for doc in documents]
-            
-            # Use the custom insert method
-            connection.insert_many(collection, mongo_docs)
-            
+            prepared_docs = [doc._to_prepared_mongo() for doc in documents]
+
+            if cls._natural_key:
+                result = collection.bulk_write(
+                    [UpdateOne(*cls._upsert_args(doc), upsert=True) for doc in prepared_docs],
+                    ordered=False,
+                )
+                logger.info(
+                    f"Upserted {result.upserted_count} new {cls.__name__} document(s), "
+                    f"{len(documents) - result.upserted_count} already stored"
+                )
+            else:
+                collection.insert_many(prepared_docs)
+
             return True
         except errors.BulkWriteError:
             logger.error(f"Failed to bulk insert {cls.__name__} documents")
@@ -163,7 +280,10 @@ class NoSQLBaseDocument(BaseModel, ABC):
 
     @classmethod
     def bulk_find(cls: Type[T], **filter_options) -> list[T]:
-        """Find multiple documents in MongoDB."""
+        """Find multiple documents in MongoDB.
+
+        Loads every match into memory; use iter_find to scan large collections.
+        """
         collection = connection.get_collection(cls.get_collection_name())
         try:
             cursor = collection.find(filter_options)
@@ -173,4 +293,158 @@ class NoSQLBaseDocument(BaseModel, ABC):
             ]
         except errors.OperationFailure:
             logger.error("Failed to retrieve documents")
-            return []
\ No newline at end of file
+            return []
+
+    @classmethod
+    def iter_find(
+        cls: Type[T],
+        *,
+        projection: list[str] | None = None,
+        batch_size: int = 100,
+        sort: list[tuple[str, int]] | None = None,
+        limit: int = 0,
+        skip: int = 0,
+        **filter_options,
+    ) -> Iterator[T]:
+        """Stream documents from MongoDB one cursor batch at a time.
+
+        Args:
+            projection: Fields to fetch; the returned models are then built
+                without validation and only carry these fields (and the id)
+            batch_size: Documents fetched per round-trip
+            sort: (field, direction) pairs, defaults to the _id order
+            limit: Maximum number of documents, 0 for no limit
+            skip: Number of matching documents to skip
+            **filter_options: Query filter
+
+        Yields:
+            Documents matching the filter
+        """
+        collection = connection.get_collection(cls.get_collection_name())
+        cursor = collection.find(
+            filter_options,
+            projection=projection,
+            batch_size=batch_size,
+            sort=sort or [("_id", ASCENDING)],
+            limit=limit,
+            skip=skip,
+        )
+        try:
+            with cursor:
+                for item in cursor:
+                    if projection is None:
+                        yield cls.from_mongo(item)
+                    else:
+                        yield cls._from_partial_mongo(item)
+        except errors.OperationFailure as e:
+            logger.error(f"Failed to stream documents: {str(e)}")
+            raise DatabaseError(f"Failed to stream documents: {str(e)}")
+
+    @classmethod
+    def _from_partial_mongo(cls: Type[T], data: dict) -> T:
+        """Build a model from a projected document, skipping validation."""
+        data = dict(data)
+        if "_id" in data:
+            data["id"] = data.pop("_id")
+        return cls.model_construct(**data)
+
+    # Async variants, for crawlers running on an asyncio event loop. They go
+    # through async_connection and set up collections like the sync methods.
+
+    @classmethod
+    async def _acollection(cls) -> AsyncCollection | ThreadedAsyncCollection:
+        """Get the async collection, creating and indexing it on first use like get_collection_name()."""
+        if cls._collection is None or not connection.metadata.is_ready(cls._collection):
+            # Collection setup goes through the sync connector, off the event loop
+            await asyncio.to_thread(cls.get_collection_name)
+        return async_connection.get_collection(cls._collection)
+
+    @classmethod
+    async def afrom_mongo(cls: Type[T], data: dict) -> T:
+        """Async variant of from_mongo(), for documents that load referenced data."""
+        return cls.from_mongo(data)
+
+    @classmethod
+    async def aget_or_create(cls: Type[T], **filter_options) -> T:
+        """Get an existing document or atomically create a new one."""
+        collection = await cls._acollection()
+        try:
+            try:
+                doc = await collection.find_one_and_update(
+                    filter_options,
+                    cls._get_or_create_update(filter_options),
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            except errors.DuplicateKeyError:
+                # A concurrent upsert on the same unique key won the race
+                doc = await collection.find_one(filter_options)
+
+            if doc is None:
+                raise DatabaseError("Failed to save new document")
+
+            return await cls.afrom_mongo(doc)
+
+        except errors.OperationFailure as e:
+            logger.error(f"Database operation failed: {str(e)}")
+            raise DatabaseError(f"Database operation failed: {str(e)}")
+
+    async def asave(self: T) -> T | None:
+        """Save document to MongoDB, skipping documents whose natural key is stored."""
+        collection = await self._acollection()
+        try:
+            prepared_doc = self._to_prepared_mongo()
+
+            logger.debug(f"Saving document {self.id} to {self._collection}")
+
+            if self._natural_key:
+                result = await collection.update_one(*self._upsert_args(prepared_doc), upsert=True)
+                if result.upserted_id is None:
+                    logger.info(f"Document already exists in {self._collection}, skipped")
+                    return None
+            else:
+                await collection.insert_one(prepared_doc)
+
+            logger.info(f"Document saved with ID: {self.id}")
+            return self
+        except errors.DuplicateKeyError:
+            logger.info(f"Document already exists in {self._collection}, skipped")
+            return None
+        except errors.WriteError as e:
+            logger.error(f"Failed to insert document: {str(e)}")
+            return None
+
+    @classmethod
+    async def abulk_insert(cls: Type[T], documents: list[T]) -> bool:
+        """Insert multiple documents to MongoDB, skipping natural keys already stored."""
+        if not documents:
+            return True
+
+        collection = await cls._acollection()
+        try:
+            prepared_docs = [doc._to_prepared_mongo() for doc in documents]
+
+            if cls._natural_key:
+                await collection.bulk_write(
+                    [UpdateOne(*cls._upsert_args(doc), upsert=True) for doc in prepared_docs],
+                    ordered=False,
+                )
+            else:
+                await collection.insert_many(prepared_docs, ordered=False)
+
+            return True
+        except errors.BulkWriteError:
+            logger.error(f"Failed to bulk insert {cls.__name__} documents")
+            return False
+
+    @classmethod
+    async def afind(cls: Type[T], **filter_options) -> T | None:
+        """Find a single document in MongoDB."""
+        collection = await cls._acollection()
+        try:
+            if doc := await collection.find_one(filter_options):
+                return await cls.afrom_mongo(doc)
+            return None
+        except errors.OperationFailure:
+            logger.error("Failed to retrieve document")
+            return None
@@ -1,8 +1,12 @@
 # llmops_datacollection/domain/documents.py
-from typing import Optional, ClassVar
-from pydantic import BaseModel, Field
+import hashlib
+from datetime import datetime
+from typing import Iterable, Literal, Optional, ClassVar
+from pydantic import BaseModel, Field, model_validator
 from pydantic.types import UUID4  # Import UUID4 from pydantic.types
+from pymongo import ASCENDING, IndexModel
 from .base import NoSQLBaseDocument
+from .exceptions import DatabaseError
 
 class UserDocument(NoSQLBaseDocument):
     """User document model."""
@@ -10,6 +14,9 @@ class UserDocument(NoSQLBaseDocument):
     first_name: str
     last_name: str
     _collection: ClassVar[str] = "users"
+    _indexes: ClassVar[list[IndexModel]] = [
+        IndexModel([("first_name", ASCENDING), ("last_name", ASCENDING)]),
+    ]
 
     @property
     def full_name(self) -> str:
@@ -29,19 +36,177 @@ class ArticleDocument(ContentDocument):
     link: str
     title: str
     _collection: ClassVar[str] = "articles"
+    _indexes: ClassVar[list[IndexModel]] = [IndexModel("link", unique=True)]
+    _natural_key: ClassVar[tuple[str, ...]] = ("link",)
 
 class PostDocument(ContentDocument):
-    """Social media post document model."""
+    """Social media post document model.
+
+    Posts are identified by `post_id`: the platform's activity URN when the
+    crawler saw one, otherwise a hash of the profile link and post text.
+    """
     
     link: Optional[str] = None
     image: Optional[str] = None
+    post_id: Optional[str] = None
     _collection: ClassVar[str] = "posts"
+    _indexes: ClassVar[list[IndexModel]] = [
+        IndexModel("link"),
+        # Partial, so posts stored before post_id existed do not collide on null
+        IndexModel("post_id", unique=True, partialFilterExpression={"post_id": {"$type": "string"}}),
+    ]
+    _natural_key: ClassVar[tuple[str, ...]] = ("post_id",)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _default_post_id(cls, data):
+        if isinstance(data, dict) and not data.get("post_id"):
+            content = data.get("content") or {}
+            data = {**data, "post_id": cls.make_post_id(data.get("link"), content.get("text", ""), content.get("urn"))}
+        return data
+
+    @staticmethod
+    def make_post_id(link: str | None, text: str, urn: str | None = None) -> str:
+        """Stable identity of a post.
+
+        Posts without a URN are identified by their text with all whitespace
+        removed, so the in-page collector (innerText, line breaks kept) and
+        page parsing (stripped text pieces joined together) agree.
+        """
+        if urn:
+            return urn
+        text = "".join(text.split())
+        return "sha256:" + hashlib.sha256(f"{link or ''}\n{text}".encode("utf-8")).hexdigest()
+
+class BlobDocument(NoSQLBaseDocument):
+    """File text stored once per distinct content hash."""
+
+    hash: str
+    text: str
+    _collection: ClassVar[str] = "blobs"
+    _indexes: ClassVar[list[IndexModel]] = [IndexModel("hash", unique=True)]
+    _natural_key: ClassVar[tuple[str, ...]] = ("hash",)
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Content address of a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def put_many(cls, texts: dict[str, str]) -> dict[str, str]:
+        """Store texts that are not stored yet.
+
+        Args:
+            texts: Texts keyed by any label (e.g. file path)
+
+        Returns:
+            dict[str, str]: Content hash per label
+        """
+        hashes = {label: cls.hash_text(text) for label, text in texts.items()}
+        unique = {digest: text for digest, text in zip(hashes.values(), texts.values())}
+        if not unique:
+            return hashes
+
+        stored = {
+            blob.hash
+            for blob in cls.iter_find(hash={"$in": list(unique)}, projection=["hash"], batch_size=1000)
+        }
+        missing = [cls(hash=digest, text=text) for digest, text in unique.items() if digest not in stored]
+        if not cls.bulk_insert(missing):
+            raise DatabaseError(f"Failed to store {len(missing)} blob(s)")
+
+        return hashes
+
+    @classmethod
+    def get_many(cls, hashes: Iterable[str]) -> dict[str, str]:
+        """Load the texts of the given content hashes."""
+        return {
+            blob.hash: blob.text
+            for blob in cls.iter_find(hash={"$in": list(set(hashes))}, projection=["hash", "text"], batch_size=1000)
+        }
+
+    @classmethod
+    async def aget_many(cls, hashes: Iterable[str]) -> dict[str, str]:
+        """Async variant of get_many()."""
+        collection = await cls._acollection()
+        docs = await collection.find(
+            {"hash": {"$in": list(set(hashes))}}, {"hash": 1, "text": 1}, batch_size=1000
+        ).to_list()
+        return {doc["hash"]: doc["text"] for doc in docs}
 
 class RepositoryDocument(ContentDocument):
-    """GitHub repository document model."""
+    """GitHub repository document model.
+
+    When `content_hashes` is set, file texts live in the blob store and are
+    stored as references; reading the document loads them back into `content`.
+    """
     
     name: str
     link: str
+    commit_sha: Optional[str] = None  # HEAD commit the content was read from
+    file_hashes: dict[str, str] = Field(default_factory=dict)  # Path -> git blob SHA
+    content_hashes: dict[str, str] = Field(default_factory=dict)  # Path -> BlobDocument hash
     _collection: ClassVar[str] = "repositories"
+    _indexes: ClassVar[list[IndexModel]] = [IndexModel("link", unique=True)]
+    _natural_key: ClassVar[tuple[str, ...]] = ("link",)
 
-    
+    @classmethod
+    def from_mongo(cls, data: dict) -> "RepositoryDocument":
+        """Convert MongoDB document to model instance, loading referenced file texts."""
+        if cls._references_blobs(data):
+            data = cls._with_blob_texts(data, BlobDocument.get_many(data["content_hashes"].values()))
+
+        return super().from_mongo(data)
+
+    @classmethod
+    async def afrom_mongo(cls, data: dict) -> "RepositoryDocument":
+        """Async variant of from_mongo(), loading referenced file texts without blocking the event loop."""
+        if cls._references_blobs(data):
+            data = cls._with_blob_texts(data, await BlobDocument.aget_many(data["content_hashes"].values()))
+
+        return super().from_mongo(data)
+
+    @staticmethod
+    def _references_blobs(data: dict) -> bool:
+        return bool(data and data.get("content_hashes") and not data.get("content"))
+
+    @staticmethod
+    def _with_blob_texts(data: dict, texts: dict[str, str]) -> dict:
+        """Fill in `content` from the loaded blob texts."""
+        try:
+            content = {path: texts[digest] for path, digest in data["content_hashes"].items()}
+        except KeyError as e:
+            raise DatabaseError(f"Missing blob {e} for repository {data.get('link')}") from e
+        return dict(data, content=content)
+
+    def to_mongo(self) -> dict:
+        """Convert model instance to MongoDB document, leaving out blob-stored texts."""
+        doc = super().to_mongo()
+        if self.content_hashes:
+            doc["content"] = {}
+        return doc
+
+class FrontierDocument(NoSQLBaseDocument):
+    """Crawl state of a single link, kept across pipeline runs."""
+
+    link: str
+    state: Literal["pending", "in_progress", "done", "failed"] = "pending"
+    attempts: int = 0  # Failed crawls so far
+    last_error: Optional[str] = None
+    next_attempt_at: Optional[datetime] = None  # When a failed link may be retried
+    lease_owner: Optional[str] = None  # Run that claimed an in-progress link
+    lease_expires_at: Optional[datetime] = None  # When an in-progress link counts as abandoned
+    updated_at: Optional[datetime] = None
+    _collection: ClassVar[str] = "frontier"
+    _indexes: ClassVar[list[IndexModel]] = [
+        IndexModel("link", unique=True),
+        IndexModel([("state", ASCENDING), ("next_attempt_at", ASCENDING)]),
+    ]
+    _natural_key: ClassVar[tuple[str, ...]] = ("link",)
+
+def ensure_indexes() -> None:
+    """Create the declared indexes of every document collection."""
+    for document_class in (
+        UserDocument, ArticleDocument, PostDocument, BlobDocument, RepositoryDocument, FrontierDocument,
+    ):
+        document_class.ensure_indexes()
@@ -0,0 +1,208 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+from pymongo import InsertOne, UpdateOne, errors
+
+from llmops_datacollection.domain.base import NoSQLBaseDocument
+from llmops_datacollection.domain.exceptions import DatabaseError
+from llmops_datacollection.infrastructure.db.mongo import connection
+from llmops_datacollection.settings import settings
+
+# Queue markers for control messages sent to the writer thread
+_FLUSH = object()
+_STOP = object()
+
+# MongoDB error code for unique index violations
+DUPLICATE_KEY_ERROR = 11000
+
+
+class WriteFailure(BaseModel):
+    """A document the bulk writer failed to store."""
+
+    collection: str
+    document_id: str
+    error: str
+
+
+class BulkWriter:
+    """Buffer documents and write them to MongoDB in unordered batches.
+
+    Documents submitted from any thread are written by a single background
+    thread, grouped per collection, whenever `batch_size` documents are
+    buffered or the oldest buffered document has waited `flush_interval`
+    seconds. Each submission returns a future resolving to True when the
+    document was written, False when its natural key was already stored,
+    or raising DatabaseError when the write failed.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_pending: int) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._failures: list[WriteFailure] = []
+
+    def submit(self, document: NoSQLBaseDocument) -> Future:
+        """Queue a document for writing, blocking while the queue is full."""
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((document, future))
+        return future
+
+    def submit_many(self, documents: list[NoSQLBaseDocument]) -> list[Future]:
+        """Queue several documents for writing."""
+        return [self.submit(document) for document in documents]
+
+    def flush(self) -> list[WriteFailure]:
+        """Write everything submitted so far.
+
+        Returns:
+            list[WriteFailure]: Failures collected since the previous flush
+        """
+        self._send(_FLUSH)
+        with self._lock:
+            failures, self._failures = self._failures, []
+        return failures
+
+    def close(self) -> None:
+        """Write everything submitted so far and stop the background thread."""
+        self._send(_STOP)
+        with self._lock:
+            self._thread = None
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="bulk-writer", daemon=True)
+                self._thread.start()
+
+    def _send(self, marker: object) -> None:
+        with self._lock:
+            thread = self._thread
+        if thread is None:
+            return
+
+        done = threading.Event()
+        self._queue.put((marker, done))
+        done.wait()
+        if marker is _STOP:
+            thread.join()
+
+    def _run(self) -> None:
+        buffer: list[tuple[NoSQLBaseDocument, Future]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if buffer else None
+            try:
+                item, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write(buffer)
+                buffer = []
+                continue
+
+            if item is _FLUSH or item is _STOP:
+                self._write(buffer)
+                buffer = []
+                payload.set()
+                if item is _STOP:
+                    return
+                continue
+
+            if not buffer:
+                deadline = time.monotonic() + self.flush_interval
+            buffer.append((item, payload))
+            if len(buffer) >= self.batch_size:
+                self._write(buffer)
+                buffer = []
+
+    def _write(self, buffer: list[tuple[NoSQLBaseDocument, Future]]) -> None:
+        """Write the buffered documents, one bulk request per collection."""
+        batches: dict[type[NoSQLBaseDocument], list[tuple[NoSQLBaseDocument, Future]]] = {}
+        for document, future in buffer:
+            batches.setdefault(type(document), []).append((document, future))
+
+        for document_class, batch in batches.items():
+            try:
+                self._write_batch(document_class, batch)
+            except Exception as e:
+                logger.error(f"Failed to write {document_class.__name__} batch: {str(e)}")
+                for document, future in batch:
+                    if not future.done():
+                        self._fail(document_class, document, future, str(e))
+
+    def _write_batch(
+        self,
+        document_class: type[NoSQLBaseDocument],
+        batch: list[tuple[NoSQLBaseDocument, Future]],
+    ) -> None:
+        collection = connection.get_collection(document_class.get_collection_name())
+        requests = [self._request(document_class, document) for document, _ in batch]
+
+        try:
+            result = collection.bulk_write(requests, ordered=False)
+            write_errors: dict[int, dict[str, Any]] = {}
+            upserted = set(result.upserted_ids or {})
+        except errors.BulkWriteError as e:
+            write_errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+            upserted = {upsert["index"] for upsert in e.details.get("upserted", [])}
+
+        written = skipped = failed = 0
+        for i, (document, future) in enumerate(batch):
+            if error := write_errors.get(i):
+                if error.get("code") == DUPLICATE_KEY_ERROR:
+                    # Stored concurrently by another writer
+                    future.set_result(False)
+                    skipped += 1
+                else:
+                    self._fail(document_class, document, future, error.get("errmsg", "write error"))
+                    failed += 1
+            elif document_class._natural_key and i not in upserted:
+                future.set_result(False)
+                skipped += 1
+            else:
+                future.set_result(True)
+                written += 1
+
+        logger.info(
+            f"Wrote {written} {document_class.__name__} document(s)"
+            f" ({skipped} already stored, {failed} failed)"
+        )
+
+    @staticmethod
+    def _request(document_class: type[NoSQLBaseDocument], document: NoSQLBaseDocument) -> InsertOne | UpdateOne:
+        mongo_doc = document._to_prepared_mongo()
+        if document_class._natural_key:
+            return UpdateOne(*document_class._upsert_args(mongo_doc), upsert=True)
+        return InsertOne(mongo_doc)
+
+    def _fail(
+        self,
+        document_class: type[NoSQLBaseDocument],
+        document: NoSQLBaseDocument,
+        future: Future,
+        error: str,
+    ) -> None:
+        failure = WriteFailure(
+            collection=document_class._collection,
+            document_id=str(document.id),
+            error=error,
+        )
+        with self._lock:
+            self._failures.append(failure)
+        future.set_exception(DatabaseError(f"Failed to write document {failure.document_id}: {error}"))
+
+
+# Global writer instance
+bulk_writer = BulkWriter(
+    batch_size=settings.WRITE_BATCH_SIZE,
+    flush_interval=settings.WRITE_FLUSH_INTERVAL,
+    max_pending=settings.WRITE_MAX_PENDING,
+)
+atexit.register(bulk_writer.close)
@@ -1,4 +1,4 @@
-# from typing import Any, Optional
+# from typing import Any, Callable, Iterable, Optional
 # from loguru import logger
 # from pymongo import MongoClient
 # from pymongo.collection import Collection
@@ -83,10 +83,17 @@
 
 
 # llmops_datacollection/infrastructure/db/mongo.py
-from typing import Any, Optional
+import asyncio
+import functools
+import itertools
+import threading
+from typing import Any, Callable, Iterable, Optional
 from loguru import logger
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.collection import Collection
+from pymongo.cursor import Cursor
 from pymongo.database import Database
 from pymongo.errors import ConnectionFailure
 from bson.binary import Binary
@@ -95,53 +102,110 @@ import uuid
 from llmops_datacollection.domain.exceptions import DatabaseError
 from llmops_datacollection.settings import settings
 
+# Client options shared by the sync and async connectors
+CLIENT_OPTIONS = {
+    'uuidRepresentation': 'standard'  # This helps with UUID encoding
+}
+
+class CollectionMetadataCache:
+    """Per-process record of collections known to exist and be indexed.
+
+    Filled from a single list_collection_names() call on first lookup. Call
+    invalidate() after changing collections outside the connector (e.g.
+    dropping them with another client) so the next lookup reloads.
+    """
+
+    def __init__(self) -> None:
+        self._existing: set[str] | None = None
+        self._ready: set[str] = set()
+        self._lock = threading.Lock()
+
+    def exists(self, name: str, list_names: Callable[[], list[str]]) -> bool:
+        """Check whether a collection exists, listing collections on first use."""
+        with self._lock:
+            if self._existing is None:
+                self._existing = set(list_names())
+            return name in self._existing
+
+    def mark_exists(self, name: str) -> None:
+        """Record that a collection was created."""
+        with self._lock:
+            if self._existing is not None:
+                self._existing.add(name)
+
+    def is_ready(self, name: str) -> bool:
+        """Check whether a collection was already created and indexed."""
+        return name in self._ready
+
+    def mark_ready(self, name: str) -> None:
+        """Record that a collection was created and indexed."""
+        with self._lock:
+            self._ready.add(name)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Forget what is known about one collection, or about all of them."""
+        with self._lock:
+            # Existence is reloaded with a single listing either way
+            self._existing = None
+            if name is None:
+                self._ready.clear()
+            else:
+                self._ready.discard(name)
+
 class MongoDBConnector:
-    """MongoDB connection manager."""
+    """MongoDB connection manager.
+
+    The client is created, and the server pinged, on first use rather than
+    at import, so importing the package never touches the network.
+    """
     
     _instance: Optional['MongoDBConnector'] = None
     _client: Optional[MongoClient] = None
     _db: Optional[Database] = None
+    _lock = threading.Lock()
+    metadata = CollectionMetadataCache()
     
     def __new__(cls) -> 'MongoDBConnector':
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
-    
-    def __init__(self) -> None:
-        if self._client is None:
+
+    def _connect(self) -> None:
+        """Create the client and check that the server is reachable."""
+        with self._lock:
+            if self._client is not None:
+                return
+
+            client = MongoClient(
+                settings.MONGODB_URI, 
+                **CLIENT_OPTIONS
+            )
             try:
-                # Configure UUID representation
-                client_options = {
-                    'uuidRepresentation': 'standard'  # This helps with UUID encoding
-                }
-                
-                self._client = MongoClient(
-                    settings.MONGODB_URI, 
-                    **client_options
-                )
-                self._db = self._client[settings.DATABASE_NAME]
-                
                 # Test connection
-                self._client.admin.command('ping')
-                logger.info(
-                    f"Connected to MongoDB at {settings.MONGODB_URI}"
-                    f" using database {settings.DATABASE_NAME}"
-                )
+                client.admin.command('ping')
             except ConnectionFailure as e:
+                client.close()
                 raise DatabaseError(f"Failed to connect to MongoDB: {str(e)}") from e
 
+            self._db = client[settings.DATABASE_NAME]
+            self._client = client
+            logger.info(
+                f"Connected to MongoDB at {settings.MONGODB_URI}"
+                f" using database {settings.DATABASE_NAME}"
+            )
+
     @property
     def client(self) -> MongoClient:
-        """Get the MongoDB client."""
+        """Get the MongoDB client, connecting on first use."""
         if self._client is None:
-            raise DatabaseError("MongoDB client not initialized")
+            self._connect()
         return self._client
 
     @property
     def db(self) -> Database:
-        """Get the MongoDB database."""
+        """Get the MongoDB database, connecting on first use."""
         if self._db is None:
-            raise DatabaseError("Database not initialized")
+            self._connect()
         return self._db
 
     def convert_uuid_to_binary(self, value):
@@ -150,8 +214,20 @@ class MongoDBConnector:
             return Binary(value.bytes, subtype=4)
         return value
 
-    def prepare_document_for_insertion(self, document: dict) -> dict:
-        """Prepare document for MongoDB insertion by converting UUIDs."""
+    def prepare_document_for_insertion(self, document: dict, uuid_fields: Iterable[str] | None = None) -> dict:
+        """Prepare document for MongoDB insertion by converting UUIDs.
+
+        When `uuid_fields` is given only those top-level fields are converted
+        and every other value is shared with the input instead of copied.
+        Otherwise all nested dicts and lists are walked.
+        """
+        if uuid_fields is not None:
+            converted_doc = dict(document)
+            for key in uuid_fields:
+                if key in converted_doc:
+                    converted_doc[key] = self.convert_uuid_to_binary(converted_doc[key])
+            return converted_doc
+
         converted_doc = {}
         for key, value in document.items():
             if isinstance(value, dict):
@@ -169,23 +245,29 @@ class MongoDBConnector:
         """Get collection by name."""
         return self.db[name]
 
+    def collection_exists(self, name: str) -> bool:
+        """Check whether a collection exists, using the metadata cache."""
+        return self.metadata.exists(name, self.list_collection_names)
+
     def create_collection(self, name: str, **kwargs: Any) -> Collection:
         """Create new collection."""
         try:
-            return self.db.create_collection(name, **kwargs)
+            collection = self.db.create_collection(name, **kwargs)
+            self.metadata.mark_exists(name)
+            return collection
         except Exception as e:
             raise DatabaseError(
                 f"Failed to create collection {name}: {str(e)}"
             ) from e
     
-    def insert_one(self, collection: Collection, document: dict) -> Any:
+    def insert_one(self, collection: Collection, document: dict, uuid_fields: Iterable[str] | None = None) -> Any:
         """Insert a single document with UUID conversion."""
-        prepared_doc = self.prepare_document_for_insertion(document)
+        prepared_doc = self.prepare_document_for_insertion(document, uuid_fields)
         return collection.insert_one(prepared_doc)
     
-    def insert_many(self, collection: Collection, documents: list[dict]) -> Any:
+    def insert_many(self, collection: Collection, documents: list[dict], uuid_fields: Iterable[str] | None = None) -> Any:
         """Insert multiple documents with UUID conversion."""
-        prepared_docs = [self.prepare_document_for_insertion(doc) for doc in documents]
+        prepared_docs = [self.prepare_document_for_insertion(doc, uuid_fields) for doc in documents]
         return collection.insert_many(prepared_docs)
 
     def list_collection_names(self) -> list[str]:
@@ -196,6 +278,7 @@ class MongoDBConnector:
         """Drop collection by name."""
         try:
             self.db.drop_collection(name)
+            self.metadata.invalidate(name)
         except Exception as e:
             raise DatabaseError(
                 f"Failed to drop collection {name}: {str(e)}"
@@ -207,5 +290,106 @@ class MongoDBConnector:
             self._client.close()
             logger.info("Closed MongoDB connection")
 
-# Global connection instance
-connection = MongoDBConnector()
\ No newline at end of file
+class ThreadedAsyncCursor:
+    """Async facade over a synchronous cursor, fetching documents in a worker thread."""
+
+    def __init__(self, cursor: Cursor) -> None:
+        self._cursor = cursor
+
+    async def to_list(self, length: int | None = None) -> list[dict]:
+        """Fetch the remaining documents, or at most `length` of them."""
+        return await asyncio.to_thread(lambda: list(itertools.islice(self._cursor, length)))
+
+class ThreadedAsyncCollection:
+    """Async facade over a synchronous collection.
+
+    Each method call runs in a worker thread via asyncio.to_thread, which lets
+    an in-process stand-in such as mongomock back the async code path in tests.
+    """
+
+    def __init__(self, collection: Collection) -> None:
+        self._collection = collection
+
+    def find(self, *args: Any, **kwargs: Any) -> ThreadedAsyncCursor:
+        """Start a query; like AsyncCollection.find(), nothing is fetched until the cursor is read."""
+        return ThreadedAsyncCursor(self._collection.find(*args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._collection, name)
+
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return wrapper
+
+class AsyncMongoDBConnector:
+    """Asyncio MongoDB connection manager.
+
+    Uses the same URI, database and client options as MongoDBConnector. The
+    client is created on first use, inside the running event loop.
+    """
+
+    def __init__(self, sync_connector: MongoDBConnector | None = None) -> None:
+        self._client: AsyncMongoClient | None = None
+        self._db: AsyncDatabase | None = None
+        # When set, collections are served by this sync connector through threads
+        self._sync_connector = sync_connector
+
+    @classmethod
+    def from_sync(cls, sync_connector: MongoDBConnector) -> 'AsyncMongoDBConnector':
+        """Create a connector that runs a sync connector's operations in threads."""
+        return cls(sync_connector=sync_connector)
+
+    @property
+    def client(self) -> AsyncMongoClient:
+        """Get the async MongoDB client."""
+        if self._client is None:
+            self._client = AsyncMongoClient(settings.MONGODB_URI, **CLIENT_OPTIONS)
+            logger.info(
+                f"Created async MongoDB client for {settings.MONGODB_URI}"
+                f" using database {settings.DATABASE_NAME}"
+            )
+        return self._client
+
+    @property
+    def db(self) -> AsyncDatabase:
+        """Get the async MongoDB database."""
+        if self._db is None:
+            self._db = self.client[settings.DATABASE_NAME]
+        return self._db
+
+    def get_collection(self, name: str) -> AsyncCollection | ThreadedAsyncCollection:
+        """Get collection by name."""
+        if self._sync_connector is not None:
+            return ThreadedAsyncCollection(self._sync_connector.get_collection(name))
+        return self.db[name]
+
+    def convert_uuid_to_binary(self, value):
+        """Convert UUID to BSON Binary."""
+        return connection.convert_uuid_to_binary(value)
+
+    def prepare_document_for_insertion(self, document: dict, uuid_fields: Iterable[str] | None = None) -> dict:
+        """Prepare document for MongoDB insertion by converting UUIDs."""
+        return connection.prepare_document_for_insertion(document, uuid_fields)
+
+    async def ping(self) -> None:
+        """Check that the server is reachable."""
+        if self._sync_connector is not None:
+            return
+        try:
+            await self.client.admin.command('ping')
+        except ConnectionFailure as e:
+            raise DatabaseError(f"Failed to connect to MongoDB: {str(e)}") from e
+
+    async def close(self) -> None:
+        """Close the async client."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._db = None
+            logger.info("Closed async MongoDB connection")
+
+# Global connection instances
+connection = MongoDBConnector()
+async_connection = AsyncMongoDBConnector()
\ No newline at end of file
@@ -1,5 +1,30 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+class DomainLimits(BaseModel):
+    """Politeness limits applied to a single crawled domain."""
+
+    rate: float = Field(default=1.0, gt=0)  # Crawls started per second
+    burst: int = Field(default=1, ge=1)  # Crawls that may start back-to-back
+    max_in_flight: int = Field(default=2, ge=1)  # Concurrent crawls
+
+class BlockingProfile(BaseModel):
+    """Resources a headless browser skips loading."""
+
+    block_images: bool = False  # Disable image decoding and download in Chrome
+    blocked_url_patterns: list[str] = []  # CDP URL patterns, e.g. "*.woff2" or "*doubleclick.net*"
+
+# Fonts, media and common third-party trackers; page text never depends on them
+TEXT_ONLY_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*segment.io*", "*branch.io*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com*",
+]
+
 class Settings(BaseSettings):
     """Application settings."""
     
@@ -16,14 +41,84 @@ class Settings(BaseSettings):
     # LinkedIn credentials 
     LINKEDIN_EMAIL: str | None = None
     LINKEDIN_PASSWORD: str | None = None
+    LINKEDIN_SESSION_PATH: str = ".linkedin_session"
+    LINKEDIN_SESSION_KEY: str | None = None  # Fernet key; without it sessions are not persisted
+    LINKEDIN_MAX_POSTS: int = 20  # Posts collected per profile
+    LINKEDIN_INCREMENTAL: bool = True  # Extract posts while scrolling instead of from the final page
     
     # GitHub settings
     GITHUB_TOKEN: str | None = None
+    GITHUB_CLONE_MODE: Literal["full", "shallow", "sparse"] = "shallow"
+    GITHUB_MAX_FILE_BYTES: int = 1_000_000
+    GITHUB_MAX_TOTAL_BYTES: int = 50_000_000
+    GITHUB_READ_WORKERS: int = 8
+    GITHUB_INCREMENTAL: bool = True  # Refresh stored repos when their HEAD moves
+    GITHUB_BLOB_STORE: bool = True  # Store file texts once per content hash
+    GITHUB_FLUSH_BYTES: int = 8_000_000  # File bytes read before flushing them to the blob store
+    GITHUB_INCLUDE_GLOBS: list[str] = []  # When set, only matching files are read
+    GITHUB_EXCLUDE_GLOBS: list[str] = [
+        "*.min.js", "*.min.css", "*.map", "package-lock.json", "yarn.lock", "*_pb2.py", "*.pb.go",
+        "node_modules/*", "*/node_modules/*", "vendor/*", "*/vendor/*",
+        "third_party/*", "*/third_party/*", "dist/*", "build/*",
+    ]
+    GITHUB_MAX_NOTEBOOK_BYTES: int = 200_000  # Larger notebooks usually embed outputs
     
     # Browser settings
     BROWSER_TIMEOUT: int = 30
     SCROLL_LIMIT: int = 5
-    
+
+    # Resource blocking, per crawler class name ("none" loads everything)
+    BROWSER_BLOCKING_PROFILES: dict[str, BlockingProfile] = {
+        "none": BlockingProfile(),
+        "text": BlockingProfile(block_images=True, blocked_url_patterns=TEXT_ONLY_PATTERNS),
+    }
+    BROWSER_CRAWLER_PROFILES: dict[str, str] = {
+        "MediumCrawler": "text",
+        "LinkedInCrawler": "text",
+    }
+
+    # Adaptive wait settings (seconds)
+    WAIT_TIMEOUT: float = 10.0  # Longest any single wait may take
+    WAIT_QUIET_PERIOD: float = 0.5  # How long a page must stay unchanged to count as settled
+    WAIT_POLL_INTERVAL: float = 0.1
+
+    # HTTP fetch settings
+    HTTP_TIMEOUT: int = 15
+    HTTP_POOL_SIZE: int = 10
+    MEDIUM_HTTP_FETCH: bool = True
+
+    # HTML parsing: "auto" picks the fastest installed of selectolax, lxml and html.parser
+    HTML_PARSER: Literal["auto", "selectolax", "lxml", "html.parser"] = "auto"
+
+    # WebDriver pool settings
+    DRIVER_POOL_SIZE: int = 4
+    DRIVER_MAX_USES: int = 50
+    DRIVER_CHECKOUT_TIMEOUT: int = 300
+
+    # Bulk writer settings
+    WRITE_BATCH_SIZE: int = 100
+    WRITE_FLUSH_INTERVAL: float = 2.0  # Seconds a buffered document may wait
+    WRITE_MAX_PENDING: int = 1000
+
+    # Crawl execution settings
+    CRAWL_MAX_WORKERS: int = 4
+    CRAWL_EXECUTOR: Literal["thread", "process"] = "thread"
+
+    # Crawl frontier: leases, retries with exponential backoff and revisits (seconds)
+    FRONTIER_LEASE_SECONDS: float = 900.0  # How long a claimed link stays reserved for its run
+    FRONTIER_MAX_ATTEMPTS: int = 5  # Failed crawls before a link is given up on
+    FRONTIER_RETRY_BASE: float = 60.0  # Delay after the first failure, doubled after each one
+    FRONTIER_RETRY_MAX: float = 3600.0
+    FRONTIER_REVISIT_AFTER: float | None = 86400.0  # Crawl done links again after this long; None never does
+
+    # Per-domain politeness, keyed by the domains registered on the dispatcher
+    CRAWL_DEFAULT_LIMITS: DomainLimits = DomainLimits()
+    CRAWL_DOMAIN_LIMITS: dict[str, DomainLimits] = {
+        "linkedin.com": DomainLimits(rate=0.2, burst=1, max_in_flight=1),
+        "medium.com": DomainLimits(rate=1.0, burst=2, max_in_flight=3),
+        "github.com": DomainLimits(rate=0.5, burst=2, max_in_flight=2),
+    }
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
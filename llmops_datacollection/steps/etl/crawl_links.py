@@ -3,60 +3,85 @@ from tqdm import tqdm
 from typing_extensions import Annotated
 from zenml import get_step_context, step
 
-from llmops_datacollection.application.crawlers.dispatcher import CrawlerDispatcher
-from llmops_datacollection.domain.documents import UserDocument
+from llmops_datacollection.application.crawlers.dispatcher import CrawlerDispatcher, CrawlResult
+from llmops_datacollection.application.crawlers.frontier import CrawlFrontier
+from llmops_datacollection.application.crawlers.waits import wait_stats
+from llmops_datacollection.domain.documents import UserDocument, ensure_indexes
+from llmops_datacollection.domain.writer import bulk_writer
 
 @step
 def crawl_links(user: Annotated[UserDocument, "user"], links: list[str]) -> Annotated[list[str], "crawled_links"]:
     """Crawl provided links to extract content.
-    
+
+    Links are tracked in the persistent crawl frontier: links already crawled,
+    failed links still backing off and links leased by a concurrent run are
+    skipped, so re-running the step after a crash resumes where it stopped.
+    Each link is leased only when its crawl starts.
+
     Args:
         user: User document
         links: List of URLs to crawl
-        
+
     Returns:
         list[str]: List of crawled links
     """
+    # Create unique link indexes once, before workers start writing
+    ensure_indexes()
     dispatcher = CrawlerDispatcher.build()
-    
-    logger.info(f"Starting to crawl {len(links)} link(s).")
+    frontier = CrawlFrontier.from_settings()
+    wait_stats.reset()
 
-    metadata = {}
-    successful_crawls = 0
-    for link in tqdm(links):
-        try:
-            # Get appropriate crawler for link type
-            crawler = dispatcher.get_crawler(link)
-            
-            # Extract content from link
-            crawler.extract(link=link, user=user)
-            successful_crawls += 1
-            
-            # Update metadata
-            platform = crawler.model._collection
-            if platform not in metadata:
-                metadata[platform] = {
-                    "successful": 0,
-                    "total": 0
-                }
-            metadata[platform]["successful"] += 1
-            metadata[platform]["total"] += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to crawl {link}: {str(e)}")
-            
-            # Update metadata for failed crawl
-            platform = "unknown"
-            if platform not in metadata:
-                metadata[platform] = {
-                    "successful": 0, 
-                    "total": 0
-                }
-            metadata[platform]["total"] += 1
+    frontier.add(links)
+    ready = frontier.ready(links)
+    if skipped := len(set(links)) - len(ready):
+        logger.info(f"Skipping {skipped} link(s) already crawled, backing off or claimed by another run.")
+
+    logger.info(f"Starting to crawl {len(ready)} link(s).")
+
+    with tqdm(total=len(ready)) as progress:
+        results = dispatcher.crawl_urls(
+            ready,
+            callback=lambda _: progress.update(),
+            frontier=frontier,
+            user=user,
+        )
+
+    # Write whatever the crawlers left buffered
+    write_failures = bulk_writer.flush()
+    for failure in write_failures:
+        logger.error(f"Failed to write {failure.collection} document {failure.document_id}: {failure.error}")
+
+    metadata = _get_metadata(results)
+    metadata["write_failures"] = len(write_failures)
+    # Time spent in browser waits (collected in this process only)
+    metadata["waits"] = wait_stats.summary()
+    metadata["frontier"] = frontier.summary(links)
+    successful_crawls = sum(result.successful for result in results)
 
     step_context = get_step_context()
     step_context.add_output_metadata(output_name="crawled_links", metadata=metadata)
 
-    logger.info(f"Successfully crawled {successful_crawls} / {len(links)} links.")
+    logger.info(f"Successfully crawled {successful_crawls} / {len(results)} links.")
+
+    return links
+
+def _get_metadata(results: list[CrawlResult]) -> dict:
+    """Aggregate per-platform crawl counts.
+
+    Args:
+        results: Crawl results for every link
+
+    Returns:
+        dict: Step metadata
+    """
+    metadata = {}
+    for result in results:
+        if result.platform not in metadata:
+            metadata[result.platform] = {
+                "successful": 0,
+                "total": 0
+            }
+        metadata[result.platform]["successful"] += int(result.successful)
+        metadata[result.platform]["total"] += 1
 
-    return links
\ No newline at end of file
+    return metadata
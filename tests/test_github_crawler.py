@@ -2,14 +2,14 @@ import os
 import tempfile
 import uuid
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import click
 import pytest
 from click.testing import CliRunner
 
 from llmops_datacollection.application.crawlers.github import GithubCrawler
-from llmops_datacollection.domain.documents import RepositoryDocument, UserDocument
+from llmops_datacollection.domain.documents import BlobDocument, RepositoryDocument, UserDocument
 
 @pytest.fixture
 def mock_user():
@@ -48,7 +48,7 @@ def test_extract_repo_already_exists(github_crawler, mock_user):
     """Test that crawler exits early when repo already exists"""
     test_url = "https://github.com/user/test-repo"
     
-    with patch('llmops_datacollection.domain.documents.RepositoryDocument.find', return_value=Mock()):
+    with patch.object(GithubCrawler, '_find_stored', return_value=Mock()):
         github_crawler.extract(test_url, user=mock_user)
         # Should exit early without cloning repo
 
@@ -58,9 +58,9 @@ def test_extract_new_repo(github_crawler, mock_user, mock_repo_content, test_rep
     temp_dir = Path(tempfile.mkdtemp())
     try:
         with patch('tempfile.mkdtemp', return_value=str(temp_dir)), \
-             patch('subprocess.run') as mock_git_clone, \
+             patch('subprocess.run', return_value=Mock(returncode=0, stdout="")) as mock_git_clone, \
              patch('llmops_datacollection.domain.documents.RepositoryDocument.find', return_value=None), \
-             patch('llmops_datacollection.domain.documents.RepositoryDocument.save') as mock_save:
+             patch('llmops_datacollection.application.crawlers.github.bulk_writer') as mock_writer:
             
             # Create mock repository structure
             repo_dir = temp_dir / "Money-Laundering-Prevention"
@@ -71,11 +71,14 @@ def test_extract_new_repo(github_crawler, mock_user, mock_repo_content, test_rep
             github_crawler.extract(test_repo_url, user=mock_user)
             
             # Verify git clone was called correctly
-            mock_git_clone.assert_called_once_with(["git", "clone", test_repo_url])
+            assert mock_git_clone.call_args_list[0] == call(
+                ["git", "clone", "--depth", "1", "--single-branch", "--no-tags", test_repo_url, str(repo_dir)],
+                check=True,
+            )
             
             # Verify repository document was saved
-            mock_save.assert_called()
-            args, _ = mock_save.call_args
+            mock_writer.submit.assert_called()
+            args, _ = mock_writer.submit.call_args
             saved_doc = args[0]
             assert isinstance(saved_doc, RepositoryDocument)
             assert saved_doc.name == "Money-Laundering-Prevention"
@@ -105,23 +108,23 @@ def test_extract_with_ignored_files(github_crawler, mock_user, test_repo_url):
         create_mock_repo_structure(repo_dir, mock_files)
         
         with patch('tempfile.mkdtemp', return_value=str(temp_dir)), \
-             patch('subprocess.run', return_value=Mock(returncode=0)), \
+             patch('subprocess.run', return_value=Mock(returncode=0, stdout="")), \
              patch('llmops_datacollection.domain.documents.RepositoryDocument.find', return_value=None), \
-             patch('llmops_datacollection.domain.documents.RepositoryDocument.save') as mock_save:
+             patch('llmops_datacollection.application.crawlers.github.bulk_writer') as mock_writer:
             
             github_crawler.extract(test_repo_url, user=mock_user)
             
             # Verify saved content
-            args, _ = mock_save.call_args
+            args, _ = mock_writer.submit.call_args
             saved_doc = args[0]
             assert isinstance(saved_doc, RepositoryDocument)
             
             # Check included/excluded files
-            assert "app.py" in saved_doc.content
-            assert "requirements.txt" in saved_doc.content
-            assert not any(k.startswith(".git/") for k in saved_doc.content.keys())
-            assert not any(k.endswith(".png") for k in saved_doc.content.keys())
-            assert not any(k.endswith(".lock") for k in saved_doc.content.keys())
+            assert "app.py" in saved_doc.content_hashes
+            assert "requirements.txt" in saved_doc.content_hashes
+            assert not any(k.startswith(".git/") for k in saved_doc.content_hashes.keys())
+            assert not any(k.endswith(".png") for k in saved_doc.content_hashes.keys())
+            assert not any(k.endswith(".lock") for k in saved_doc.content_hashes.keys())
     finally:
         if temp_dir.exists():
             shutil.rmtree(temp_dir)
@@ -158,9 +161,9 @@ def test_cli_crawl_command(test_repo_url):
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         with patch('tempfile.mkdtemp', return_value=str(temp_path)), \
-             patch('subprocess.run', return_value=Mock(returncode=0)), \
+             patch('subprocess.run', return_value=Mock(returncode=0, stdout="")), \
              patch('llmops_datacollection.domain.documents.RepositoryDocument.find', return_value=None), \
-             patch('llmops_datacollection.domain.documents.RepositoryDocument.save'):
+             patch('llmops_datacollection.application.crawlers.github.bulk_writer'):
             
             # Create necessary directory structure
             repo_dir = temp_path / "Money-Laundering-Prevention"
@@ -178,9 +181,9 @@ def test_cleanup_after_extraction(github_crawler, mock_user, test_repo_url):
     temp_dir = Path(tempfile.mkdtemp())
     try:
         with patch('tempfile.mkdtemp', return_value=str(temp_dir)), \
-             patch('subprocess.run', return_value=Mock(returncode=0)), \
+             patch('subprocess.run', return_value=Mock(returncode=0, stdout="")), \
              patch('llmops_datacollection.domain.documents.RepositoryDocument.find', return_value=None), \
-             patch('llmops_datacollection.domain.documents.RepositoryDocument.save'):
+             patch('llmops_datacollection.application.crawlers.github.bulk_writer'):
             
             # Create the repository directory
             repo_dir = temp_dir / "Money-Laundering-Prevention"
@@ -194,4 +197,130 @@ def test_cleanup_after_extraction(github_crawler, mock_user, test_repo_url):
     finally:
         # Ensure cleanup in case of test failure
         if temp_dir.exists():
-            shutil.rmtree(temp_dir)
\ No newline at end of file
+            shutil.rmtree(temp_dir)
+def test_read_files_respects_size_limits(mock_repo_content):
+    """Test that files are read in parallel and oversized files are skipped"""
+    crawler = GithubCrawler(max_file_bytes=100, max_total_bytes=10_000, read_workers=4)
+    files = dict(mock_repo_content, **{"data/huge.csv": "x" * 500})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_mock_repo_structure(Path(temp_dir), files)
+        tree = crawler._read_files(temp_dir, crawler._select_files(temp_dir, "repo"))
+
+    assert set(tree) == set(mock_repo_content)
+    assert tree["app.py"] == "fromfastapiimportFastAPI\n"
+
+def test_extract_does_not_change_working_directory(github_crawler, mock_user, test_repo_url):
+    """Test that cloning targets an explicit path instead of chdir-ing"""
+    cwd = os.getcwd()
+    with patch('subprocess.run', return_value=Mock(returncode=0, stdout="")) as mock_run, \
+         patch('llmops_datacollection.domain.documents.RepositoryDocument.find', return_value=None), \
+         patch('llmops_datacollection.application.crawlers.github.bulk_writer'):
+        github_crawler.extract(test_repo_url, user=mock_user)
+
+    assert os.getcwd() == cwd
+    assert mock_run.call_args_list[0][0][0][-1].endswith("Money-Laundering-Prevention")
+
+def test_extract_skips_unchanged_repo(github_crawler, mock_user, test_repo_url):
+    """Test that a repo whose remote HEAD matches the stored SHA is not cloned"""
+    stored = Mock(commit_sha="abc123")
+    with patch.object(GithubCrawler, '_find_stored', return_value=stored), \
+         patch('subprocess.run', return_value=Mock(returncode=0, stdout="abc123\tHEAD\n")) as mock_run:
+        github_crawler.extract(test_repo_url, user=mock_user)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args[0][0][:2] == ["git", "ls-remote"]
+
+def test_update_rereads_only_changed_files(github_crawler):
+    """Test that incremental refreshes only read and store files whose blob SHA changed"""
+    stored = Mock(
+        content={},
+        content_hashes={"app.py": "hash-old", "README.md": "hash-readme", "gone.py": "hash-gone"},
+        file_hashes={"app.py": "sha-old", "README.md": "sha-readme", "gone.py": "sha-gone"},
+    )
+    stored.name = "repo"
+    new_hashes = {"app.py": "sha-new", "README.md": "sha-readme", "new.py": "sha-added"}
+
+    with patch.object(GithubCrawler, '_read_file', side_effect=lambda path: f"read:{Path(path).name}") as mock_read, \
+         patch('os.path.getsize', return_value=10), \
+         patch('llmops_datacollection.application.crawlers.github.BlobDocument.put_many',
+               side_effect=lambda tree: {path: f"hash:{text}" for path, text in tree.items()}) as mock_put:
+        github_crawler._update_changed_files(stored, "/repo", list(new_hashes), new_hashes, "def456")
+
+    assert sorted(Path(c[0][0]).name for c in mock_read.call_args_list) == ["app.py", "new.py"]
+    mock_put.assert_called_once_with({"app.py": "read:app.py", "new.py": "read:new.py"})
+    stored.update.assert_called_once_with(
+        content={},
+        content_hashes={"README.md": "hash-readme", "app.py": "hash:read:app.py", "new.py": "hash:read:new.py"},
+        commit_sha="def456",
+        file_hashes=new_hashes,
+    )
+
+def test_update_moves_inline_texts_to_blob_store(github_crawler):
+    """Test that refreshing a repository stored inline leaves only blob references"""
+    stored = Mock(
+        link="https://github.com/test/repo",
+        content={"app.py": "old", "README.md": "readme"},
+        content_hashes={},
+        file_hashes={"app.py": "sha-old", "README.md": "sha-readme"},
+    )
+    stored.name = "repo"
+    new_hashes = {"app.py": "sha-new", "README.md": "sha-readme"}
+
+    with patch.object(RepositoryDocument, 'find', return_value=stored), \
+         patch.object(GithubCrawler, '_read_file', return_value="new"), \
+         patch('llmops_datacollection.application.crawlers.github.BlobDocument.put_many',
+               side_effect=lambda tree: {path: f"hash:{text}" for path, text in tree.items()}):
+        github_crawler._update_changed_files(stored, "/repo", list(new_hashes), new_hashes, "def456")
+
+    stored.update.assert_called_once_with(
+        content={},
+        content_hashes={"app.py": "hash:new", "README.md": "hash:readme"},
+        commit_sha="def456",
+        file_hashes=new_hashes,
+    )
+
+def test_ingest_flushes_blobs_in_bounded_batches():
+    """Test that file texts reach the blob store in batches of at most flush_bytes"""
+    crawler = GithubCrawler(flush_bytes=50)
+    files = {f"file{i}.py": f"x = {i}\n" * 4 for i in range(5)}  # 24 bytes each
+
+    with tempfile.TemporaryDirectory() as temp_dir, \
+         patch('llmops_datacollection.application.crawlers.github.BlobDocument.put_many',
+               side_effect=lambda tree: {path: f"hash:{path}" for path in tree}) as mock_put:
+        create_mock_repo_structure(Path(temp_dir), files)
+        tree, content_hashes = crawler._ingest_files(temp_dir, sorted(files))
+
+    assert tree == {}
+    assert content_hashes == {path: f"hash:{path}" for path in files}
+    assert [len(c[0][0]) for c in mock_put.call_args_list] == [2, 2, 1]
+
+def test_read_file_strips_spaces_across_chunks():
+    """Test that chunked reads strip spaces the same way as a whole-file read"""
+    text = "def f( a, b ):\n    return a + b\n" * 100_000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "big.py"
+        path.write_text(text)
+        assert GithubCrawler._read_file(str(path)) == text.replace(" ", "")
+
+def test_repository_content_round_trips_through_blob_store(mock_user):
+    """Test that repository texts are stored once per hash and rehydrated on read"""
+    tree = {"LICENSE": "MIT", "COPYING": "MIT", "app.py": "print('blob')"}
+    content_hashes = BlobDocument.put_many(tree)
+    assert content_hashes["LICENSE"] == content_hashes["COPYING"]
+
+    repository = RepositoryDocument(
+        content=tree,
+        name="blob-repo",
+        link="https://github.com/test/blob-repo",
+        platform="github",
+        author_id=mock_user.id,
+        author_full_name=mock_user.full_name,
+        content_hashes=content_hashes,
+    )
+    assert repository.to_mongo()["content"] == {}
+    repository.save()
+
+    assert RepositoryDocument.find(link="https://github.com/test/blob-repo").content == tree
+    assert len(BlobDocument.bulk_find(hash=content_hashes["LICENSE"])) == 1
@@ -158,12 +158,12 @@ def test_extract_new_article(medium_crawler, mock_user):
     # Mock necessary dependencies
     with patch('llmops_datacollection.domain.documents.ArticleDocument.find', return_value=None), \
          patch('llmops_datacollection.application.crawlers.medium.MediumCrawler._scrape_article', return_value=mock_content), \
-         patch('llmops_datacollection.domain.documents.ArticleDocument.save') as mock_save:
+         patch('llmops_datacollection.application.crawlers.medium.bulk_writer') as mock_writer:
         
         medium_crawler.extract(test_url, user=mock_user)
         
         # Verify article was created with correct data
-        mock_save.assert_called_once()
+        mock_writer.submit.assert_called_once()
 
 def test_extract_invalid_url(medium_crawler, mock_user):
     invalid_url = "https://medium.com/nonexistent"
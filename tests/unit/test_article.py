@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from llmops_datacollection.application.crawlers.medium import MediumCrawler
+from llmops_datacollection.application.utils.article import extract_sections, sections_to_text
+from llmops_datacollection.application.utils.html import installed_backends, parse_html
+
+FIXTURES_DIR = Path(__file__).parents[1] / "fixtures" / "html"
+
+def _medium_document(backend=None):
+    return parse_html((FIXTURES_DIR / "medium_article.html").read_text(), backend=backend)
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_sections_keep_article_body_in_order(backend):
+    """Test that headings, paragraphs and code blocks come out in document order."""
+    sections = extract_sections(_medium_document(backend))
+
+    assert sections[0].text.startswith("Crawlers fail in boring ways.")
+    assert [(s.text, s.level) for s in sections if s.type == "heading"] == [
+        ("Natural keys and unique indexes", 2),
+        ("Bulk writes", 3),
+        ("Wrapping up", 2),
+    ]
+    code = [s.text for s in sections if s.type == "code"]
+    assert code == ['collection.create_index("link", unique=True)\n'
+                    'collection.update_one({"link": link}, {"$setOnInsert": doc}, upsert=True)']
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_sections_drop_boilerplate(backend):
+    """Test that navigation, recommendations, tag lists and scripts are left out."""
+    text = sections_to_text(extract_sections(_medium_document(backend)))
+
+    for boilerplate in ("Sign in", "Recommended from Medium", "Data Engineering", "__APOLLO_STATE__", "Privacy"):
+        assert boilerplate not in text
+    assert "Using $setOnInsert means" in text
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_backends_extract_the_same_sections(backend):
+    """Test that every backend walks the article into the same sections as BeautifulSoup."""
+    assert extract_sections(_medium_document(backend)) == extract_sections(_medium_document("html.parser"))
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_no_article_returns_none(backend):
+    """Test that pages without an <article> are reported as such."""
+    assert extract_sections(parse_html("<html><body><p>Just a page</p></body></html>", backend=backend)) is None
+
+def test_medium_content_is_main_text():
+    """Test that Medium articles store the main text and its sections."""
+    data = MediumCrawler._parse_article(_medium_document())
+
+    assert data["Title"] == "Building Reliable Data Pipelines with MongoDB"
+    assert data["Content"].startswith("Crawlers fail in boring ways.")
+    assert data["Sections"][2] == {"type": "heading", "text": "Natural keys and unique indexes", "level": 2}
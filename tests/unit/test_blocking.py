@@ -0,0 +1,53 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from selenium.webdriver.chrome.options import Options
+
+from llmops_datacollection.application.crawlers.blocking import (
+    apply_blocking,
+    apply_blocking_options,
+    get_blocking_profile,
+    page_metrics,
+)
+from llmops_datacollection.domain.exceptions import ImproperlyConfigured
+from llmops_datacollection.settings import BlockingProfile
+
+def test_crawlers_get_configured_profiles():
+    """Test that crawlers use their configured profile and others load everything."""
+    assert get_blocking_profile("MediumCrawler").block_images
+    assert get_blocking_profile("GithubCrawler") == BlockingProfile()
+
+def test_unknown_profile_is_rejected():
+    """Test that a crawler mapped to a missing profile fails loudly."""
+    with patch.dict('llmops_datacollection.settings.settings.BROWSER_CRAWLER_PROFILES', {"MediumCrawler": "bogus"}):
+        with pytest.raises(ImproperlyConfigured):
+            get_blocking_profile("MediumCrawler")
+
+def test_profile_disables_images_and_blocks_urls():
+    """Test that a profile sets Chrome options and CDP URL blocking."""
+    profile = BlockingProfile(block_images=True, blocked_url_patterns=["*.woff2"])
+    options = Options()
+    driver = Mock()
+
+    apply_blocking_options(options, profile)
+    apply_blocking(driver, profile)
+
+    assert "--blink-settings=imagesEnabled=false" in options.arguments
+    assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+    driver.execute_cdp_cmd.assert_called_with("Network.setBlockedURLs", {"urls": ["*.woff2"]})
+
+def test_empty_profile_leaves_driver_alone():
+    """Test that the "none" profile sends no CDP commands."""
+    driver = Mock()
+    apply_blocking(driver, BlockingProfile())
+
+    driver.execute_cdp_cmd.assert_not_called()
+
+def test_page_metrics():
+    """Test that browser timing data is read back, and missing data tolerated."""
+    driver = Mock()
+    driver.execute_script.return_value = {"load_ms": 812.5, "transfer_bytes": 40960, "resources": 12}
+    assert page_metrics(driver).transfer_bytes == 40960
+
+    driver.execute_script.return_value = None
+    assert page_metrics(driver) is None
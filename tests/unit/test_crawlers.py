@@ -1,11 +1,18 @@
+import threading
+import time
+
 import pytest
+from concurrent.futures import Future, wait
 from unittest.mock import Mock, patch
 
+from llmops_datacollection.application.crawlers.base import BaseCrawler
 from llmops_datacollection.application.crawlers.dispatcher import CrawlerDispatcher
 from llmops_datacollection.application.crawlers.linkedin import LinkedInCrawler
 from llmops_datacollection.application.crawlers.medium import MediumCrawler
 from llmops_datacollection.application.crawlers.github import GithubCrawler
 from llmops_datacollection.domain.documents import UserDocument
+from llmops_datacollection.domain.exceptions import DatabaseError
+from llmops_datacollection.settings import DomainLimits, settings
 
 @pytest.fixture
 def user():
@@ -49,16 +56,159 @@ def test_linkedin_crawler(mock_chrome, user):
     """
     
     crawler = LinkedInCrawler()
-    with patch.object(crawler.model, 'bulk_insert') as mock_insert:
+    with patch('llmops_datacollection.application.crawlers.linkedin.bulk_writer') as mock_writer:
         crawler.extract("https://linkedin.com/in/testuser", user=user)
-        mock_insert.assert_called_once()
+        mock_writer.submit_many.assert_called_once()
 
 @patch('subprocess.run')
 def test_github_crawler(mock_run, user):
     """Test GitHub crawler."""
-    mock_run.return_value = Mock(returncode=0)
+    mock_run.return_value = Mock(returncode=0, stdout="")
     
     crawler = GithubCrawler()
-    with patch.object(crawler.model, 'save') as mock_save:
+    with patch('llmops_datacollection.application.crawlers.github.bulk_writer') as mock_writer:
         crawler.extract("https://github.com/testuser/repo", user=user)
-        mock_save.assert_called_once()
\ No newline at end of file
+        mock_writer.submit.assert_called_once()
+
+class _FakeModel:
+    _collection = "fake"
+
+class _FakeCrawler(BaseCrawler):
+    """Crawler stub that fails for links containing 'broken'."""
+
+    model = _FakeModel
+
+    def extract(self, link: str, **kwargs) -> None:
+        if "broken" in link:
+            raise RuntimeError("boom")
+
+class _FailedWriteCrawler(BaseCrawler):
+    """Crawler stub whose document fails to be written."""
+
+    model = _FakeModel
+
+    def extract(self, link: str, **kwargs) -> None:
+        future = Future()
+        future.set_exception(DatabaseError("Failed to write document 1: disk full"))
+        self.pending_writes.append(future)
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_dispatcher_crawl_urls_isolates_errors(max_workers, monkeypatch):
+    """Test that concurrent crawls keep input order and per-link failures."""
+    monkeypatch.setattr(settings, "CRAWL_DEFAULT_LIMITS", DomainLimits(rate=1000, burst=10, max_in_flight=4))
+    dispatcher = CrawlerDispatcher()
+    dispatcher.register("example.com", _FakeCrawler)
+    urls = [
+        "https://example.com/a",
+        "https://example.com/broken",
+        "https://unsupported.com/c",
+        "https://example.com/d",
+    ]
+
+    seen = []
+    results = dispatcher.crawl_urls(urls, max_workers=max_workers, executor="thread", callback=seen.append)
+
+    assert [r.link for r in results] == urls
+    assert [r.successful for r in results] == [True, False, False, True]
+    assert [r.platform for r in results] == ["fake", "fake", "unknown", "fake"]
+    assert results[1].error == "boom"
+    assert len(seen) == len(urls)
+
+class _SlowCrawler(BaseCrawler):
+    """Crawler stub that takes a while to finish."""
+
+    model = _FakeModel
+
+    def extract(self, link: str, **kwargs) -> None:
+        time.sleep(0.05)
+
+def test_dispatcher_blocks_while_all_workers_are_busy(monkeypatch):
+    """Test that a ready domain does not make the dispatcher spin while every worker is busy."""
+    monkeypatch.setattr(settings, "CRAWL_DEFAULT_LIMITS", DomainLimits(rate=1000, burst=10, max_in_flight=4))
+    dispatcher = CrawlerDispatcher()
+    dispatcher.register("example.com", _SlowCrawler)
+    urls = [f"https://example.com/{i}" for i in range(4)]
+
+    with patch('llmops_datacollection.application.crawlers.dispatcher.wait', wraps=wait) as mock_wait:
+        results = dispatcher.crawl_urls(urls, max_workers=2, executor="thread")
+
+    assert all(r.successful for r in results)
+    assert mock_wait.call_count <= len(urls)
+
+class _BufferedWriteCrawler(BaseCrawler):
+    """Crawler stub whose document the writer stores a little later."""
+
+    model = _FakeModel
+    writes: list[Future] = []
+    started_with: list[list[bool]] = []
+
+    def extract(self, link: str, **kwargs) -> None:
+        self.started_with.append([future.done() for future in self.writes])
+        future = Future()
+        threading.Timer(0.1, future.set_exception, [DatabaseError("disk full")]).start()
+        self.writes.append(future)
+        self.pending_writes.append(future)
+
+def test_dispatcher_does_not_wait_for_writes_between_crawls(monkeypatch):
+    """Test that the next crawl starts while the previous one's documents are buffered."""
+    monkeypatch.setattr(settings, "CRAWL_DEFAULT_LIMITS", DomainLimits(rate=1000, burst=10, max_in_flight=4))
+    monkeypatch.setattr(_BufferedWriteCrawler, "writes", [])
+    monkeypatch.setattr(_BufferedWriteCrawler, "started_with", [])
+    dispatcher = CrawlerDispatcher()
+    dispatcher.register("example.com", _BufferedWriteCrawler)
+    urls = ["https://example.com/a", "https://example.com/b"]
+
+    seen = []
+    results = dispatcher.crawl_urls(urls, max_workers=1, callback=seen.append)
+
+    assert _BufferedWriteCrawler.started_with == [[], [False]]
+    assert [r.successful for r in results] == [False, False]
+    assert results[0].error == "disk full"
+    assert len(seen) == len(urls)
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_dispatcher_reports_failed_writes(executor):
+    """Test that a crawl whose documents were not written is reported as failed."""
+    dispatcher = CrawlerDispatcher()
+    dispatcher.register("example.com", _FailedWriteCrawler)
+    crawl = dispatcher.crawl_url_and_flush if executor == "process" else dispatcher.crawl_url
+
+    result = crawl("https://example.com/a")
+
+    assert not result.successful
+    assert result.error == "Failed to write document 1: disk full"
+
+ARTICLE_HTML = """
+<html><body><article>
+    <h1 class="pw-post-title">Test Title</h1>
+    <h2 class="pw-subtitle-paragraph">Test Subtitle</h2>
+    <p>Body</p>
+</article></body></html>
+"""
+
+def test_medium_crawler_uses_http_when_markup_present():
+    """Test that Medium articles are fetched without a browser when possible."""
+    crawler = MediumCrawler()
+    with patch('llmops_datacollection.application.crawlers.medium.fetch_html', return_value=ARTICLE_HTML), \
+         patch.object(MediumCrawler, '_setup_driver') as mock_setup:
+        data = crawler._scrape_article("https://medium.com/@testuser/article")
+
+    mock_setup.assert_not_called()
+    assert data["Title"] == "Test Title"
+    assert data["Subtitle"] == "Test Subtitle"
+
+def test_medium_crawler_falls_back_to_browser():
+    """Test that the Selenium path is used when the HTTP page lacks the title."""
+    mock_driver = Mock()
+    mock_driver.page_source = ARTICLE_HTML
+    mock_driver.execute_script.return_value = 1000
+
+    crawler = MediumCrawler()
+    with patch('llmops_datacollection.application.crawlers.medium.fetch_html', return_value="<html></html>"), \
+         patch.object(MediumCrawler, '_setup_driver', return_value=mock_driver), \
+         patch('time.sleep'):
+        data = crawler._scrape_article("https://medium.com/@testuser/article")
+
+    mock_driver.get.assert_called_once_with("https://medium.com/@testuser/article")
+    assert data["Title"] == "Test Title"
+    assert crawler._driver is None
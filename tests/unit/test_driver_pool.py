@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import Mock
+
+from selenium.common.exceptions import WebDriverException
+
+from llmops_datacollection.application.crawlers.driver_pool import WebDriverPool
+from llmops_datacollection.domain.exceptions import CrawlerError
+
+def make_driver():
+    """Create a mock driver that passes health checks."""
+    driver = Mock()
+    driver.execute_script.return_value = 1
+    driver.window_handles = ["main"]
+    return driver
+
+@pytest.fixture
+def pool():
+    return WebDriverPool(max_size=2, max_uses=3, checkout_timeout=0.1)
+
+def test_checkout_reuses_warm_driver(pool):
+    """Test that a checked-in driver is reset and handed out again."""
+    factory = Mock(side_effect=make_driver)
+
+    driver = pool.checkout("medium", factory)
+    pool.checkin(driver)
+
+    assert pool.checkout("medium", factory) is driver
+    assert factory.call_count == 1
+    driver.delete_all_cookies.assert_called_once()
+    driver.get.assert_called_with("about:blank")
+
+def test_driver_recycled_after_max_uses(pool):
+    """Test that drivers are quit once they reach max_uses."""
+    factory = Mock(side_effect=make_driver)
+
+    driver = pool.checkout("medium", factory)
+    for _ in range(2):
+        pool.checkin(driver)
+        assert pool.checkout("medium", factory) is driver
+    pool.checkin(driver)
+
+    driver.quit.assert_called_once()
+    assert pool.checkout("medium", factory) is not driver
+
+def test_unhealthy_driver_replaced(pool):
+    """Test that a driver failing the health check is not handed out."""
+    factory = Mock(side_effect=make_driver)
+
+    driver = pool.checkout("medium", factory)
+    pool.checkin(driver)
+    driver.execute_script.side_effect = WebDriverException("crashed")
+
+    replacement = pool.checkout("medium", factory)
+
+    assert replacement is not driver
+    driver.quit.assert_called_once()
+
+def test_checkout_times_out_when_exhausted(pool):
+    """Test that checkout raises once every slot is busy."""
+    factory = Mock(side_effect=make_driver)
+    pool.checkout("medium", factory)
+    pool.checkout("medium", factory)
+
+    with pytest.raises(CrawlerError):
+        pool.checkout("medium", factory)
+
+def test_idle_driver_of_other_profile_evicted(pool):
+    """Test that idle drivers of another profile make room for a new one."""
+    factory = Mock(side_effect=make_driver)
+    medium = pool.checkout("medium", factory)
+    pool.checkout("medium", factory)
+    pool.checkin(medium)
+
+    linkedin = pool.checkout("linkedin", factory)
+
+    assert linkedin is not medium
+    medium.quit.assert_called_once()
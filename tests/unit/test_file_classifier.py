@@ -0,0 +1,69 @@
+import pytest
+
+from llmops_datacollection.application.crawlers.file_classifier import FileClassifier, parse_gitattributes
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with source, generated and binary files."""
+    files = {
+        "app.py": b"print('hello')\n",
+        "static/app.min.js": b"var a=1;\n",
+        "static/bundle.js": b"var a=1;" * 2000,
+        "docs/logo.dat": b"\x89PNG\r\n\x1a\n" + b"\0" * 100,
+        "gen/models.py": b"class Model: pass\n",
+        "vendor/lib.py": b"def lib(): pass\n",
+        "notebook.ipynb": b"{}" + b" " * 500,
+    }
+    for path, content in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(content)
+    (tmp_path / ".gitattributes").write_text(
+        "gen/** linguist-generated\n"
+        "gen/models.py -linguist-generated\n"
+        "*.py linguist-vendored=false\n"
+        "vendor/** linguist-vendored\n"
+    )
+    return tmp_path
+
+def _skip_reasons(repo, classifier):
+    return {
+        path.relative_to(repo).as_posix(): classifier.skip_reason(
+            path.relative_to(repo).as_posix(), str(path), path.stat().st_size
+        )
+        for path in repo.rglob("*")
+        if path.is_file() and path.name != ".gitattributes"
+    }
+
+def test_classifier_skips_non_source_files(repo):
+    """Test that binary, minified, vendored and generated files are skipped."""
+    classifier = FileClassifier.for_repository(str(repo), exclude=["*.min.js"], max_notebook_bytes=100)
+
+    assert _skip_reasons(repo, classifier) == {
+        "app.py": None,
+        "static/app.min.js": "excluded",
+        "static/bundle.js": "minified",
+        "docs/logo.dat": "binary content",
+        "gen/models.py": None,
+        "vendor/lib.py": "linguist-vendored",
+        "notebook.ipynb": "notebook with outputs",
+    }
+
+def test_classifier_include_globs(repo):
+    """Test that include globs restrict ingestion to matching files."""
+    classifier = FileClassifier(include=["*.py"])
+
+    reasons = _skip_reasons(repo, classifier)
+    assert reasons["app.py"] is None
+    assert reasons["static/bundle.js"] == "not included"
+
+def test_parse_gitattributes():
+    """Test parsing linguist attributes and their negations."""
+    assert parse_gitattributes(
+        "# comment\n"
+        "*.js linguist-generated=true text\n"
+        "lib/* -linguist-vendored\n"
+        "*.txt text\n"
+    ) == [
+        ("*.js", {"linguist-generated": True}),
+        ("lib/*", {"linguist-vendored": False}),
+    ]
@@ -0,0 +1,211 @@
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from llmops_datacollection.application.crawlers.dispatcher import CrawlerDispatcher, CrawlResult
+from llmops_datacollection.application.crawlers.frontier import CrawlFrontier
+from llmops_datacollection.domain.documents import FrontierDocument
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def links():
+    run = uuid.uuid4().hex
+    return [f"https://medium.com/@user/post-{run}-{i}" for i in range(3)]
+
+
+@pytest.fixture
+def frontier(clock):
+    FrontierDocument.invalidate_metadata()
+    return CrawlFrontier(
+        lease_seconds=600, max_attempts=3, retry_base=60, retry_max=100, revisit_after=None, clock=clock,
+    )
+
+
+def _fail(link: str) -> CrawlResult:
+    return CrawlResult(link=link, platform="articles", error="boom")
+
+
+def _succeed(link: str) -> CrawlResult:
+    return CrawlResult(link=link, platform="articles", successful=True)
+
+
+def _claim(frontier: CrawlFrontier, links: list[str]) -> list[str]:
+    return [link for link in links if frontier.claim(link)]
+
+
+def test_claim_leases_pending_links_once(frontier, links):
+    """Test claimed links are not handed out again while their lease holds."""
+    frontier.add(links)
+    assert frontier.ready(links) == links
+    assert frontier.summary(links) == {"pending": 3}
+
+    assert _claim(frontier, links) == links
+    assert _claim(frontier, links) == []
+    assert frontier.ready(links) == []
+    assert frontier.summary(links) == {"in_progress": 3}
+
+
+def test_add_keeps_existing_state(frontier, links):
+    """Test re-adding links does not reset their state."""
+    frontier.add(links)
+    frontier.claim(links[0])
+    frontier.record(_succeed(links[0]))
+
+    frontier.add(links)
+    assert _claim(frontier, links) == links[1:]
+
+
+def test_done_links_are_skipped(frontier, links, clock):
+    """Test a resumed run only crawls links that were not done."""
+    frontier.add(links)
+    _claim(frontier, links)
+    frontier.record(_succeed(links[0]))
+
+    # The run dies here; its leases expire
+    clock.advance(601)
+    assert _claim(frontier, links) == links[1:]
+
+
+def test_failed_links_back_off(frontier, links, clock):
+    """Test failed links are retried once their exponential backoff has passed."""
+    frontier.add(links[:1])
+    frontier.claim(links[0])
+    frontier.record(_fail(links[0]))
+
+    doc = FrontierDocument.find(link=links[0])
+    assert doc.state == "failed"
+    assert doc.attempts == 1
+    assert doc.last_error == "boom"
+    assert _claim(frontier, links[:1]) == []
+
+    clock.advance(60)
+    assert _claim(frontier, links[:1]) == links[:1]
+    frontier.record(_fail(links[0]))
+
+    clock.advance(60)
+    assert _claim(frontier, links[:1]) == []
+    clock.advance(40)  # Second delay is capped at retry_max
+    assert _claim(frontier, links[:1]) == links[:1]
+
+
+def test_failure_schedules_retry_in_one_update(frontier, links, clock):
+    """Test a failed link never becomes claimable without its backoff."""
+    frontier.add(links[:1])
+    frontier.claim(links[0])
+    collection = Mock(wraps=frontier._collection())
+    with patch.object(CrawlFrontier, "_collection", return_value=collection):
+        frontier.record(_fail(links[0]))
+
+    assert [name for name, *_ in collection.method_calls] == ["update_one"]
+    assert FrontierDocument.find(link=links[0]).next_attempt_at == clock.now + timedelta(seconds=60)
+
+
+def test_record_ignores_lost_leases(frontier, links, clock):
+    """Test a run whose lease expired cannot overwrite the run that took the link over."""
+    other = CrawlFrontier(lease_seconds=600, max_attempts=3, retry_base=60, retry_max=100, clock=clock)
+    frontier.add(links[:1])
+    frontier.claim(links[0])
+
+    clock.advance(601)
+    assert other.claim(links[0])
+    frontier.record(_fail(links[0]))
+    assert frontier.summary(links[:1]) == {"in_progress": 1}
+
+    other.record(_succeed(links[0]))
+    assert frontier.summary(links[:1]) == {"done": 1}
+
+
+def test_links_are_given_up_after_max_attempts(frontier, links, clock):
+    """Test a link stays failed once it used up its attempts."""
+    frontier.add(links[:1])
+    for _ in range(3):
+        clock.advance(1000)
+        assert _claim(frontier, links[:1]) == links[:1]
+        frontier.record(_fail(links[0]))
+
+    clock.advance(10_000)
+    assert _claim(frontier, links[:1]) == []
+    assert frontier.summary(links[:1]) == {"failed": 1}
+
+
+def test_done_links_are_revisited(frontier, links, clock):
+    """Test done links become ready again after the revisit period."""
+    frontier.revisit_after = 3600
+    frontier.add(links[:1])
+    frontier.claim(links[0])
+    frontier.record(_succeed(links[0]))
+
+    assert _claim(frontier, links[:1]) == []
+    clock.advance(3600)
+    assert _claim(frontier, links[:1]) == links[:1]
+
+
+def test_retry_delay():
+    """Test the backoff doubles per failure up to the cap."""
+    frontier = CrawlFrontier(lease_seconds=1, max_attempts=5, retry_base=10, retry_max=50)
+    assert [frontier.retry_delay(attempts) for attempts in range(1, 5)] == [10, 20, 40, 50]
+
+
+def test_dispatcher_records_results(frontier, links):
+    """Test the dispatcher records each finished crawl in the frontier."""
+    dispatcher = CrawlerDispatcher.build()
+    frontier.add(links[:2])
+
+    with patch.object(
+        dispatcher, "_crawl", Mock(side_effect=[(_succeed(links[0]), []), (_fail(links[1]), [])])
+    ):
+        dispatcher.crawl_urls(links[:2], max_workers=1, frontier=frontier)
+
+    assert frontier.summary(links[:2]) == {"done": 1, "failed": 1}
+
+
+def test_dispatcher_leases_links_when_they_start(frontier, links, clock):
+    """Test links queued behind rate limits are not leased, and taken links are skipped."""
+    other = CrawlFrontier(lease_seconds=600, max_attempts=3, retry_base=60, retry_max=100, clock=clock)
+    dispatcher = CrawlerDispatcher.build()
+    frontier.add(links)
+    leased = []
+
+    def crawl(url, **kwargs):
+        leased.append(frontier.summary(links).get("in_progress", 0))
+        if url == links[0]:
+            other.claim(links[1])  # A concurrent run starts the next link first
+        return _succeed(url), []
+
+    with patch.object(dispatcher, "_crawl", Mock(side_effect=crawl)):
+        results = dispatcher.crawl_urls(links, max_workers=1, frontier=frontier)
+
+    assert [result.link for result in results] == [links[0], links[2]]
+    assert leased == [1, 2]  # Our running crawl, plus the other run's
+    assert FrontierDocument.find(link=links[1]).lease_owner == other.owner
+
+
+def test_dispatcher_releases_unfinished_leases(frontier, links):
+    """Test an interrupted run hands its running links back right away."""
+    dispatcher = CrawlerDispatcher.build()
+    frontier.add(links[:1])
+
+    with patch.object(dispatcher, "_crawl", Mock(side_effect=KeyboardInterrupt)), \
+         pytest.raises(KeyboardInterrupt):
+        dispatcher.crawl_urls(links[:1], max_workers=1, frontier=frontier)
+
+    assert frontier.summary(links[:1]) == {"pending": 1}
+    assert frontier.ready(links[:1]) == links[:1]
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from llmops_datacollection.application.crawlers.linkedin import POST_SELECTOR
+from llmops_datacollection.application.utils.html import installed_backends, parse_html, resolve_backend
+from llmops_datacollection.domain.exceptions import ImproperlyConfigured
+
+FIXTURES_DIR = Path(__file__).parents[1] / "fixtures" / "html"
+
+@pytest.fixture
+def linkedin_feed():
+    return (FIXTURES_DIR / "linkedin_feed.html").read_text()
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_backends_extract_the_same_posts(backend, linkedin_feed):
+    """Test that every backend extracts the same post texts as BeautifulSoup."""
+    expected = parse_html(linkedin_feed, backend="html.parser").texts(POST_SELECTOR)
+    document = parse_html(linkedin_feed, only=POST_SELECTOR, backend=backend)
+
+    assert len(expected) == 30
+    assert document.texts(POST_SELECTOR) == expected
+    assert document.texts(POST_SELECTOR, limit=5) == expected[:5]
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_document_queries(backend):
+    """Test first_text, exists and whole-document text."""
+    document = parse_html("<html><body><h1 class='title big'> A <b>title</b></h1><p>body</p></body></html>", backend=backend)
+
+    assert document.first_text("h1.title") == "Atitle"
+    assert document.exists("p")
+    assert not document.exists("article")
+    assert "body" in document.text()
+
+def test_targeted_soup_parse_keeps_only_matching_subtrees(linkedin_feed):
+    """Test that the BeautifulSoup fallback skips everything outside the requested selector."""
+    document = parse_html(linkedin_feed, only=POST_SELECTOR, backend="html.parser")
+
+    assert "People also viewed" not in document.text()
+    assert document.first_text(POST_SELECTOR).startswith("Post 0:")
+
+def test_unknown_backend_is_rejected():
+    """Test that a misconfigured parser fails loudly."""
+    with pytest.raises(ImproperlyConfigured):
+        resolve_backend("html5lib")
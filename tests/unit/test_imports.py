@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+def test_import_does_not_connect():
+    """Test that importing crawlers neither connects to MongoDB nor provisions chromedriver."""
+    code = (
+        "import llmops_datacollection.application.crawlers.dispatcher\n"
+        "from llmops_datacollection.application.crawlers.base import _chromedriver_path\n"
+        "from llmops_datacollection.infrastructure.db.mongo import connection\n"
+        "assert connection._client is None\n"
+        "assert _chromedriver_path.cache_info().currsize == 0\n"
+    )
+    env = dict(os.environ, MONGODB_URI="mongodb://localhost:1/?serverSelectionTimeoutMS=100")
+
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch, MagicMock
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
 
+from llmops_datacollection.application.crawlers.driver_pool import WebDriverPool
 from llmops_datacollection.application.crawlers.linkedin import LinkedInCrawler
 from llmops_datacollection.domain.documents import UserDocument, PostDocument
 from llmops_datacollection.domain.exceptions import CrawlerError
@@ -74,15 +75,16 @@ def test_post_extraction(linkedin_crawler, test_user):
     </div>
     """
     
-    with patch.object(PostDocument, 'bulk_insert') as mock_insert:
+    with patch('llmops_datacollection.application.crawlers.linkedin.bulk_writer') as mock_writer, \
+         patch('llmops_datacollection.application.crawlers.linkedin.settings.LINKEDIN_INCREMENTAL', False):
         linkedin_crawler._scroll_and_extract_posts(
             "https://linkedin.com/in/testuser",
             test_user
         )
         
         # Verify post extraction
-        mock_insert.assert_called_once()
-        posts = mock_insert.call_args[0][0]
+        mock_writer.submit_many.assert_called_once()
+        posts = mock_writer.submit_many.call_args[0][0]
         assert len(posts) > 0
         assert all(isinstance(p, PostDocument) for p in posts)
 
@@ -101,4 +103,109 @@ def test_login_timeout(linkedin_crawler):
     linkedin_crawler.driver.find_element.side_effect = TimeoutException()
     
     with pytest.raises(CrawlerError):
-        linkedin_crawler.login()
\ No newline at end of file
+        linkedin_crawler.login()
+
+def test_login_challenge_blocks_login(linkedin_crawler):
+    """Test that a security challenge after submitting credentials fails the login."""
+    linkedin_crawler.driver.current_url = "https://www.linkedin.com/checkpoint/challenge/abc"
+
+    with patch.object(LinkedInCrawler, '_save_session') as mock_save, \
+         patch.object(LinkedInCrawler, '_save_debug_screenshot'), \
+         pytest.raises(CrawlerError, match="security challenge"):
+        linkedin_crawler.login()
+
+    mock_save.assert_not_called()
+    assert not linkedin_crawler._session_expired()
+
+
+def _browser_with_session(driver):
+    """Make a mock driver hold a LinkedIn session, scoping cookies like Chrome does."""
+    session = {"name": "li_at", "value": "token", "domain": ".linkedin.com"}
+    driver.current_url = "https://www.linkedin.com/feed/"
+    driver.window_handles = ["main"]
+
+    def get(url):
+        driver.current_url = url
+
+    def get_cookie(name):
+        # WebDriver only sees cookies of the current document
+        return session if "linkedin.com" in driver.current_url and name == session["name"] else None
+
+    def execute_cdp_cmd(command, params):
+        if command == "Network.getCookies" and any("linkedin.com" in url for url in params["urls"]):
+            return {"cookies": [session]}
+        return {"cookies": []}
+
+    driver.get.side_effect = get
+    driver.get_cookie.side_effect = get_cookie
+    driver.execute_cdp_cmd.side_effect = execute_cdp_cmd
+
+
+def test_pooled_session_is_reused(linkedin_crawler, test_user):
+    """Test that a driver checked back into the pool keeps its session for the next crawl."""
+    _browser_with_session(linkedin_crawler.driver)
+    WebDriverPool._reset(linkedin_crawler.driver, reset_cookies=False)
+    assert linkedin_crawler.driver.current_url == "about:blank"
+
+    with patch.object(LinkedInCrawler, 'login') as mock_login, \
+         patch.object(LinkedInCrawler, '_restore_session') as mock_restore, \
+         patch.object(LinkedInCrawler, '_scroll_and_extract_posts'), \
+         patch.object(LinkedInCrawler, 'release_driver'):
+        linkedin_crawler.extract("https://linkedin.com/in/testuser", user=test_user)
+
+    mock_login.assert_not_called()
+    mock_restore.assert_not_called()
+
+def test_expired_session_logs_in_again(linkedin_crawler, test_user):
+    """Test that a redirect to the login wall triggers a single re-login."""
+    linkedin_crawler.driver.execute_cdp_cmd.return_value = {"cookies": [{"name": "li_at", "value": "stale"}]}
+    urls = iter(["https://www.linkedin.com/authwall?trk=x", "https://www.linkedin.com/in/testuser/"])
+    type(linkedin_crawler.driver).current_url = property(lambda _: next(urls))
+
+    with patch.object(LinkedInCrawler, 'login') as mock_login, \
+         patch.object(LinkedInCrawler, '_scroll_and_extract_posts'), \
+         patch.object(LinkedInCrawler, 'release_driver'), \
+         patch('llmops_datacollection.application.crawlers.linkedin.session_store') as mock_store:
+        linkedin_crawler.extract("https://linkedin.com/in/testuser", user=test_user)
+
+    mock_login.assert_called_once()
+    mock_store.clear.assert_called_once()
+
+def test_incremental_extraction_stops_at_known_post(linkedin_crawler, test_user):
+    """Test that posts are collected per scroll until an already stored post shows up."""
+    batches = [
+        [{"urn": "urn:li:activity:3", "text": "Newest"}, {"urn": "urn:li:activity:2", "text": "Newer"}],
+        [{"urn": "urn:li:activity:1", "text": "Stored"}, {"urn": "urn:li:activity:0", "text": "Oldest"}],
+    ]
+    scripts = []
+
+    def execute_script(script, *args):
+        scripts.append(script)
+        return batches.pop(0) if args else None
+
+    linkedin_crawler.driver.execute_script.side_effect = execute_script
+
+    with patch('llmops_datacollection.application.crawlers.linkedin.bulk_writer') as mock_writer, \
+         patch('llmops_datacollection.application.crawlers.linkedin.wait_for_page_settled'), \
+         patch('llmops_datacollection.application.crawlers.linkedin.WebDriverWait'):
+        linkedin_crawler._scroll_and_extract_posts(
+            "https://linkedin.com/in/testuser", test_user, known={"urn:li:activity:1"}
+        )
+
+    posts = mock_writer.submit_many.call_args[0][0]
+    assert [post.content["urn"] for post in posts] == ["urn:li:activity:3", "urn:li:activity:2"]
+    assert batches == []
+    assert len(scripts) == 3  # collect, scroll, collect
+
+def test_extract_passes_stored_post_ids(linkedin_crawler, test_user):
+    """Test that a crawled profile is re-crawled for new posts only."""
+    stored = [PostDocument.model_construct(post_id="urn:li:activity:1")]
+    linkedin_crawler.driver.current_url = "https://www.linkedin.com/in/testuser/"
+
+    with patch.object(PostDocument, 'iter_find', return_value=iter(stored)), \
+         patch.object(LinkedInCrawler, 'ensure_session'), \
+         patch.object(LinkedInCrawler, '_scroll_and_extract_posts') as mock_extract, \
+         patch.object(LinkedInCrawler, 'release_driver'):
+        linkedin_crawler.extract("https://linkedin.com/in/testuser", user=test_user)
+
+    assert mock_extract.call_args[0][2] == {"urn:li:activity:1"}
@@ -1,8 +1,18 @@
+import asyncio
+import uuid
+
 import pytest
 from unittest.mock import Mock, patch
 
-from llmops_datacollection.domain.documents import UserDocument
+from llmops_datacollection.domain.documents import (
+    ArticleDocument,
+    BlobDocument,
+    PostDocument,
+    RepositoryDocument,
+    UserDocument,
+)
 from llmops_datacollection.domain.exceptions import DatabaseError
+from llmops_datacollection.infrastructure.db.mongo import AsyncMongoDBConnector, connection
 
 def test_user_creation():
     """Test user document creation."""
@@ -70,4 +80,186 @@ def test_multiple_users(first_name, last_name):
     )
     saved_user = user.save()
     assert saved_user is not None
-    assert saved_user.full_name == f"{first_name} {last_name}"
\ No newline at end of file
+    assert saved_user.full_name == f"{first_name} {last_name}"
+def test_article_save_skips_duplicate_link():
+    """Test that saving an already stored link does not duplicate it."""
+    article = ArticleDocument(
+        content={"Content": "text"},
+        platform="medium",
+        author_id=UserDocument(first_name="Jane", last_name="Doe").id,
+        author_full_name="Jane Doe",
+        link="https://medium.com/@jane/dedup",
+        title="Dedup",
+    )
+    assert article.save() is not None
+    assert article.model_copy(update={"id": uuid.uuid4()}).save() is None
+    assert len(ArticleDocument.bulk_find(link=article.link)) == 1
+
+def test_article_bulk_insert_upserts_by_link():
+    """Test that bulk insertion skips links that are already stored."""
+    author = UserDocument(first_name="Jane", last_name="Doe")
+    articles = [
+        ArticleDocument(
+            content={"Content": "text"},
+            platform="medium",
+            author_id=author.id,
+            author_full_name=author.full_name,
+            link=f"https://medium.com/@jane/bulk-{i % 2}",
+            title="Bulk",
+        )
+        for i in range(4)
+    ]
+    assert ArticleDocument.bulk_insert(articles) is True
+    assert len(ArticleDocument.bulk_find(title="Bulk")) == 2
+
+def test_post_bulk_insert_upserts_by_post_id():
+    """Test that re-crawled posts are only written when their identity is new."""
+    author = UserDocument(first_name="Jane", last_name="Doe")
+    link = "https://www.linkedin.com/in/jane-posts"
+
+    def post(text: str, urn: str | None = None) -> PostDocument:
+        content = {"text": text, "urn": urn} if urn else {"text": text}
+        return PostDocument(
+            content=content, platform="linkedin", author_id=author.id, author_full_name=author.full_name, link=link,
+        )
+
+    assert post("same text").post_id == post("same text").post_id
+    assert post("edited", urn="urn:li:activity:1").post_id == "urn:li:activity:1"
+
+    assert PostDocument.bulk_insert([post("first"), post("second", urn="urn:li:activity:2")]) is True
+    assert PostDocument.bulk_insert([post("first"), post("second", urn="urn:li:activity:2"), post("third")]) is True
+    assert sorted(p.content["text"] for p in PostDocument.bulk_find(link=link)) == ["first", "second", "third"]
+
+def test_post_id_ignores_whitespace():
+    """Test that both LinkedIn collection modes give a post the same identity."""
+    link = "https://www.linkedin.com/in/jane-posts"
+    inner_text = "First line\n\nSecond  line"  # innerText.trim() in the browser
+    parsed_text = "First lineSecond  line"  # get_text(strip=True) of the same post
+
+    assert PostDocument.make_post_id(link, inner_text) == PostDocument.make_post_id(link, parsed_text)
+    assert PostDocument.make_post_id(link, "first") != PostDocument.make_post_id(link, "second")
+
+def test_iter_find_streams_with_sort_skip_and_limit():
+    """Test streaming users in sorted pages."""
+    UserDocument.bulk_insert([
+        UserDocument(first_name=f"Stream{i}", last_name="Iter")
+        for i in range(5)
+    ])
+
+    users = UserDocument.iter_find(
+        last_name="Iter",
+        sort=[("first_name", -1)],
+        skip=1,
+        limit=2,
+        batch_size=1,
+    )
+    assert [user.first_name for user in users] == ["Stream3", "Stream2"]
+
+def test_iter_find_with_projection():
+    """Test that projected documents only carry the requested fields."""
+    UserDocument(first_name="Projected", last_name="Iter").save()
+
+    user = next(UserDocument.iter_find(first_name="Projected", projection=["first_name"]))
+    assert user.first_name == "Projected"
+    assert "last_name" not in user.model_fields_set
+
+@pytest.fixture
+def threaded_async_connection():
+    """Serve the async code path from the sync test database."""
+    with patch(
+        'llmops_datacollection.domain.base.async_connection',
+        AsyncMongoDBConnector.from_sync(connection),
+    ):
+        yield
+
+def test_async_get_or_create(threaded_async_connection):
+    """Test that async get_or_create returns the user it created."""
+    async def run():
+        return [
+            await UserDocument.aget_or_create(first_name="Async", last_name="Smith")
+            for _ in range(2)
+        ]
+
+    users = asyncio.run(run())
+    assert len({user.id for user in users}) == 1
+    assert UserDocument.find(first_name="Async").id == users[0].id
+
+def test_async_save_bulk_insert_and_find(threaded_async_connection):
+    """Test async writes and reads of articles."""
+    author = UserDocument(first_name="Jane", last_name="Doe")
+    articles = [
+        ArticleDocument(
+            content={"Content": "text"},
+            platform="medium",
+            author_id=author.id,
+            author_full_name=author.full_name,
+            link=f"https://medium.com/@jane/async-{i}",
+            title="Async",
+        )
+        for i in range(3)
+    ]
+
+    async def run():
+        saved = await articles[0].asave()
+        duplicate = await articles[0].model_copy(update={"id": uuid.uuid4()}).asave()
+        inserted = await ArticleDocument.abulk_insert(articles)
+        found = await ArticleDocument.afind(link=articles[2].link)
+        return saved, duplicate, inserted, found
+
+    saved, duplicate, inserted, found = asyncio.run(run())
+    assert saved is not None
+    assert duplicate is None
+    assert inserted is True
+    assert found.id == articles[2].id
+    assert len(ArticleDocument.bulk_find(title="Async")) == 3
+
+def test_async_find_loads_blobs_and_sets_up_collection(threaded_async_connection):
+    """Test that async reads set up the collection and load blob texts without sync calls."""
+    tree = {"app.py": "print('async blob')"}
+    repository = RepositoryDocument(
+        content=tree,
+        platform="github",
+        author_id=uuid.uuid4(),
+        author_full_name="Jane Doe",
+        name="async-repo",
+        link="https://github.com/jane/async-repo",
+        content_hashes=BlobDocument.put_many(tree),
+    )
+    repository.save()
+    RepositoryDocument.invalidate_metadata()
+
+    with patch.object(RepositoryDocument, "ensure_indexes", wraps=RepositoryDocument.ensure_indexes) as mock_ensure, \
+         patch.object(BlobDocument, "get_many", side_effect=AssertionError("sync blob fetch")):
+        found = asyncio.run(RepositoryDocument.afind(link=repository.link))
+
+    mock_ensure.assert_called_once()
+    assert found.content == tree
+
+def test_known_uuid_fields_match_full_walk():
+    """Test that encoding only declared UUID fields matches the full walk."""
+    repository = RepositoryDocument(
+        content={"app.py": "print('hi')", "nested": {"README.md": "docs"}},
+        platform="github",
+        author_id=uuid.uuid4(),
+        author_full_name="Jane Doe",
+        name="repo",
+        link="https://github.com/jane/repo",
+    )
+    mongo_doc = repository.to_mongo()
+
+    assert RepositoryDocument._uuid_fields() == ("_id", "author_id")
+    assert repository._to_prepared_mongo() == connection.prepare_document_for_insertion(mongo_doc)
+
+def test_collection_metadata_is_cached():
+    """Test that document operations skip collection probes once ready."""
+    UserDocument.get_collection_name()
+
+    with patch.object(connection, "list_collection_names", wraps=connection.list_collection_names) as mock_list:
+        UserDocument.get_collection_name()
+        UserDocument.find(first_name="Cached")
+        mock_list.assert_not_called()
+
+        UserDocument.invalidate_metadata()
+        UserDocument.get_collection_name()
+        UserDocument.get_collection_name()
+        mock_list.assert_called_once()
@@ -0,0 +1,79 @@
+import pytest
+from pydantic import ValidationError
+
+from llmops_datacollection.application.crawlers.scheduler import DomainScheduler, TokenBucket
+from llmops_datacollection.settings import DomainLimits
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_token_bucket_refills_at_rate(clock):
+    """Test that tokens are consumed and refilled at the configured rate."""
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.time_until_available() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.try_acquire()
+
+def test_scheduler_interleaves_domains(clock):
+    """Test that tasks are handed out round-robin across domains."""
+    default = DomainLimits(rate=100, burst=10, max_in_flight=10)
+    scheduler = DomainScheduler(limits={}, default=default, clock=clock)
+    for i in range(3):
+        scheduler.add("medium.com", f"m{i}")
+    scheduler.add("github.com", "g0")
+
+    order = [scheduler.next_ready()[1] for _ in range(4)]
+
+    assert order == ["m0", "g0", "m1", "m2"]
+    assert len(scheduler) == 0
+
+def test_scheduler_enforces_in_flight_cap(clock):
+    """Test that a domain at its in-flight cap does not block other domains."""
+    limits = {"linkedin.com": DomainLimits(rate=100, burst=10, max_in_flight=1)}
+    scheduler = DomainScheduler(limits=limits, default=DomainLimits(rate=100, burst=10), clock=clock)
+    scheduler.add("linkedin.com", "l0")
+    scheduler.add("linkedin.com", "l1")
+    scheduler.add("github.com", "g0")
+
+    assert scheduler.next_ready() == ("linkedin.com", "l0")
+    assert scheduler.next_ready() == ("github.com", "g0")
+    assert scheduler.next_ready() is None
+    assert scheduler.time_until_ready() is None
+
+    scheduler.release("linkedin.com")
+    assert scheduler.next_ready() == ("linkedin.com", "l1")
+
+def test_scheduler_enforces_rate(clock):
+    """Test that a domain's token bucket delays its next task."""
+    limits = {"medium.com": DomainLimits(rate=0.5, burst=1, max_in_flight=5)}
+    scheduler = DomainScheduler(limits=limits, default=DomainLimits(), clock=clock)
+    scheduler.add("medium.com", "m0")
+    scheduler.add("medium.com", "m1")
+
+    assert scheduler.next_ready() == ("medium.com", "m0")
+    assert scheduler.next_ready() is None
+    assert scheduler.time_until_ready() == pytest.approx(2.0)
+
+    clock.now += 2.0
+    assert scheduler.next_ready() == ("medium.com", "m1")
+
+@pytest.mark.parametrize("limits", [{"rate": 0}, {"rate": -1}, {"burst": 0}, {"max_in_flight": 0}])
+def test_domain_limits_are_validated(limits):
+    """Test that limits which would stall the scheduler are rejected."""
+    with pytest.raises(ValidationError):
+        DomainLimits(**limits)
@@ -0,0 +1,41 @@
+import os
+import time
+
+import pytest
+
+from llmops_datacollection.application.crawlers.session_store import SessionStore
+
+COOKIES = [
+    {"name": "li_at", "value": "secret-token", "domain": ".linkedin.com", "path": "/", "sameSite": "None"},
+    {"name": "old", "value": "x", "domain": ".linkedin.com", "path": "/", "expiry": int(time.time()) - 10},
+]
+
+def test_store_without_key_keeps_cookies_in_memory(tmp_path):
+    """Test that without a key cookies live in memory only."""
+    store = SessionStore(str(tmp_path / "session"), key=None)
+    store.save(COOKIES)
+
+    assert [cookie["name"] for cookie in store.load()] == ["li_at"]
+    assert "sameSite" not in store.load()[0]
+    assert not os.listdir(tmp_path)
+
+def test_store_persists_encrypted_cookies(tmp_path):
+    """Test that cookies survive a restart and are not stored in plain text."""
+    fernet = pytest.importorskip("cryptography.fernet")
+    key = fernet.Fernet.generate_key().decode()
+    path = tmp_path / "session"
+
+    SessionStore(str(path), key).save(COOKIES)
+
+    assert b"secret-token" not in path.read_bytes()
+    assert os.stat(path).st_mode & 0o077 == 0
+    assert [cookie["name"] for cookie in SessionStore(str(path), key).load()] == ["li_at"]
+    assert SessionStore(str(path), fernet.Fernet.generate_key().decode()).load() == []
+
+def test_clear_removes_stored_session(tmp_path):
+    """Test that an expired session is forgotten."""
+    store = SessionStore(str(tmp_path / "session"), key=None)
+    store.save(COOKIES)
+    store.clear()
+
+    assert store.load() == []
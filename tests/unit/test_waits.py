@@ -0,0 +1,67 @@
+import itertools
+from unittest.mock import Mock
+
+from selenium.common.exceptions import WebDriverException
+
+from llmops_datacollection.application.crawlers.waits import (
+    wait_for_stable_count,
+    wait_until,
+    wait_until_stable,
+    wait_stats,
+)
+
+def test_wait_until_returns_once_condition_holds():
+    """Test that a satisfied condition ends the wait without using the timeout."""
+    checks = iter([False, WebDriverException("stale"), True])
+
+    def predicate():
+        value = next(checks)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    result = wait_until("ready", predicate, timeout=5, poll=0.01)
+
+    assert result.satisfied
+    assert result.elapsed < 1
+
+def test_wait_until_times_out():
+    """Test that an unmet condition gives up at the timeout cap."""
+    result = wait_until("never", lambda: False, timeout=0.05, poll=0.01)
+
+    assert not result.satisfied
+    assert 0.05 <= result.elapsed < 1
+
+def test_wait_until_stable_waits_for_quiet_period():
+    """Test that stability is reached once the value stops changing."""
+    values = itertools.chain([None, 1, 2, 3], itertools.repeat(3))
+    result = wait_until_stable("growing", lambda: next(values), quiet_period=0.05, timeout=5, poll=0.01)
+
+    assert result.satisfied
+    assert 0.05 <= result.elapsed < 1
+
+def test_wait_until_stable_times_out_while_changing():
+    """Test that a value that never settles hits the timeout cap."""
+    counter = itertools.count()
+    result = wait_until_stable("busy", lambda: next(counter), quiet_period=0.05, timeout=0.1, poll=0.01)
+
+    assert not result.satisfied
+
+def test_stable_count_requires_minimum():
+    """Test that an empty element list never counts as settled."""
+    driver = Mock()
+    driver.find_elements.return_value = []
+
+    result = wait_for_stable_count(driver, "div.post", quiet_period=0.01, timeout=0.05, poll=0.01)
+
+    assert not result.satisfied
+
+def test_wait_stats_report_time_per_wait():
+    """Test that wait durations are totalled per wait name."""
+    wait_stats.reset()
+    wait_until("report", lambda: True)
+    wait_until("report", lambda: False, timeout=0.01, poll=0.01)
+
+    summary = wait_stats.summary()["report"]
+    assert summary["count"] == 2
+    assert summary["timeouts"] == 1
@@ -0,0 +1,73 @@
+import pytest
+from unittest.mock import Mock, patch
+from pymongo.errors import BulkWriteError
+
+from llmops_datacollection.domain.documents import ArticleDocument, UserDocument
+from llmops_datacollection.domain.exceptions import DatabaseError
+from llmops_datacollection.domain.writer import BulkWriter
+
+def _article(link: str) -> ArticleDocument:
+    author = UserDocument(first_name="Jane", last_name="Doe")
+    return ArticleDocument(
+        content={"Content": "text"},
+        platform="medium",
+        author_id=author.id,
+        author_full_name=author.full_name,
+        link=link,
+        title="Writer",
+    )
+
+@pytest.fixture
+def writer():
+    """Create a writer that only flushes on demand."""
+    writer = BulkWriter(batch_size=100, flush_interval=60, max_pending=100)
+    yield writer
+    writer.close()
+
+def test_writer_batches_documents(writer):
+    """Test that buffered documents are written together on flush."""
+    users = [UserDocument(first_name=f"Writer{i}", last_name="Batch") for i in range(5)]
+    futures = writer.submit_many(users)
+
+    assert writer.flush() == []
+    assert all(future.result() is True for future in futures)
+    assert len(UserDocument.bulk_find(last_name="Batch")) == 5
+
+def test_writer_flushes_when_batch_is_full():
+    """Test that reaching the batch size triggers a write without flushing."""
+    writer = BulkWriter(batch_size=2, flush_interval=60, max_pending=100)
+    try:
+        futures = writer.submit_many([UserDocument(first_name=f"Full{i}", last_name="Size") for i in range(2)])
+        assert all(future.result(timeout=5) is True for future in futures)
+    finally:
+        writer.close()
+
+def test_writer_skips_stored_links(writer):
+    """Test that documents whose link is already stored resolve to False."""
+    first = writer.submit(_article("https://medium.com/@jane/writer"))
+    writer.flush()
+    second = writer.submit(_article("https://medium.com/@jane/writer"))
+    writer.flush()
+
+    assert first.result() is True
+    assert second.result() is False
+    assert len(ArticleDocument.bulk_find(link="https://medium.com/@jane/writer")) == 1
+
+def test_writer_reports_failed_documents(writer):
+    """Test that per-document write errors reach the caller."""
+    users = [UserDocument(first_name=f"Failed{i}", last_name="Write") for i in range(2)]
+    error = BulkWriteError({
+        "writeErrors": [{"index": 1, "code": 121, "errmsg": "validation failed"}],
+        "upserted": [],
+    })
+    collection = Mock()
+    collection.bulk_write.side_effect = error
+
+    with patch('llmops_datacollection.domain.writer.connection.get_collection', return_value=collection):
+        futures = writer.submit_many(users)
+        failures = writer.flush()
+
+    assert futures[0].result() is True
+    with pytest.raises(DatabaseError):
+        futures[1].result()
+    assert [failure.document_id for failure in failures] == [str(users[1].id)]
@@ -0,0 +1 @@
+"""Micro-benchmarks for data collection hot paths."""
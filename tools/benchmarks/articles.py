@@ -0,0 +1,42 @@
+"""Benchmark main-content extraction against whole-page text on saved Medium pages."""
+
+import json
+import timeit
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from llmops_datacollection.application.utils.article import extract_sections, sections_to_text
+from llmops_datacollection.application.utils.html import parse_html
+
+FIXTURES_DIR = Path(__file__).parents[2] / "tests" / "fixtures" / "html"
+
+
+@click.command(help="Compare speed and stored size of whole-page text and extracted article sections.")
+@click.option("--fixtures", type=click.Path(exists=True, file_okay=False), default=str(FIXTURES_DIR))
+@click.option("--repeat", default=50, help="Extractions timed per strategy")
+def main(fixtures: str, repeat: int) -> None:
+    for path in sorted(Path(fixtures).glob("medium_*.html")):
+        html = path.read_text()
+        document = parse_html(html)
+        page_size = len(document.text())
+        sections = extract_sections(document) or []
+
+        strategies = {
+            "whole page": (lambda: parse_html(html).text(), page_size),
+            "sections": (
+                lambda: extract_sections(parse_html(html)),
+                len(json.dumps([section.model_dump(exclude_none=True) for section in sections])),
+            ),
+            "content": (lambda: sections_to_text(extract_sections(parse_html(html)) or []), len(sections_to_text(sections))),
+        }
+
+        logger.info(f"{path.stem}: {len(html) / 1024:.1f} KiB HTML, {len(sections)} sections")
+        for name, (strategy, size) in strategies.items():
+            seconds = min(timeit.repeat(strategy, number=repeat, repeat=3)) / repeat
+            logger.info(f"{name:>12}: {seconds * 1e3:7.2f} ms/page, {size:7d} characters stored")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark page load time and bandwidth per resource blocking profile."""
+
+import statistics
+
+import click
+from loguru import logger
+
+from llmops_datacollection.application.crawlers.base import BaseSeleniumCrawler
+from llmops_datacollection.application.crawlers.blocking import PageMetrics, page_metrics
+from llmops_datacollection.application.crawlers.waits import wait_for_network_idle
+from llmops_datacollection.settings import BlockingProfile, settings
+
+
+class ProfileProbe(BaseSeleniumCrawler):
+    """Loads pages in a browser launched with a given blocking profile."""
+
+    model = None
+
+    def __init__(self, profile: BlockingProfile) -> None:
+        super().__init__()
+        self._profile = profile
+
+    def blocking_profile(self) -> BlockingProfile:
+        return self._profile
+
+    def extract(self, link: str, **kwargs) -> PageMetrics | None:
+        self.driver.get(link)
+        wait_for_network_idle(self.driver)
+        return page_metrics(self.driver)
+
+
+def measure(profile: BlockingProfile, links: list[str], repeat: int) -> list[PageMetrics]:
+    """Load every link `repeat` times in a fresh, unpooled browser."""
+    probe = ProfileProbe(profile)
+    # Bypass the pool so each profile gets its own browser
+    probe.driver = probe._create_driver()
+    try:
+        results = [probe.extract(link) for _ in range(repeat) for link in links]
+    finally:
+        probe.driver.quit()
+    return [metrics for metrics in results if metrics is not None]
+
+
+@click.command(help="Compare page load time and bytes transferred across blocking profiles.")
+@click.argument("links", nargs=-1, required=True)
+@click.option("--profile", "profiles", multiple=True, help="Profiles to compare (default: all)")
+@click.option("--repeat", default=3, help="Loads per link and profile")
+def main(links: tuple[str, ...], profiles: tuple[str, ...], repeat: int) -> None:
+    for name in profiles or settings.BROWSER_BLOCKING_PROFILES:
+        results = measure(settings.BROWSER_BLOCKING_PROFILES[name], list(links), repeat)
+        if not results:
+            logger.warning(f"{name:>8}: no measurements")
+            continue
+
+        load_ms = [metrics.load_ms for metrics in results if metrics.load_ms is not None]
+        logger.info(
+            f"{name:>8}: {statistics.median(load_ms) if load_ms else float('nan'):8.0f} ms median load, "
+            f"{statistics.mean(metrics.transfer_bytes for metrics in results) / 1024:8.0f} KiB, "
+            f"{statistics.mean(metrics.resources for metrics in results):6.1f} resources per page"
+        )
+
+
+if __name__ == "__main__":
+    main()
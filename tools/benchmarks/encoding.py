@@ -0,0 +1,48 @@
+"""Benchmark preparing large repository documents for MongoDB insertion."""
+
+import timeit
+import uuid
+
+import click
+from loguru import logger
+
+from llmops_datacollection.domain.documents import RepositoryDocument
+from llmops_datacollection.infrastructure.db.mongo import connection
+
+
+def build_repository(files: int, file_bytes: int) -> RepositoryDocument:
+    """Build a repository document with `files` files of `file_bytes` characters."""
+    return RepositoryDocument(
+        content={f"src/module_{i}.py": "x" * file_bytes for i in range(files)},
+        platform="github",
+        author_id=uuid.uuid4(),
+        author_full_name="Benchmark User",
+        name="benchmark",
+        link="https://github.com/benchmark/benchmark",
+    )
+
+
+@click.command(help="Compare full-walk and known-field UUID encoding per document.")
+@click.option("--files", default=5000, help="Files in the repository document")
+@click.option("--file-bytes", default=2000, help="Characters per file")
+@click.option("--repeat", default=50, help="Encodings timed per strategy")
+def main(files: int, file_bytes: int, repeat: int) -> None:
+    document = build_repository(files, file_bytes)
+    mongo_doc = document.to_mongo()
+
+    strategies = {
+        "full walk": lambda: connection.prepare_document_for_insertion(mongo_doc),
+        "known fields": lambda: connection.prepare_document_for_insertion(
+            mongo_doc, RepositoryDocument._uuid_fields()
+        ),
+        "to_mongo + known fields": document._to_prepared_mongo,
+    }
+
+    logger.info(f"Repository document with {files} files of {file_bytes} characters")
+    for name, strategy in strategies.items():
+        seconds = min(timeit.repeat(strategy, number=repeat, repeat=3)) / repeat
+        logger.info(f"{name:>24}: {seconds * 1e6:10.1f} us/document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark import time of the package entry points."""
+
+import subprocess
+import sys
+
+import click
+from loguru import logger
+
+DEFAULT_MODULES = (
+    "llmops_datacollection.domain.documents",
+    "llmops_datacollection.application.crawlers.dispatcher",
+    "app",
+)
+
+
+def measure_import(module: str) -> list[tuple[str, int, int]]:
+    """Import `module` in a fresh interpreter and parse its -X importtime report.
+
+    Returns:
+        list[tuple[str, int, int]]: (module, self us, cumulative us) per import
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+@click.command(help="Report cumulative import time and the slowest imports per module.")
+@click.argument("modules", nargs=-1)
+@click.option("--top", default=10, help="Slowest imports listed per module")
+@click.option("--repeat", default=3, help="Fresh interpreters per module, the fastest is reported")
+def main(modules: tuple[str, ...], top: int, repeat: int) -> None:
+    for module in modules or DEFAULT_MODULES:
+        runs = [measure_import(module) for _ in range(repeat)]
+        timings = min(runs, key=lambda run: sum(self_us for _, self_us, _ in run))
+        total_us = sum(self_us for _, self_us, _ in timings)
+
+        logger.info(f"{module}: {total_us / 1000:.1f} ms")
+        for name, self_us, cumulative_us in sorted(timings, key=lambda t: t[1], reverse=True)[:top]:
+            logger.info(f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {name}")
+
+
+if __name__ == "__main__":
+    main()
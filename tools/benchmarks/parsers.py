@@ -0,0 +1,55 @@
+"""Benchmark HTML parser backends on saved crawler pages."""
+
+import timeit
+from pathlib import Path
+
+import click
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from llmops_datacollection.application.crawlers.linkedin import POST_SELECTOR
+from llmops_datacollection.application.crawlers.medium import MediumCrawler
+from llmops_datacollection.application.utils.html import installed_backends, parse_html
+
+FIXTURES_DIR = Path(__file__).parents[2] / "tests" / "fixtures" / "html"
+
+
+def extractions(backend: str) -> dict:
+    """What each crawler extracts from its fixture page, per backend."""
+    return {
+        "medium_article": lambda html: MediumCrawler._parse_article(parse_html(html, backend=backend)),
+        "linkedin_feed": lambda html: parse_html(html, only=POST_SELECTOR, backend=backend).texts(POST_SELECTOR),
+    }
+
+
+def soup_baseline() -> dict:
+    """Full BeautifulSoup parse, as the crawlers did before the parser layer."""
+    return {
+        "medium_article": lambda html: BeautifulSoup(html, "html.parser").get_text(),
+        "linkedin_feed": lambda html: [
+            element.get_text(strip=True)
+            for element in BeautifulSoup(html, "html.parser").select(POST_SELECTOR)
+        ],
+    }
+
+
+@click.command(help="Time parsing and extraction of saved pages with every installed backend.")
+@click.option("--fixtures", type=click.Path(exists=True, file_okay=False), default=str(FIXTURES_DIR))
+@click.option("--scale", default=10, help="Times each page is repeated, to mimic long pages")
+@click.option("--repeat", default=20, help="Parses timed per backend")
+def main(fixtures: str, scale: int, repeat: int) -> None:
+    strategies = {"soup (full)": soup_baseline()}
+    strategies.update({backend: extractions(backend) for backend in installed_backends()})
+
+    for path in sorted(Path(fixtures).glob("*.html")):
+        html = path.read_text() * scale
+        logger.info(f"{path.stem}: {len(html) / 1024:.0f} KiB")
+        for name, tasks in strategies.items():
+            if (task := tasks.get(path.stem)) is None:
+                continue
+            seconds = min(timeit.repeat(lambda: task(html), number=repeat, repeat=3)) / repeat
+            logger.info(f"{name:>14}: {seconds * 1e3:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()